@@ -8,19 +8,77 @@ import json
 import logging
 import numpy as np
 import aiosqlite
+import sqlite3
 import os
+import base64
+import re
 import hashlib
-import statistics
-from datetime import datetime
-from typing import Dict, Any, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+import math
+import time
+from datetime import datetime, timezone
+from operator import itemgetter
+from types import MappingProxyType
+from collections import Counter
+from typing import Dict, Any, Iterable, List, Mapping, Optional, Tuple
+from dataclasses import dataclass, asdict, field, replace
 
 # Import Unicode security
 from utils.unicode_security import unicode_analyzer
+from utils.compact_cache import CompactCache
+from utils.rolling_stats import RollingStats, TimeWindow
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Agent recommendations, best first, and the average virtue assessment an
+# agent must exceed for each of the first three
+RECOMMENDATIONS = ("strongly_approve", "approve", "review_required", "reject")
+RECOMMENDATION_THRESHOLDS = np.array([0.8, 0.6, 0.4])
+
+FORECASTS = ("stable", "neutral", "volatile")
+
+# Trend forecast bounds on consensus volatility (EW standard deviation) and
+# decline (slow minus fast EWMA) for stable and neutral; beyond either
+# neutral bound the outlook is volatile
+TREND_VOLATILITY = (0.1, 0.25)
+TREND_DECLINE = (0.05, 0.15)
+
+# Rolling analytics windows: name -> (seconds, slots)
+ANALYTICS_WINDOWS = {"1m": (60, 60), "1h": (3600, 60), "24h": (86400, 96)}
+
+# PII redaction applied before storage, in order: emails, phone numbers,
+# potential tokens (long alphanumeric strings)
+REDACTION_PATTERNS = (
+    (re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'), '[EMAIL_REDACTED]'),
+    (re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'), '[PHONE_REDACTED]'),
+    (re.compile(r'\b[A-Za-z0-9]{32,}\b'), '[TOKEN_REDACTED]')
+)
+
+# Keyword indicators: (keywords, score per matched keyword, base score)
+KEYWORD_LEXICONS = {
+    "compassion": (("help", "user", "accessible", "friendly", "care", "support", "inclusive"), 0.1, 0.5),
+    "integrity": (("secure", "honest", "reliable", "transparent", "authentic", "valid"), 0.1, 0.5),
+    "wisdom": (("understand", "learn", "analyze", "thoughtful", "careful", "consider"), 0.1, 0.5),
+    "courage": (("challenge", "improve", "innovate", "bold", "brave", "tackle"), 0.1, 0.5),
+    "security_risk": (("hack", "exploit", "vulnerability", "attack", "malicious", "unsafe"), 0.2, 0),
+    "accessibility_compassion": (("accessible", "inclusive", "disability", "screen reader", "keyboard"), 0.15, 0.6),
+    "performance_wisdom": (("optimize", "efficient", "fast", "performance", "scalable"), 0.12, 0.5)
+}
+
+# Indicator score by number of matched keywords, capped at 1.0
+KEYWORD_SCORES = {
+    name: [min(1.0, base + sum(step for _ in range(count))) for count in range(len(words) + 1)]
+    for name, (words, step, base) in KEYWORD_LEXICONS.items()
+}
+
+# Agent parameters a request may override, each clamped to [0, 1]
+OVERRIDABLE_FIELDS = ("influence", "reliability", "severity")
+
+# Page size bound for decision history queries
+MAX_QUERY_LIMIT = 500
+
+_SEARCH_TOKEN = re.compile(r"\w+")
+
+@dataclass(frozen=True, slots=True)
 class Agent:
     """Individual agent in the Aegis Council"""
     name: str
@@ -29,7 +87,236 @@ class Agent:
     reliability: float
     severity: float
     specialization: str
-    virtue_weights: Dict[str, float]
+    virtue_weights: Mapping[str, float]
+
+@dataclass(frozen=True, eq=False)
+class CouncilConfig:
+    """
+    Immutable, versioned snapshot of the council's agents
+    
+    Holds the agents together with the arrays scoring reads from them: an
+    agents x virtues weight matrix and influence and reliability vectors,
+    all read-only. Overrides derive a new snapshot that shares every
+    unchanged agent and the weight matrix with its parent.
+    """
+    version: str
+    agents: Mapping[str, Agent]
+    virtue_weight_matrix: np.ndarray = field(repr=False)
+    influence_vector: np.ndarray = field(repr=False)
+    reliability_vector: np.ndarray = field(repr=False)
+    
+    @classmethod
+    def build(cls, version: str, agents: Iterable[Agent], virtues: Iterable[str]) -> "CouncilConfig":
+        """Snapshot agents; virtues an agent does not weigh default to 0.25"""
+        agents = {
+            agent.name: replace(agent, virtue_weights=MappingProxyType(dict(agent.virtue_weights)))
+            for agent in agents
+        }
+        virtues = list(virtues)
+        weights = np.array([
+            [agent.virtue_weights.get(virtue, 0.25) for virtue in virtues]
+            for agent in agents.values()
+        ])
+        return cls(
+            version=version,
+            agents=MappingProxyType(agents),
+            virtue_weight_matrix=_read_only(weights),
+            influence_vector=_read_only(np.array([agent.influence for agent in agents.values()])),
+            reliability_vector=_read_only(np.array([agent.reliability for agent in agents.values()]))
+        )
+    
+    def with_overrides(self, overrides: Optional[Dict[str, Any]], version: Optional[str] = None) -> "CouncilConfig":
+        """
+        Derive a snapshot with agent parameters overridden
+        
+        Unknown agents and fields are ignored. Returns this snapshot when
+        nothing changes; otherwise the derived version defaults to this
+        version tagged with a digest of the effective overrides.
+        """
+        changes: Dict[str, Dict[str, float]] = {}
+        for agent_name, override_data in (overrides or {}).items():
+            agent = self.agents.get(agent_name)
+            if agent is None:
+                continue
+            agent_changes = {
+                name: max(0.0, min(1.0, override_data[name]))
+                for name in OVERRIDABLE_FIELDS
+                if name in override_data
+            }
+            agent_changes = {
+                name: value for name, value in agent_changes.items() if value != getattr(agent, name)
+            }
+            if agent_changes:
+                changes[agent_name] = agent_changes
+        
+        if not changes:
+            return self
+        
+        if version is None:
+            digest = hashlib.sha256(json.dumps(changes, sort_keys=True).encode()).hexdigest()[:8]
+            version = f"{self.version}+{digest}"
+        
+        agents = dict(self.agents)
+        influence = self.influence_vector.copy()
+        reliability = self.reliability_vector.copy()
+        for row, agent_name in enumerate(agents):
+            if agent_name in changes:
+                agents[agent_name] = replace(agents[agent_name], **changes[agent_name])
+                influence[row] = agents[agent_name].influence
+                reliability[row] = agents[agent_name].reliability
+        
+        return CouncilConfig(
+            version=version,
+            agents=MappingProxyType(agents),
+            virtue_weight_matrix=self.virtue_weight_matrix,
+            influence_vector=_read_only(influence),
+            reliability_vector=_read_only(reliability)
+        )
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    array.setflags(write=False)
+    return array
+
+class CouncilAnalytics:
+    """
+    Incremental council analytics, updated once per decision
+    
+    Sliding 1m/1h/24h windows sum decision counts, consensus, compliance
+    and the decision mix overall and per agent. A ring buffer of recent
+    consensus values keeps the fast EWMA; a slow EWMA and an exponentially
+    weighted variance sit beside it. Their spread and the variance give the
+    trend forecast. Updates and reads never walk past decisions.
+    """
+    
+    def __init__(
+        self,
+        history_size: int = 1000,
+        fast_alpha: float = 0.2,
+        slow_alpha: float = 0.02,
+        min_samples: int = 20
+    ):
+        self.recent = RollingStats(
+            maxlen=history_size,
+            value_of=itemgetter(0),
+            category_of=itemgetter(1),
+            ewma_alpha=fast_alpha
+        )
+        self.windows = {
+            name: TimeWindow(seconds, slots) for name, (seconds, slots) in ANALYTICS_WINDOWS.items()
+        }
+        self.fast_alpha = fast_alpha
+        self.slow_alpha = slow_alpha
+        self.min_samples = min_samples
+        self.slow_ewma: Optional[float] = None
+        self.variance = 0.0
+        self.lifetime_decisions = 0
+    
+    def record(self, decision: Dict[str, Any], timestamp: Optional[float] = None) -> Optional[str]:
+        """
+        Fold a decision into the analytics
+        
+        Returns the trend forecast including this decision, or None while
+        fewer than ``min_samples`` deliberated decisions have been seen.
+        ``timestamp`` is epoch seconds and defaults to now.
+        """
+        return self.record_batch([decision], timestamp)[0]
+    
+    def record_batch(self, decisions: List[Dict[str, Any]], timestamp: Optional[float] = None) -> List[Optional[str]]:
+        """
+        Fold decisions made at the same time into the analytics, in order
+        
+        The trend advances one decision at a time, so each forecast equals
+        what ``record`` would return; window sums are added once per batch.
+        """
+        fields: Counter = Counter()
+        forecasts = []
+        for decision in decisions:
+            verdict = decision["override_decision"]
+            fields["decisions"] += 1
+            fields[f"decision:{verdict}"] += 1
+            self.lifetime_decisions += 1
+            
+            votes = decision.get("agent_votes")
+            if votes is None:
+                # Blocked before deliberation: counted, but outside the consensus trend
+                forecasts.append(None)
+                continue
+            
+            consensus = decision["consensus_strength"]
+            fields["deliberated"] += 1
+            fields["consensus"] += consensus
+            fields["compliant"] += 1 if decision["ethical_compliance"] else 0
+            for agent_name, vote in votes.items():
+                fields[f"agent:{agent_name}:{vote['recommendation']}"] += 1
+            
+            # Exponentially weighted variance around the fast mean, updated before it moves
+            if self.recent.ewma is not None:
+                delta = consensus - self.recent.ewma
+                self.variance = (1 - self.fast_alpha) * (self.variance + self.fast_alpha * delta * delta)
+            self.recent.append((consensus, verdict), timestamp)
+            self.slow_ewma = consensus if self.slow_ewma is None else self.slow_ewma + self.slow_alpha * (consensus - self.slow_ewma)
+            forecasts.append(self.forecast())
+        
+        if fields:
+            for window in self.windows.values():
+                window.add(fields, timestamp)
+        return forecasts
+    
+    def forecast(self) -> Optional[str]:
+        """Outlook from recent consensus volatility and decline"""
+        if self.recent.lifetime_count < self.min_samples:
+            return None
+        volatility = math.sqrt(self.variance)
+        decline = self.slow_ewma - self.recent.ewma
+        for forecast, volatility_bound, decline_bound in zip(FORECASTS, TREND_VOLATILITY, TREND_DECLINE):
+            if volatility <= volatility_bound and decline <= decline_bound:
+                return forecast
+        return FORECASTS[-1]
+    
+    @staticmethod
+    def epoch_of(timestamp: str) -> float:
+        """Epoch seconds of a stored ISO timestamp; naive timestamps are UTC"""
+        parsed = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.timestamp()
+    
+    def get_stats(self, now: Optional[float] = None) -> Dict[str, Any]:
+        """Windowed and trend statistics (constant time, safe to poll)"""
+        now = time.time() if now is None else now
+        windows = {}
+        for name, window in self.windows.items():
+            totals = window.get_totals(now)
+            deliberated = totals.get("deliberated", 0)
+            decision_mix: Dict[str, int] = {}
+            agent_mix: Dict[str, Dict[str, int]] = {}
+            for field, count in totals.items():
+                kind, _, key = field.partition(":")
+                if kind == "decision":
+                    decision_mix[key] = count
+                elif kind == "agent":
+                    agent_name, _, recommendation = key.rpartition(":")
+                    agent_mix.setdefault(agent_name, {})[recommendation] = count
+            windows[name] = {
+                "decisions": totals.get("decisions", 0),
+                "per_minute": totals.get("decisions", 0) * 60 / window.window_seconds,
+                "average_consensus": totals.get("consensus", 0.0) / deliberated if deliberated else 0.0,
+                "compliance_rate": totals.get("compliant", 0) / deliberated if deliberated else 0.0,
+                "decision_mix": decision_mix,
+                "agent_mix": agent_mix
+            }
+        
+        return {
+            "lifetime_decisions": self.lifetime_decisions,
+            "recent_decisions": len(self.recent),
+            "average_consensus": self.recent.mean,
+            "consensus_ewma": self.recent.ewma if self.recent.ewma is not None else 0.0,
+            "consensus_slow_ewma": self.slow_ewma if self.slow_ewma is not None else 0.0,
+            "consensus_volatility": math.sqrt(self.variance),
+            "recent_decision_mix": dict(self.recent.categories),
+            "trend_forecast": self.forecast(),
+            "windows": windows
+        }
 
 @dataclass
 class CouncilDecision:
@@ -50,12 +337,33 @@ class AegisCouncil:
     Implements virtue-based reasoning with multiple specialized agents
     """
     
-    def __init__(self, db_path: str = "backend/data/aegis.db"):
+    def __init__(
+        self,
+        db_path: str = "backend/data/aegis.db",
+        cache_size: int = 500,
+        cache_max_bytes: int = 16 * 1024 * 1024,
+        cache_ttl_seconds: Optional[float] = 3600.0,
+        persist_cache_hits: bool = True
+    ):
         self.db_path = db_path
-        self.agents: Dict[str, Agent] = {}
+        self.config: Optional[CouncilConfig] = None
+        self._config_generation = 0
+        # Decisions by (config version, input hash); a derived config's
+        # version already encodes the effective overrides
+        self.decision_cache = CompactCache(
+            max_entries=cache_size,
+            max_bytes=cache_max_bytes,
+            ttl_seconds=cache_ttl_seconds
+        )
+        # Whether decisions answered from the cache are stored as new records
+        self.persist_cache_hits = persist_cache_hits
+        self.decision_lookups = {"cached": 0, "computed": 0}
         self.decision_history: List[Dict[str, Any]] = []
+        # Rolling windows and consensus trend behind temporal forecasts and stats
+        self.analytics = CouncilAnalytics()
         self.is_initialized = False
         self.conn: Optional[aiosqlite.Connection] = None
+        self.fts_enabled = False
         
         # Virtue definitions
         self.virtues = {
@@ -107,7 +415,10 @@ class AegisCouncil:
                 decision_data TEXT NOT NULL,
                 timestamp TEXT NOT NULL,
                 consensus_strength REAL NOT NULL,
-                ethical_compliance INTEGER NOT NULL
+                ethical_compliance INTEGER NOT NULL,
+                decision TEXT,
+                reasoning TEXT,
+                config_version TEXT
             )
         """)
         
@@ -122,24 +433,102 @@ class AegisCouncil:
             )
         """)
         
-        # Add performance indices
-        await self.conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_council_decisions_timestamp 
-            ON council_decisions (timestamp DESC)
-        """)
+        await self._migrate_decision_columns()
+        
+        # Add performance indices; every query pages newest first by (timestamp, id)
+        await self.conn.execute("DROP INDEX IF EXISTS idx_council_decisions_timestamp")
+        for name, columns in (
+            ("idx_council_decisions_time", "timestamp DESC, id DESC"),
+            ("idx_council_decisions_decision_time", "decision, timestamp DESC, id DESC"),
+            ("idx_council_decisions_compliance_time", "ethical_compliance, timestamp DESC, id DESC")
+        ):
+            await self.conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON council_decisions ({columns})")
         
         await self.conn.execute("""
             CREATE INDEX IF NOT EXISTS idx_agent_votes_decision_id 
             ON agent_votes (decision_id)
         """)
         
+        await self._create_search_index()
+        
         await self.conn.commit()
         logger.info("📊 Aegis Council database tables created")
     
+    async def _migrate_decision_columns(self):
+        """Add the typed decision columns to older databases and backfill them"""
+        async with self.conn.execute("PRAGMA table_info(council_decisions)") as cursor:
+            existing = {row[1] async for row in cursor}
+        
+        added = [column for column in ("decision", "reasoning", "config_version") if column not in existing]
+        for column in added:
+            await self.conn.execute(f"ALTER TABLE council_decisions ADD COLUMN {column} TEXT")
+        
+        if added:
+            await self.conn.execute("""
+                UPDATE council_decisions SET
+                    decision = json_extract(decision_data, '$.override_decision'),
+                    reasoning = json_extract(decision_data, '$.reasoning'),
+                    config_version = json_extract(decision_data, '$.config_version')
+                WHERE decision IS NULL
+            """)
+            logger.info(f"📊 Added decision columns: {', '.join(added)}")
+    
+    async def _create_search_index(self):
+        """Full-text index over redacted inputs and reasoning, kept in sync by triggers"""
+        async with self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'council_decisions_fts'"
+        ) as cursor:
+            exists = await cursor.fetchone() is not None
+        
+        try:
+            await self.conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS council_decisions_fts USING fts5(
+                    input_text_redacted, reasoning,
+                    content='council_decisions', content_rowid='rowid',
+                    tokenize='porter unicode61'
+                )
+            """)
+        except sqlite3.OperationalError as e:
+            # SQLite built without FTS5: text queries fall back to LIKE scans
+            logger.warning(f"⚠️ Full-text search unavailable: {e}")
+            self.fts_enabled = False
+            return
+        
+        await self.conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS council_decisions_fts_insert AFTER INSERT ON council_decisions BEGIN
+                INSERT INTO council_decisions_fts (rowid, input_text_redacted, reasoning)
+                VALUES (new.rowid, new.input_text_redacted, new.reasoning);
+            END
+        """)
+        await self.conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS council_decisions_fts_delete AFTER DELETE ON council_decisions BEGIN
+                INSERT INTO council_decisions_fts (council_decisions_fts, rowid, input_text_redacted, reasoning)
+                VALUES ('delete', old.rowid, old.input_text_redacted, old.reasoning);
+            END
+        """)
+        await self.conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS council_decisions_fts_update AFTER UPDATE ON council_decisions BEGIN
+                INSERT INTO council_decisions_fts (council_decisions_fts, rowid, input_text_redacted, reasoning)
+                VALUES ('delete', old.rowid, old.input_text_redacted, old.reasoning);
+                INSERT INTO council_decisions_fts (rowid, input_text_redacted, reasoning)
+                VALUES (new.rowid, new.input_text_redacted, new.reasoning);
+            END
+        """)
+        
+        if not exists:
+            # Index decisions stored before the search index existed
+            await self.conn.execute("INSERT INTO council_decisions_fts (council_decisions_fts) VALUES ('rebuild')")
+        self.fts_enabled = True
+    
+    @property
+    def agents(self) -> Mapping[str, Agent]:
+        """Agents of the current configuration snapshot"""
+        return self.config.agents if self.config else MappingProxyType({})
+    
     def _initialize_agents(self):
         """Initialize the council agents"""
-        self.agents = {
-            "VirtueAgent": Agent(
+        agents = [
+            Agent(
                 name="VirtueAgent",
                 role="Virtue Ethics Specialist",
                 influence=0.9,
@@ -153,7 +542,7 @@ class AegisCouncil:
                     "courage": 0.2
                 }
             ),
-            "SecurityAgent": Agent(
+            Agent(
                 name="SecurityAgent", 
                 role="Security and Safety Specialist",
                 influence=0.85,
@@ -167,7 +556,7 @@ class AegisCouncil:
                     "compassion": 0.1
                 }
             ),
-            "AccessibilityAgent": Agent(
+            Agent(
                 name="AccessibilityAgent",
                 role="Accessibility and Inclusion Specialist", 
                 influence=0.8,
@@ -181,7 +570,7 @@ class AegisCouncil:
                     "courage": 0.1
                 }
             ),
-            "PerformanceAgent": Agent(
+            Agent(
                 name="PerformanceAgent",
                 role="Performance and Efficiency Specialist",
                 influence=0.75,
@@ -195,7 +584,7 @@ class AegisCouncil:
                     "compassion": 0.1
                 }
             ),
-            "MetaJudgeAgent": Agent(
+            Agent(
                 name="MetaJudgeAgent",
                 role="Meta-reasoning and Final Arbitration",
                 influence=0.95,
@@ -209,10 +598,28 @@ class AegisCouncil:
                     "courage": 0.15
                 }
             )
-        }
+        ]
         
+        self._config_generation += 1
+        self.config = CouncilConfig.build(str(self._config_generation), agents, self.virtues.keys())
         logger.info(f"👥 Initialized {len(self.agents)} council agents")
     
+    def update_agents(self, updates: Dict[str, Any]) -> str:
+        """
+        Publish a new base configuration with agent parameters changed
+        
+        Takes the same shape as per-request overrides. In-flight convenes
+        keep the snapshot they started with. Returns the active version.
+        """
+        config = self.config.with_overrides(updates, version=str(self._config_generation + 1))
+        if config is not self.config:
+            self._config_generation += 1
+            self.config = config
+            # Entries for earlier versions can no longer be hit
+            self.decision_cache.clear()
+            logger.info(f"👥 Council configuration updated to version {config.version}")
+        return self.config.version
+    
     async def convene(
         self, 
         input_text: str, 
@@ -222,157 +629,375 @@ class AegisCouncil:
         Convene the Aegis Council for ethical decision making
         """
         try:
-            # Unicode security check
-            unicode_threat = unicode_analyzer.detect_unicode_threat(input_text)
-            if unicode_threat["threat_level"] == "high":
-                logger.warning(f"🚨 Unicode threat detected in council input: {unicode_threat}")
-                return {
-                    "override_decision": "blocked",
-                    "virtue_profile": {virtue: 0.0 for virtue in self.virtues.keys()},
-                    "consensus_strength": 0.0,
-                    "ethical_compliance": False,
-                    "reasoning": "Input blocked due to Unicode security threat",
-                    "threat_analysis": unicode_threat
-                }
-            
             logger.info(f"🏛️ Convening Aegis Council for: {input_text[:50]}...")
+            decision = (await self.convene_batch([input_text], overrides))[0]
             
-            # Apply agent overrides if provided
-            if overrides:
-                self._apply_agent_overrides(overrides)
+            if "decision_id" in decision:
+                logger.info(f"⚖️ [{decision['decision_id']}] Council decision: {decision['override_decision']} (consensus: {decision['consensus_strength']:.2f})")
+            return decision
             
-            # Collect agent votes
-            agent_votes = {}
-            virtue_scores = {}
+        except Exception as e:
+            logger.error(f"❌ Council convening failed: {e}")
+            raise
+    
+    async def convene_batch(
+        self, 
+        input_texts: List[str], 
+        overrides: Dict[str, Any] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Convene the Aegis Council on several inputs at once
+        
+        Inputs already decided under the same configuration are answered
+        from the decision cache with a fresh timestamp, and repeats within
+        the batch are decided once. The rest are scored together through
+        the council matrices. New records are stored in one transaction.
+        Each decision is identical to what ``convene`` returns for the same
+        input (apart from its id and timestamp). Once the council has a
+        trend history, ``temporal_forecast`` follows the running consensus
+        trend, which advances one decision at a time in input order.
+        """
+        try:
+            # Resolve this request's agent snapshot; overrides never touch the shared one
+            config = self.config.with_overrides(overrides)
+            timestamp = datetime.utcnow().isoformat() + "Z"  # Proper UTC timestamp
             
-            for agent_name, agent in self.agents.items():
-                vote = await self._get_agent_vote(agent, input_text)
-                agent_votes[agent_name] = vote
+            decisions: List[Optional[Dict[str, Any]]] = [None] * len(input_texts)
+            keys = [self._decision_key(input_text, config) for input_text in input_texts]
+            first_index: Dict[str, int] = {}
+            reused: List[int] = []
+            scored: List[int] = []
             
-            # Calculate virtue scores with proper weighted normalization
-            for virtue in self.virtues.keys():
-                weighted_sum = 0.0
-                total_virtue_weight = 0.0
+            for index, (input_text, key) in enumerate(zip(input_texts, keys)):
+                if key in first_index:
+                    reused.append(index)
+                    continue
+                first_index[key] = index
                 
-                for agent_name, agent in self.agents.items():
-                    vote = agent_votes[agent_name]
-                    virtue_weight = agent.virtue_weights.get(virtue, 0.25)
-                    agent_weight = virtue_weight * agent.influence * agent.reliability
-                    
-                    weighted_sum += vote["virtue_assessment"].get(virtue, 0.5) * agent_weight
-                    total_virtue_weight += agent_weight
+                cached = self.decision_cache.get(key)
+                if cached is not None:
+                    decisions[index] = cached
+                    reused.append(index)
+                    continue
                 
-                virtue_scores[virtue] = weighted_sum / total_virtue_weight if total_virtue_weight > 0 else 0.5
+                # Unicode security check
+                unicode_threat = self._detect_unicode_threat(input_text)
+                if unicode_threat is not None and unicode_threat["threat_level"] == "high":
+                    logger.warning(f"🚨 Unicode threat detected in council input: {unicode_threat}")
+                    decisions[index] = {
+                        "override_decision": "blocked",
+                        "virtue_profile": {virtue: 0.0 for virtue in self.virtues.keys()},
+                        "consensus_strength": 0.0,
+                        "ethical_compliance": False,
+                        "reasoning": "Input blocked due to Unicode security threat",
+                        "threat_analysis": unicode_threat,
+                        "config_version": config.version
+                    }
+                    self.decision_cache.put(key, decisions[index])
+                else:
+                    scored.append(index)
             
-            # Calculate consensus strength
-            consensus_strength = self._calculate_consensus(agent_votes)
+            fresh_payloads: Dict[int, List[str]] = {}
+            if scored:
+                # Scoring reads only the immutable snapshot, so it runs off the event loop
+                scored_decisions, vote_payloads = await asyncio.get_running_loop().run_in_executor(
+                    None, self._score_inputs, [input_texts[index] for index in scored], timestamp, config, scored
+                )
+                for index, decision, payloads in zip(scored, scored_decisions, vote_payloads):
+                    decisions[index] = decision
+                    fresh_payloads[index] = payloads
             
-            # Determine final decision
-            decision_result = self._make_final_decision(agent_votes, virtue_scores, consensus_strength)
+            for index in reused:
+                decision = decisions[index]
+                if decision is None:
+                    # Repeat of an input decided earlier in this batch
+                    decision = decisions[index] = json.loads(json.dumps(decisions[first_index[keys[index]]]))
+                if "decision_id" in decision:
+                    decision["timestamp"] = timestamp
+                    if self.persist_cache_hits:
+                        decision["decision_id"] = self._decision_id(input_texts[index], timestamp, index)
             
-            # Create decision record
-            decision_id = hashlib.sha256(f"{input_text}{datetime.utcnow().isoformat()}".encode()).hexdigest()[:16]
-            decision = {
-                "decision_id": decision_id,
-                "override_decision": decision_result["decision"],
-                "scores": list(virtue_scores.items()),
-                "virtue_profile": virtue_scores,
-                "temporal_forecast": decision_result["forecast"],
-                "consensus_strength": consensus_strength,
-                "ethical_compliance": decision_result["ethical_compliance"],
-                "reasoning": decision_result["reasoning"],
-                "dissenting_opinions": decision_result["dissenting_opinions"],
-                "agent_votes": agent_votes,
-                "timestamp": datetime.utcnow().isoformat() + "Z"  # Proper UTC timestamp
-            }
+            # Fold decisions into the running trend in input order, so a batch
+            # forecasts exactly like the same inputs convened one by one
+            for decision, forecast in zip(decisions, self.analytics.record_batch(decisions)):
+                if forecast is not None:
+                    decision["temporal_forecast"] = forecast
             
-            # Store decision
-            await self._store_decision(self._redact_input(input_text), decision)
+            records: List[Tuple[str, Dict[str, Any], str, List[str]]] = []
+            for index, decision in enumerate(decisions):
+                if index in fresh_payloads:
+                    payloads = fresh_payloads[index]
+                    decision_data = self._serialize_decision(decision, payloads)
+                    self.decision_cache.put_serialized(keys[index], decision_data.encode())
+                    records.append((self._redact_input(input_texts[index]), decision, decision_data, payloads))
+                elif self.persist_cache_hits and "decision_id" in decision:
+                    # Blocked inputs are never stored
+                    records.append((
+                        self._redact_input(input_texts[index]),
+                        decision,
+                        json.dumps(decision),
+                        [json.dumps(vote) for vote in decision["agent_votes"].values()]
+                    ))
             
-            logger.info(f"⚖️ [{decision_id}] Council decision: {decision['override_decision']} (consensus: {consensus_strength:.2f})")
-            return decision
+            self.decision_lookups["cached"] += len(reused)
+            self.decision_lookups["computed"] += len(input_texts) - len(reused)
+            
+            # Store decisions
+            if records:
+                await self._store_decisions(records)
+            
+            return decisions
             
         except Exception as e:
-            logger.error(f"❌ Council convening failed: {e}")
+            logger.error(f"❌ Council batch convening failed: {e}")
             raise
     
-    async def _get_agent_vote(self, agent: Agent, input_text: str) -> Dict[str, Any]:
-        """Get vote from individual agent"""
-        try:
-            # Analyze input based on agent specialization
-            analysis = self._analyze_by_specialization(input_text, agent.specialization)
-            
-            # Calculate virtue assessment
-            virtue_assessment = {}
-            for virtue in self.virtues.keys():
-                base_score = analysis.get(f"{virtue}_score", 0.5)
-                agent_weight = agent.virtue_weights.get(virtue, 0.25)
-                virtue_assessment[virtue] = min(1.0, base_score * agent_weight * agent.reliability)
-            
-            # Determine agent recommendation
-            avg_virtue_score = np.mean(list(virtue_assessment.values()))
-            
-            if avg_virtue_score > 0.8:
-                recommendation = "strongly_approve"
-            elif avg_virtue_score > 0.6:
-                recommendation = "approve"
-            elif avg_virtue_score > 0.4:
-                recommendation = "review_required"
-            else:
-                recommendation = "reject"
-            
-            vote = {
-                "agent_name": agent.name,
-                "recommendation": recommendation,
-                "virtue_assessment": virtue_assessment,
-                "confidence": agent.reliability,
-                "reasoning": self._generate_agent_reasoning(agent, analysis, virtue_assessment),
-                "specialization_analysis": analysis
-            }
-            
-            return vote
+    def _decision_key(self, input_text: str, config: CouncilConfig) -> str:
+        """Cache key of a decision: configuration version and input hash"""
+        return f"{config.version}:{hashlib.sha256(input_text.encode()).hexdigest()}"
+    
+    def _decision_id(self, input_text: str, timestamp: str, position: int) -> str:
+        """Id of a decision record; the batch position keeps ids in one batch distinct"""
+        return hashlib.sha256(f"{input_text}{timestamp}{position}".encode()).hexdigest()[:16]
+    
+    def _detect_unicode_threat(self, input_text: str) -> Optional[Dict[str, Any]]:
+        """Run the Unicode threat analysis, or return None for plain ASCII input"""
+        # No ASCII code point falls in a dangerous range or has a confusable name
+        if input_text.isascii():
+            return None
+        return unicode_analyzer.detect_unicode_threat(input_text)
+    
+    def _score_inputs(
+        self, 
+        input_texts: List[str], 
+        timestamp: str,
+        config: CouncilConfig,
+        positions: List[int]
+    ) -> Tuple[List[Dict[str, Any]], List[List[str]]]:
+        """
+        Score a batch of inputs through the council matrices
+        
+        ``positions`` are the inputs' places in the convened batch, used
+        for decision ids.
+        An agent's vote depends only on its specialization analysis, so each
+        distinct analysis is voted on and serialized once and the decisions
+        sharing it reuse that vote record. Returns the decisions and, for
+        each, the JSON payloads of its votes in council order.
+        """
+        virtues = list(self.virtues.keys())
+        agents = list(config.agents.values())
+        indicators = [self._score_indicators(input_text.lower()) for input_text in input_texts]
+        
+        # Per agent: distinct analyses, the input first showing each, and
+        # which distinct analysis every input maps to
+        distinct_analyses: List[List[Dict[str, Any]]] = []
+        first_rows: List[List[int]] = []
+        analysis_index: List[List[int]] = []
+        for agent in agents:
+            seen: Dict[Tuple, int] = {}
+            analyses, rows, index = [], [], []
+            for row, row_indicators in enumerate(indicators):
+                analysis = self._analyze_by_specialization(row_indicators, agent.specialization)
+                key = tuple(analysis.items())
+                position = seen.get(key)
+                if position is None:
+                    position = seen[key] = len(analyses)
+                    analyses.append(analysis)
+                    rows.append(row)
+                index.append(position)
+            distinct_analyses.append(analyses)
+            first_rows.append(rows)
+            analysis_index.append(index)
+        
+        # inputs x agents x virtues base scores
+        base_scores = np.stack([
+            np.array([[analysis.get(f"{virtue}_score", 0.5) for virtue in virtues] for analysis in analyses])[index]
+            for analyses, index in zip(distinct_analyses, analysis_index)
+        ], axis=1) if input_texts else np.zeros((0, len(agents), len(virtues)))
+        
+        council = self._score_council(base_scores, config)
+        virtue_assessments = council["virtue_assessments"]
+        average_assessments = council["average_assessments"]
+        recommendations = council["recommendations"]
+        
+        # Vote records, payloads and dissent lines per distinct analysis
+        votes, payloads, dissents, vote_codes = [], [], [], []
+        for column, agent in enumerate(agents):
+            agent_votes, agent_payloads, agent_dissents, agent_codes = [], [], [], []
+            for analysis, row in zip(distinct_analyses[column], first_rows[column]):
+                virtue_assessment = dict(zip(virtues, virtue_assessments[row, column].tolist()))
+                code = int(recommendations[row, column])
+                vote = {
+                    "agent_name": agent.name,
+                    "recommendation": RECOMMENDATIONS[code],
+                    "virtue_assessment": virtue_assessment,
+                    "confidence": agent.reliability,
+                    "reasoning": self._generate_agent_reasoning(
+                        agent, analysis, virtue_assessment, float(average_assessments[row, column])
+                    ),
+                    "specialization_analysis": analysis
+                }
+                agent_votes.append(vote)
+                agent_payloads.append(json.dumps(vote))
+                agent_dissents.append(f"{agent.name}: {vote['reasoning']}")
+                agent_codes.append(code)
+            votes.append(agent_votes)
+            payloads.append(agent_payloads)
+            dissents.append(agent_dissents)
+            vote_codes.append(agent_codes)
+        
+        virtue_profiles = council["virtue_scores"].tolist()
+        consensus_strengths = council["consensus_strength"].tolist()
+        majority_codes = council["decision"].tolist()
+        overall_virtues = council["overall_virtue"].tolist()
+        forecasts = council["forecast"].tolist()
+        compliance = council["ethical_compliance"].tolist()
+        
+        decisions, decision_payloads = [], []
+        for row, (input_text, position, analysis_positions) in enumerate(
+            zip(input_texts, positions, zip(*analysis_index))
+        ):
+            virtue_scores = dict(zip(virtues, virtue_profiles[row]))
+            majority_code = majority_codes[row]
+            majority_decision = RECOMMENDATIONS[majority_code]
+            consensus_strength = consensus_strengths[row]
             
-        except Exception as e:
-            logger.error(f"❌ Agent vote failed for {agent.name}: {e}")
-            return {
-                "agent_name": agent.name,
-                "recommendation": "abstain",
-                "virtue_assessment": {virtue: 0.5 for virtue in self.virtues.keys()},
-                "confidence": 0.0,
-                "reasoning": f"Vote failed: {str(e)}",
-                "specialization_analysis": {}
-            }
+            # Create decision record
+            decisions.append({
+                "decision_id": self._decision_id(input_text, timestamp, position),
+                "override_decision": majority_decision,
+                "scores": list(virtue_scores.items()),
+                "virtue_profile": virtue_scores,
+                "temporal_forecast": FORECASTS[forecasts[row]],
+                "consensus_strength": consensus_strength,
+                "ethical_compliance": compliance[row],
+                "reasoning": self._generate_decision_reasoning(
+                    majority_decision, virtue_scores, consensus_strength, overall_virtues[row]
+                ),
+                "dissenting_opinions": [
+                    dissents[column][analysis]
+                    for column, analysis in enumerate(analysis_positions)
+                    if vote_codes[column][analysis] != majority_code
+                ],
+                "config_version": config.version,
+                "agent_votes": {
+                    agent.name: votes[column][analysis]
+                    for column, (agent, analysis) in enumerate(zip(agents, analysis_positions))
+                },
+                "timestamp": timestamp
+            })
+            decision_payloads.append([payloads[column][analysis] for column, analysis in enumerate(analysis_positions)])
+        
+        return decisions, decision_payloads
     
-    def _analyze_by_specialization(self, input_text: str, specialization: str) -> Dict[str, Any]:
-        """Analyze input based on agent specialization"""
-        text_lower = input_text.lower()
+    def _score_council(self, base_scores: np.ndarray, config: CouncilConfig) -> Dict[str, np.ndarray]:
+        """
+        Turn inputs x agents x virtues base scores into council outcomes
+        
+        Reductions run over the agent and virtue axes in council order, so
+        every input scores the same whatever batch it arrives in.
+        """
+        n_agents = base_scores.shape[1]
+        weights = config.virtue_weight_matrix
+        influence = config.influence_vector
+        reliability = config.reliability_vector
+        
+        # Per-agent virtue assessments and recommendations
+        virtue_assessments = np.minimum(1.0, base_scores * weights * reliability[:, None])
+        average_assessments = virtue_assessments.mean(axis=2)
+        recommendations = (average_assessments[..., None] <= RECOMMENDATION_THRESHOLDS).sum(axis=2)
         
+        # Influence- and reliability-weighted virtue profile
+        agent_weights = weights * influence[:, None] * reliability[:, None]
+        total_weights = agent_weights.sum(axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            virtue_scores = np.where(
+                total_weights > 0,
+                (virtue_assessments * agent_weights).sum(axis=1) / total_weights,
+                0.5
+            )
+        
+        # Votes per recommendation and the first agent casting each
+        votes = recommendations[..., None] == np.arange(len(RECOMMENDATIONS))
+        counts = votes.sum(axis=1)
+        first_voter = np.where(votes.any(axis=1), votes.argmax(axis=1), n_agents)
+        
+        # Majority decision: most votes, earliest voter breaks ties
+        decision = (counts * (n_agents + 1) - first_voter).argmax(axis=1)
+        
+        # Consensus majority: ties go to the highest reliability x influence
+        # support, then to the earliest voter
+        support = (votes * (reliability * influence)[:, None]).sum(axis=1)
+        majority = counts == counts.max(axis=1, keepdims=True)
+        best_support = np.where(majority, support, -np.inf).max(axis=1, keepdims=True)
+        tied = majority & (support == best_support)
+        consensus_choice = np.where(tied, first_voter, n_agents + 1).argmin(axis=1)
+        
+        total_reliability = reliability.sum()
+        agreeing = (reliability * (recommendations == consensus_choice[:, None])).sum(axis=1)
+        consensus_strength = agreeing / total_reliability if total_reliability > 0 else np.zeros(len(base_scores))
+        
+        # Overall virtue is an exact mean, matching statistics.fmean
+        overall_virtue = np.array([math.fsum(row) for row in virtue_scores.tolist()]) / virtue_scores.shape[1]
+        forecast = np.select(
+            [(consensus_strength > 0.85) & (overall_virtue > 0.8), (consensus_strength > 0.6) & (overall_virtue > 0.6)],
+            [0, 1],
+            2
+        )
+        ethical_compliance = (overall_virtue > 0.7) & (consensus_strength > 0.6)
+        
+        return {
+            "virtue_assessments": virtue_assessments,
+            "average_assessments": average_assessments,
+            "recommendations": recommendations,
+            "virtue_scores": virtue_scores,
+            "consensus_strength": consensus_strength,
+            "decision": decision,
+            "overall_virtue": overall_virtue,
+            "forecast": forecast,
+            "ethical_compliance": ethical_compliance
+        }
+    
+    def _score_indicators(self, text_lower: str) -> Dict[str, float]:
+        """Keyword indicators shared by all specializations"""
+        contains = text_lower.__contains__
+        indicators = {
+            name: KEYWORD_SCORES[name][sum(map(contains, words))]
+            for name, (words, _, _) in KEYWORD_LEXICONS.items()
+        }
+        indicators["mentions_security"] = "security" in text_lower
+        indicators["mentions_accessible"] = "accessible" in text_lower
+        indicators["mentions_optimize"] = "optimize" in text_lower
+        return indicators
+    
+    def _analyze_by_specialization(self, indicators: Dict[str, float], specialization: str) -> Dict[str, Any]:
+        """Analyze input based on agent specialization"""
         if specialization == "virtue_ethics":
             return {
-                "compassion_score": self._score_compassion(text_lower),
-                "integrity_score": self._score_integrity(text_lower),
-                "wisdom_score": self._score_wisdom(text_lower),
-                "courage_score": self._score_courage(text_lower)
+                "compassion_score": indicators["compassion"],
+                "integrity_score": indicators["integrity"],
+                "wisdom_score": indicators["wisdom"],
+                "courage_score": indicators["courage"]
             }
         
         elif specialization == "security":
             return {
-                "security_risk": self._assess_security_risk(text_lower),
-                "integrity_score": 1.0 - self._assess_security_risk(text_lower),
-                "courage_score": 0.8 if "security" in text_lower else 0.6
+                "security_risk": indicators["security_risk"],
+                "integrity_score": 1.0 - indicators["security_risk"],
+                "courage_score": 0.8 if indicators["mentions_security"] else 0.6
             }
         
         elif specialization == "accessibility":
             return {
-                "compassion_score": self._score_accessibility_compassion(text_lower),
-                "wisdom_score": 0.8 if "accessible" in text_lower else 0.5,
+                "compassion_score": indicators["accessibility_compassion"],
+                "wisdom_score": 0.8 if indicators["mentions_accessible"] else 0.5,
                 "integrity_score": 0.7
             }
         
         elif specialization == "performance":
             return {
-                "wisdom_score": self._score_performance_wisdom(text_lower),
-                "integrity_score": 0.8 if "optimize" in text_lower else 0.6,
+                "wisdom_score": indicators["performance_wisdom"],
+                "integrity_score": 0.8 if indicators["mentions_optimize"] else 0.6,
                 "courage_score": 0.7
             }
         
@@ -386,152 +1011,6 @@ class AegisCouncil:
         
         return {virtue: 0.5 for virtue in self.virtues.keys()}
     
-    def _score_compassion(self, text: str) -> float:
-        """Score compassion indicators"""
-        compassion_words = ["help", "user", "accessible", "friendly", "care", "support", "inclusive"]
-        score = sum(0.1 for word in compassion_words if word in text)
-        return min(1.0, 0.5 + score)
-    
-    def _score_integrity(self, text: str) -> float:
-        """Score integrity indicators"""
-        integrity_words = ["secure", "honest", "reliable", "transparent", "authentic", "valid"]
-        score = sum(0.1 for word in integrity_words if word in text)
-        return min(1.0, 0.5 + score)
-    
-    def _score_wisdom(self, text: str) -> float:
-        """Score wisdom indicators"""
-        wisdom_words = ["understand", "learn", "analyze", "thoughtful", "careful", "consider"]
-        score = sum(0.1 for word in wisdom_words if word in text)
-        return min(1.0, 0.5 + score)
-    
-    def _score_courage(self, text: str) -> float:
-        """Score courage indicators"""
-        courage_words = ["challenge", "improve", "innovate", "bold", "brave", "tackle"]
-        score = sum(0.1 for word in courage_words if word in text)
-        return min(1.0, 0.5 + score)
-    
-    def _assess_security_risk(self, text: str) -> float:
-        """Assess security risk level"""
-        risk_words = ["hack", "exploit", "vulnerability", "attack", "malicious", "unsafe"]
-        risk_score = sum(0.2 for word in risk_words if word in text)
-        return min(1.0, risk_score)
-    
-    def _score_accessibility_compassion(self, text: str) -> float:
-        """Score accessibility-related compassion"""
-        accessibility_words = ["accessible", "inclusive", "disability", "screen reader", "keyboard"]
-        score = sum(0.15 for word in accessibility_words if word in text)
-        return min(1.0, 0.6 + score)
-    
-    def _score_performance_wisdom(self, text: str) -> float:
-        """Score performance-related wisdom"""
-        performance_words = ["optimize", "efficient", "fast", "performance", "scalable"]
-        score = sum(0.12 for word in performance_words if word in text)
-        return min(1.0, 0.5 + score)
-    
-    def _apply_agent_overrides(self, overrides: Dict[str, Any]):
-        """Apply overrides to agent parameters"""
-        for agent_name, override_data in overrides.items():
-            if agent_name in self.agents:
-                agent = self.agents[agent_name]
-                if "influence" in override_data:
-                    agent.influence = max(0.0, min(1.0, override_data["influence"]))
-                if "reliability" in override_data:
-                    agent.reliability = max(0.0, min(1.0, override_data["reliability"]))
-                if "severity" in override_data:
-                    agent.severity = max(0.0, min(1.0, override_data["severity"]))
-    
-    def _calculate_consensus(self, agent_votes: Dict[str, Any]) -> float:
-        """Calculate consensus strength among agents"""
-        recommendations = [vote["recommendation"] for vote in agent_votes.values()]
-        
-        # Count recommendation types
-        rec_counts = {}
-        for rec in recommendations:
-            rec_counts[rec] = rec_counts.get(rec, 0) + 1
-        
-        if not rec_counts:
-            return 0.0
-        
-        # Find majority recommendation with tie-breaking
-        max_count = max(rec_counts.values())
-        majority_recs = [rec for rec, count in rec_counts.items() if count == max_count]
-        
-        # Tie-breaking: pick recommendation with highest sum of reliabilities
-        if len(majority_recs) > 1:
-            rec_reliability_sums = {}
-            for rec in majority_recs:
-                reliability_sum = sum(
-                    self.agents[agent_name].reliability * self.agents[agent_name].influence
-                    for agent_name, vote in agent_votes.items()
-                    if vote["recommendation"] == rec
-                )
-                rec_reliability_sums[rec] = reliability_sum
-            
-            majority_rec = max(rec_reliability_sums.keys(), key=lambda k: rec_reliability_sums[k])
-        else:
-            majority_rec = majority_recs[0]
-        
-        # Weight by agent reliability
-        weighted_consensus = 0.0
-        total_reliability = 0.0
-        
-        for agent_name, vote in agent_votes.items():
-            agent = self.agents[agent_name]
-            if vote["recommendation"] == majority_rec:
-                weighted_consensus += agent.reliability
-            total_reliability += agent.reliability
-        
-        return weighted_consensus / total_reliability if total_reliability > 0 else 0.0
-    
-    def _make_final_decision(
-        self, 
-        agent_votes: Dict[str, Any], 
-        virtue_scores: Dict[str, float],
-        consensus_strength: float
-    ) -> Dict[str, Any]:
-        """Make final council decision"""
-        
-        # Determine majority recommendation
-        recommendations = [vote["recommendation"] for vote in agent_votes.values()]
-        rec_counts = {}
-        for rec in recommendations:
-            rec_counts[rec] = rec_counts.get(rec, 0) + 1
-        
-        majority_decision = max(rec_counts.keys(), key=lambda k: rec_counts[k]) if rec_counts else "review_required"
-        
-        # Calculate overall virtue score
-        overall_virtue = statistics.fmean(virtue_scores.values()) if virtue_scores else 0.5
-        
-        # Determine temporal forecast
-        if consensus_strength > 0.85 and overall_virtue > 0.8:
-            forecast = "stable"
-        elif consensus_strength > 0.6 and overall_virtue > 0.6:
-            forecast = "neutral"
-        else:
-            forecast = "volatile"
-        
-        # Check ethical compliance
-        ethical_compliance = overall_virtue > 0.7 and consensus_strength > 0.6
-        
-        # Generate reasoning
-        reasoning = self._generate_decision_reasoning(
-            majority_decision, virtue_scores, consensus_strength, overall_virtue
-        )
-        
-        # Collect dissenting opinions
-        dissenting_opinions = []
-        for agent_name, vote in agent_votes.items():
-            if vote["recommendation"] != majority_decision:
-                dissenting_opinions.append(f"{agent_name}: {vote['reasoning']}")
-        
-        return {
-            "decision": majority_decision,
-            "forecast": forecast,
-            "ethical_compliance": ethical_compliance,
-            "reasoning": reasoning,
-            "dissenting_opinions": dissenting_opinions
-        }
-    
     def _generate_decision_reasoning(
         self, 
         decision: str, 
@@ -576,12 +1055,11 @@ class AegisCouncil:
         self, 
         agent: Agent, 
         analysis: Dict[str, Any], 
-        virtue_assessment: Dict[str, float]
+        virtue_assessment: Dict[str, float],
+        avg_virtue: float
     ) -> str:
         """Generate reasoning for individual agent vote"""
         
-        avg_virtue = np.mean(list(virtue_assessment.values()))
-        
         if agent.specialization == "virtue_ethics":
             return f"From a virtue ethics perspective, this demonstrates {avg_virtue:.2f} virtue alignment."
         elif agent.specialization == "security":
@@ -596,57 +1074,86 @@ class AegisCouncil:
     
     def _redact_input(self, input_text: str) -> str:
         """Redact PII from input before storage"""
-        import re
-        
         redacted = input_text
-        
-        # Redact email addresses
-        redacted = re.sub(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', '[EMAIL_REDACTED]', redacted)
-        
-        # Redact phone numbers
-        redacted = re.sub(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b', '[PHONE_REDACTED]', redacted)
-        
-        # Redact potential tokens (long alphanumeric strings)
-        redacted = re.sub(r'\b[A-Za-z0-9]{32,}\b', '[TOKEN_REDACTED]', redacted)
-        
+        for pattern, replacement in REDACTION_PATTERNS:
+            redacted = pattern.sub(replacement, redacted)
         return redacted
     
-    async def _store_decision(self, redacted_input: str, decision: Dict[str, Any]):
-        """Store council decision in database"""
+    def _serialize_decision(self, decision: Dict[str, Any], vote_payloads: List[str]) -> str:
+        """
+        JSON for a decision, splicing in its already serialized votes
+        
+        Produces exactly ``json.dumps(decision)``; ``agent_votes`` and
+        ``timestamp`` are the last two fields of every decision record.
+        """
+        head = json.dumps({
+            key: value for key, value in decision.items() if key not in ("agent_votes", "timestamp")
+        })
+        votes = ", ".join(
+            f"{json.dumps(agent_name)}: {payload}"
+            for agent_name, payload in zip(decision["agent_votes"], vote_payloads)
+        )
+        return f'{head[:-1]}, "agent_votes": {{{votes}}}, "timestamp": {json.dumps(decision["timestamp"])}}}'
+    
+    async def _store_decisions(self, records: List[Tuple[str, Dict[str, Any], str, List[str]]]):
+        """Store (redacted input, decision, decision JSON, vote JSON payloads) records in one transaction"""
         try:
-            decision_id = decision["decision_id"]
-            
-            await self.conn.execute("""
-                INSERT OR REPLACE INTO council_decisions 
-                (id, input_text_redacted, decision_data, timestamp, consensus_strength, ethical_compliance)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                decision_id,
-                redacted_input,
-                json.dumps(decision),
-                decision["timestamp"],
-                decision["consensus_strength"],
-                1 if decision["ethical_compliance"] else 0
-            ))
+            # Cursors are closed explicitly so their statements are finalized
+            # on the connection's thread, not whenever they are collected
+            # An upsert rather than INSERT OR REPLACE: a replace deletes the old
+            # row without firing delete triggers, leaving stale search entries
+            cursor = await self.conn.executemany("""
+                INSERT INTO council_decisions 
+                (id, input_text_redacted, decision_data, timestamp, consensus_strength, ethical_compliance,
+                 decision, reasoning, config_version)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (id) DO UPDATE SET
+                    input_text_redacted = excluded.input_text_redacted,
+                    decision_data = excluded.decision_data,
+                    timestamp = excluded.timestamp,
+                    consensus_strength = excluded.consensus_strength,
+                    ethical_compliance = excluded.ethical_compliance,
+                    decision = excluded.decision,
+                    reasoning = excluded.reasoning,
+                    config_version = excluded.config_version
+            """, [
+                (
+                    decision["decision_id"],
+                    redacted_input,
+                    decision_data,
+                    decision["timestamp"],
+                    decision["consensus_strength"],
+                    1 if decision["ethical_compliance"] else 0,
+                    decision["override_decision"],
+                    decision["reasoning"],
+                    decision.get("config_version")
+                )
+                for redacted_input, decision, decision_data, _ in records
+            ])
+            await cursor.close()
             
             # Store individual agent votes
-            for agent_name, vote in decision["agent_votes"].items():
-                await self.conn.execute("""
-                    INSERT INTO agent_votes 
-                    (decision_id, agent_name, vote_data, timestamp)
-                    VALUES (?, ?, ?, ?)
-                """, (
-                    decision_id,
+            cursor = await self.conn.executemany("""
+                INSERT INTO agent_votes 
+                (decision_id, agent_name, vote_data, timestamp)
+                VALUES (?, ?, ?, ?)
+            """, [
+                (
+                    decision["decision_id"],
                     agent_name,
-                    json.dumps(vote),
+                    payload,
                     decision["timestamp"]
-                ))
+                )
+                for _, decision, _, vote_payloads in records
+                for agent_name, payload in zip(decision["agent_votes"], vote_payloads)
+            ])
+            await cursor.close()
             
             await self.conn.commit()
-            logger.info(f"📊 [{decision_id}] Decision stored successfully")
+            logger.info(f"📊 Stored {len(records)} council decision(s)")
             
         except Exception as e:
-            logger.error(f"❌ [{decision.get('decision_id', 'unknown')}] Failed to store decision: {e}")
+            logger.error(f"❌ Failed to store {len(records)} council decision(s): {e}")
     
     async def _load_decision_history(self):
         """Load decision history from database"""
@@ -663,15 +1170,152 @@ class AegisCouncil:
                     except Exception as e:
                         logger.warning(f"Failed to load decision: {e}")
             
+            # Replay oldest first so windows and trend continue across restarts
+            for decision in reversed(self.decision_history):
+                try:
+                    self.analytics.record(decision, CouncilAnalytics.epoch_of(decision["timestamp"]))
+                except (KeyError, TypeError, ValueError) as e:
+                    logger.warning(f"Failed to replay decision into analytics: {e}")
+            
             logger.info(f"📚 Loaded {len(self.decision_history)} council decisions")
             
         except Exception as e:
             logger.error(f"❌ Failed to load decision history: {e}")
     
+    async def query_decisions(
+        self,
+        text: Optional[str] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        decision: Optional[str] = None,
+        ethical_compliance: Optional[bool] = None,
+        min_consensus: Optional[float] = None,
+        max_consensus: Optional[float] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        include_details: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Page through stored decisions, newest first
+        
+        Filters combine with AND: ``text`` matches every word against the
+        redacted input and reasoning, ``start``/``end`` bound the ISO
+        timestamp as [start, end), and the consensus band is inclusive.
+        Pages are keyset-paginated; pass the returned ``next_cursor`` back
+        with the same filters to continue, which costs the same at any depth.
+        
+        Without ``text`` pages are ordered by (timestamp, id). Text queries
+        walk the full-text index in recording order instead, so they stop
+        after one page rather than sorting every match; the two orders only
+        differ between batches whose storage interleaved.
+        """
+        if not 0 < limit <= MAX_QUERY_LIMIT:
+            raise ValueError(f"limit must be between 1 and {MAX_QUERY_LIMIT}")
+        
+        position = self._decode_cursor(cursor) if cursor else None
+        conditions: List[str] = []
+        params: List[Any] = []
+        source = "council_decisions d"
+        order = "d.timestamp DESC, d.id DESC"
+        
+        if text:
+            words = _SEARCH_TOKEN.findall(text)
+            if not words:
+                raise ValueError("text must contain at least one word")
+            if self.fts_enabled:
+                # CROSS JOIN keeps the index walk outermost so LIMIT ends the scan early
+                source = "council_decisions_fts f CROSS JOIN council_decisions d ON d.rowid = f.rowid"
+                order = "f.rowid DESC"
+                conditions.append("council_decisions_fts MATCH ?")
+                # Quote each word so user input never parses as FTS5 query syntax
+                params.append(" ".join(f'"{word}"' for word in words))
+                if position:
+                    conditions.append("f.rowid < ?")
+                    params.append(position[2])
+            else:
+                for word in words:
+                    conditions.append("(d.input_text_redacted LIKE ? OR d.reasoning LIKE ?)")
+                    params.extend([f"%{word}%"] * 2)
+        if position and order.startswith("d.timestamp"):
+            conditions.append("(d.timestamp, d.id) < (?, ?)")
+            params.extend(position[:2])
+        if start:
+            conditions.append("d.timestamp >= ?")
+            params.append(start)
+        if end:
+            conditions.append("d.timestamp < ?")
+            params.append(end)
+        if decision:
+            conditions.append("d.decision = ?")
+            params.append(decision)
+        if ethical_compliance is not None:
+            conditions.append("d.ethical_compliance = ?")
+            params.append(1 if ethical_compliance else 0)
+        # Unary + keeps the band off any index: filtering an ordered walk beats
+        # sorting every row in the band
+        if min_consensus is not None:
+            conditions.append("+d.consensus_strength >= ?")
+            params.append(min_consensus)
+        if max_consensus is not None:
+            conditions.append("+d.consensus_strength <= ?")
+            params.append(max_consensus)
+        
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        details = ", d.decision_data" if include_details else ""
+        
+        # One extra row tells whether another page exists
+        async with self.conn.execute(f"""
+            SELECT d.rowid, d.id, d.timestamp, d.decision, d.consensus_strength, d.ethical_compliance,
+                   d.input_text_redacted, d.reasoning, d.config_version{details}
+            FROM {source}
+            {where}
+            ORDER BY {order}
+            LIMIT ?
+        """, params + [limit + 1]) as db_cursor:
+            rows = await db_cursor.fetchall()
+        
+        decisions = []
+        for row in rows[:limit]:
+            entry = {
+                "decision_id": row[1],
+                "timestamp": row[2],
+                "decision": row[3],
+                "consensus_strength": row[4],
+                "ethical_compliance": bool(row[5]),
+                "input_text_redacted": row[6],
+                "reasoning": row[7],
+                "config_version": row[8]
+            }
+            if include_details:
+                entry["details"] = json.loads(row[9])
+            decisions.append(entry)
+        
+        next_cursor = None
+        if len(rows) > limit:
+            last = rows[limit - 1]
+            next_cursor = self._encode_cursor(last[2], last[1], last[0])
+        
+        return {"decisions": decisions, "next_cursor": next_cursor}
+    
+    @staticmethod
+    def _encode_cursor(timestamp: str, decision_id: str, rowid: int) -> str:
+        return base64.urlsafe_b64encode(json.dumps([timestamp, decision_id, rowid]).encode()).decode()
+    
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[str, str, int]:
+        try:
+            timestamp, decision_id, rowid = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (ValueError, TypeError) as e:
+            raise ValueError("Invalid cursor") from e
+        if not (isinstance(timestamp, str) and isinstance(decision_id, str) and isinstance(rowid, int)):
+            raise ValueError("Invalid cursor")
+        return timestamp, decision_id, rowid
+    
     async def get_status(self) -> Dict[str, Any]:
         """Get current council status"""
         return {
             "active": self.is_active(),
+            "config_version": self.config.version if self.config else None,
             "agents": [
                 {
                     "name": agent.name,
@@ -682,10 +1326,18 @@ class AegisCouncil:
                 }
                 for agent in self.agents.values()
             ],
-            "decisions_made": len(self.decision_history),
-            "average_consensus": np.mean([d.get("consensus_strength", 0) for d in self.decision_history]) if self.decision_history else 0.0
+            "decisions_made": self.analytics.lifetime_decisions,
+            "decision_cache": self.decision_cache.get_stats(),
+            "decision_lookups": dict(self.decision_lookups),
+            "cache_hit_ratio": self.decision_lookups["cached"] / max(1, sum(self.decision_lookups.values())),
+            "average_consensus": self.analytics.recent.mean,
+            "temporal_trend": self.analytics.forecast()
         }
     
+    def get_analytics(self) -> Dict[str, Any]:
+        """Rolling council analytics (constant time, safe to poll)"""
+        return self.analytics.get_stats()
+    
     def is_active(self) -> bool:
         """Check if Aegis Council is active"""
         return self.is_initialized and self.conn is not None
@@ -7,20 +7,103 @@ This implements the actual DreamCore system described in the research paper.
 """
 
 import asyncio
+import base64
 import json
 import aiosqlite
 import hashlib
+import heapq
+import math
 import numpy as np
 import statistics
 import os
 import re
-from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, Tuple
+import sqlite3
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, Iterator, List, Optional, Set, Tuple
 from dataclasses import dataclass, asdict
 import logging
+from collections import Counter
+
+from utils.rolling_stats import RollingStats, TimeWindow
+from utils.fingerprint_index import simhash
+from utils.vector_index import VectorIndex, hashed_embedding
 
 logger = logging.getLogger(__name__)
 
+SECONDS_PER_DAY = 24 * 3600
+EMOTIONAL_STATE_WINDOW_SECONDS = 3600
+
+# Recall embeddings: hashed bag-of-words dimensions followed by the
+# 10-dimensional emotion vector, scaled down so wording dominates
+RECALL_TEXT_DIM = 54
+RECALL_EMOTION_WEIGHT = 0.5
+
+# Eviction keeps the memories scoring highest on this blend of components,
+# each scaled to [0, 1]; recency halves every week without access
+EVICTION_WEIGHTS = {"weight": 0.35, "strength": 0.25, "frequency": 0.2, "recency": 0.2}
+EVICTION_RECENCY_HALF_LIFE_DAYS = 7.0
+# Approximate per-row storage besides content and anchors (ids, timestamps, numbers)
+MEMORY_ROW_OVERHEAD_BYTES = 96
+
+# Wake-state traces are aggregated per minute; a query returns at most this many buckets
+TRACE_BUCKET_SECONDS = 60
+MAX_TRACE_QUERY_BUCKETS = 1440
+
+# Full-text search scores at most this many matches, newest first; pages hold at most MAX_SEARCH_LIMIT
+SEARCH_CANDIDATES = 2000
+MAX_SEARCH_LIMIT = 100
+UNIX_EPOCH_JULIAN_DAY = 2440587.5
+
+_SEARCH_TOKEN = re.compile(r"\w+")
+
+# Metadata columns read into MemoryColumns, in ``MemoryColumns.add`` order
+MEMORY_METADATA_SQL = """
+    id, emotion_tag, emotional_weight, created_at, last_accessed, access_count, decay_factor,
+    length(CAST(content_redacted AS BLOB)) + length(CAST(anchors AS BLOB))
+"""
+# Distinct emotion tags by repeated index seeks rather than a full scan
+EMOTION_TAGS_SQL = """
+    WITH RECURSIVE tags(tag) AS (
+        SELECT MIN(emotion_tag) FROM memories
+        UNION ALL
+        SELECT (SELECT MIN(emotion_tag) FROM memories WHERE emotion_tag > tag) FROM tags WHERE tag IS NOT NULL
+    )
+    SELECT tag FROM tags WHERE tag IS NOT NULL
+"""
+
+def _parse_timestamp(value: str) -> datetime:
+    """Naive UTC datetime from a stored ISO timestamp, with or without a zone suffix"""
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+def _epoch(moment: datetime) -> float:
+    """Epoch seconds of a naive UTC datetime"""
+    return moment.replace(tzinfo=timezone.utc).timestamp()
+
+def _from_epoch(seconds: float) -> datetime:
+    """Naive UTC datetime of epoch seconds"""
+    return datetime.fromtimestamp(seconds, timezone.utc).replace(tzinfo=None)
+
+def _fingerprint(content: str) -> int:
+    """SimHash of memory content as a signed 64-bit integer, the range SQLite stores"""
+    value = simhash(content)
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+def _retention(decay_factor: float, emotional_weight: float, days: float) -> float:
+    """``decay_factor ** (days / (weight + 0.1))``: stronger emotions decay slower"""
+    return decay_factor ** (max(0.0, days) / (max(emotional_weight, 0.0) + 0.1))
+
+def _expiry(accessed: float, decay_factor: float, emotional_weight: float, threshold: float) -> float:
+    """Epoch seconds at which retention since ``accessed`` falls below ``threshold``"""
+    if not 0.0 < decay_factor < 1.0:
+        return math.inf
+    days = (max(emotional_weight, 0.0) + 0.1) * math.log(threshold) / math.log(decay_factor)
+    return accessed + days * SECONDS_PER_DAY
+
 @dataclass
 class MemoryAnchor:
     """Memory anchor as described in the research paper"""
@@ -41,6 +124,255 @@ class EmotionalMemory:
     created_at: datetime
     last_accessed: datetime
     access_count: int = 0
+    decay_factor: float = 0.95  # Retention per day at unit emotional weight
+    
+    def strength(self, now: datetime) -> float:
+        """
+        Retention since last access: ``decay_factor ** (days / (weight + 0.1))``
+        
+        Computed from the timestamps alone, so reading never changes it;
+        stronger emotions decay slower and each access restarts the clock.
+        """
+        days = (now - self.last_accessed).total_seconds() / SECONDS_PER_DAY
+        return _retention(self.decay_factor, self.emotional_weight, days)
+    
+    def expires_at(self, threshold: float) -> float:
+        """Epoch seconds at which strength falls below ``threshold``"""
+        return _expiry(_epoch(self.last_accessed), self.decay_factor, self.emotional_weight, threshold)
+
+class MemoryRow:
+    """
+    Live view of one memory held in ``MemoryColumns``
+    
+    Reads and writes go straight to the columns. Content and anchors are
+    not held in memory; a view is only valid until its memory is removed.
+    """
+    __slots__ = ("_columns", "_slot", "id")
+    
+    def __init__(self, columns: "MemoryColumns", slot: int, memory_id: str):
+        self._columns = columns
+        self._slot = slot
+        self.id = memory_id
+    
+    @property
+    def emotion_tag(self) -> str:
+        return self._columns.tags[self._columns.tag_codes[self._slot]]
+    
+    @property
+    def emotional_weight(self) -> float:
+        return self._columns.weights.item(self._slot)
+    
+    @property
+    def decay_factor(self) -> float:
+        return self._columns.decay_factors.item(self._slot)
+    
+    @property
+    def stored_bytes(self) -> int:
+        """Bytes of content and serialized anchors in the database row"""
+        return self._columns.stored_bytes.item(self._slot)
+    
+    @property
+    def access_count(self) -> int:
+        return self._columns.access_counts.item(self._slot)
+    
+    @access_count.setter
+    def access_count(self, value: int):
+        self._columns.access_counts[self._slot] = value
+    
+    @property
+    def accessed_epoch(self) -> float:
+        return self._columns.last_accessed.item(self._slot)
+    
+    @property
+    def created_at(self) -> datetime:
+        return _from_epoch(self._columns.created_at.item(self._slot))
+    
+    @property
+    def last_accessed(self) -> datetime:
+        return _from_epoch(self.accessed_epoch)
+    
+    @last_accessed.setter
+    def last_accessed(self, value: datetime):
+        self._columns.last_accessed[self._slot] = _epoch(value)
+    
+    def strength(self, now: datetime) -> float:
+        """Retention since last access, as ``EmotionalMemory.strength``"""
+        return _retention(self.decay_factor, self.emotional_weight, (_epoch(now) - self.accessed_epoch) / SECONDS_PER_DAY)
+    
+    def expires_at(self, threshold: float) -> float:
+        """Epoch seconds at which strength falls below ``threshold``"""
+        return _expiry(self.accessed_epoch, self.decay_factor, self.emotional_weight, threshold)
+
+class MemoryColumns:
+    """
+    Memory metadata as parallel NumPy columns addressed by slot
+    
+    Weights, decay factors, epoch timestamps, access counts and stored
+    sizes live in contiguous arrays; emotion tags are interned to small
+    integer codes. Freed slots are reused, so the columns only grow with
+    the peak number of memories. Behaves as a read-only mapping from
+    memory id to ``MemoryRow`` views.
+    """
+    
+    def __init__(self, capacity: int = 1024):
+        self.weights = np.zeros(capacity, dtype=np.float64)
+        self.decay_factors = np.zeros(capacity, dtype=np.float64)
+        self.created_at = np.zeros(capacity, dtype=np.float64)
+        self.last_accessed = np.zeros(capacity, dtype=np.float64)
+        self.access_counts = np.zeros(capacity, dtype=np.int64)
+        self.stored_bytes = np.zeros(capacity, dtype=np.int64)
+        self.tag_codes = np.zeros(capacity, dtype=np.int16)
+        self.live = np.zeros(capacity, dtype=bool)
+        
+        self.tags: List[str] = []
+        self._tag_codes: Dict[str, int] = {}
+        self._slots: Dict[str, int] = {}
+        self._ids: List[Optional[str]] = []  # Slot -> memory id
+        self._free: List[int] = []
+    
+    def __len__(self) -> int:
+        return len(self._slots)
+    
+    def __contains__(self, memory_id: str) -> bool:
+        return memory_id in self._slots
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._slots)
+    
+    def __getitem__(self, memory_id: str) -> MemoryRow:
+        return MemoryRow(self, self._slots[memory_id], memory_id)
+    
+    def get(self, memory_id: str, default: Optional[MemoryRow] = None) -> Optional[MemoryRow]:
+        slot = self._slots.get(memory_id)
+        return default if slot is None else MemoryRow(self, slot, memory_id)
+    
+    def keys(self) -> Iterator[str]:
+        return iter(self._slots)
+    
+    def values(self) -> Iterator[MemoryRow]:
+        return (MemoryRow(self, slot, memory_id) for memory_id, slot in self._slots.items())
+    
+    def items(self) -> Iterator[Tuple[str, MemoryRow]]:
+        return ((memory_id, MemoryRow(self, slot, memory_id)) for memory_id, slot in self._slots.items())
+    
+    def id_at(self, slot: int) -> str:
+        return self._ids[slot]
+    
+    def live_slots(self) -> np.ndarray:
+        return np.flatnonzero(self.live[:len(self._ids)])
+    
+    def add(
+        self,
+        memory_id: str,
+        emotion_tag: str,
+        emotional_weight: float,
+        created_at: float,
+        last_accessed: float,
+        access_count: int,
+        decay_factor: float,
+        stored_bytes: int
+    ) -> MemoryRow:
+        """Insert a memory (timestamps as epoch seconds), replacing one with the same id"""
+        slot = self._slots.get(memory_id)
+        if slot is None:
+            if self._free:
+                slot = self._free.pop()
+                self._ids[slot] = memory_id
+            else:
+                slot = len(self._ids)
+                if slot == len(self.weights):
+                    self._grow(2 * slot)
+                self._ids.append(memory_id)
+            self._slots[memory_id] = slot
+        
+        code = self._tag_codes.get(emotion_tag)
+        if code is None:
+            code = self._tag_codes[emotion_tag] = len(self.tags)
+            self.tags.append(emotion_tag)
+        
+        self.weights[slot] = emotional_weight
+        self.decay_factors[slot] = decay_factor
+        self.created_at[slot] = created_at
+        self.last_accessed[slot] = last_accessed
+        self.access_counts[slot] = access_count
+        self.stored_bytes[slot] = stored_bytes
+        self.tag_codes[slot] = code
+        self.live[slot] = True
+        return MemoryRow(self, slot, memory_id)
+    
+    def expires_at(self, slots: np.ndarray, threshold: float) -> np.ndarray:
+        """Epoch seconds at which each slot's strength falls below ``threshold``, as ``_expiry``"""
+        decay = self.decay_factors[slots]
+        decays = (decay > 0.0) & (decay < 1.0)
+        days = np.full(len(slots), np.inf)
+        days[decays] = (
+            (np.maximum(self.weights[slots][decays], 0.0) + 0.1) * math.log(threshold) / np.log(decay[decays])
+        )
+        return self.last_accessed[slots] + days * SECONDS_PER_DAY
+    
+    def remove(self, memory_id: str) -> bool:
+        slot = self._slots.pop(memory_id, None)
+        if slot is None:
+            return False
+        self._ids[slot] = None
+        self.live[slot] = False
+        self._free.append(slot)
+        return True
+    
+    def clear(self):
+        self.__init__(len(self.weights))
+    
+    def _grow(self, capacity: int):
+        for name in ("weights", "decay_factors", "created_at", "last_accessed",
+                     "access_counts", "stored_bytes", "tag_codes", "live"):
+            column = getattr(self, name)
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:len(column)] = column
+            setattr(self, name, grown)
+    
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the columns"""
+        return sum(
+            column.nbytes for column in (
+                self.weights, self.decay_factors, self.created_at, self.last_accessed,
+                self.access_counts, self.stored_bytes, self.tag_codes, self.live
+            )
+        )
+
+class TraceBucket:
+    """Count and emotional-response summary of the wake-state traces in one bucket"""
+    
+    __slots__ = ("count", "response_sum", "response_min", "response_max")
+    
+    def __init__(self, count: int = 0, response_sum: float = 0.0,
+                 response_min: float = math.inf, response_max: float = -math.inf):
+        self.count = count
+        self.response_sum = response_sum
+        self.response_min = response_min
+        self.response_max = response_max
+    
+    def add(self, response: float):
+        self.count += 1
+        self.response_sum += response
+        self.response_min = min(self.response_min, response)
+        self.response_max = max(self.response_max, response)
+    
+    def merge(self, other: "TraceBucket"):
+        self.count += other.count
+        self.response_sum += other.response_sum
+        self.response_min = min(self.response_min, other.response_min)
+        self.response_max = max(self.response_max, other.response_max)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        if not self.count:
+            return {"count": 0, "mean_response": 0.0, "min_response": 0.0, "max_response": 0.0}
+        return {
+            "count": self.count,
+            "mean_response": self.response_sum / self.count,
+            "min_response": self.response_min,
+            "max_response": self.response_max
+        }
 
 class DreamCoreMemory:
     """
@@ -50,14 +382,151 @@ class DreamCoreMemory:
     as described in the research paper.
     """
     
-    def __init__(self, db_path: str = "backend/data/dreamcore.db"):
+    def __init__(
+        self,
+        db_path: str = "backend/data/dreamcore.db",
+        decay_threshold: float = 0.1,
+        sweep_interval_seconds: Optional[float] = 60.0,
+        sweep_batch_size: int = 500,
+        flush_interval_ms: Optional[float] = 500.0,
+        flush_batch_size: int = 256,
+        recall_ivf_lists: int = 0,
+        recall_ivf_min_vectors: int = 200000,
+        recall_ivf_probes: int = 16,
+        max_memories: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        eviction_low_water: float = 0.9,
+        hot_memories_per_emotion: Optional[int] = 1000,
+        warm_page_size: int = 2000,
+        warm_pause_ms: float = 20.0,
+        trace_batch_size: int = 1000,
+        trace_retention_minutes: int = 1440,
+        consolidation_interval_seconds: Optional[float] = 10.0,
+        consolidation_budget_ms: float = 100.0,
+        consolidation_page_size: int = 500
+    ):
+        if not 0.0 < decay_threshold < 1.0:
+            raise ValueError("Decay threshold must be in (0, 1)")
+        if sweep_batch_size <= 0:
+            raise ValueError("Sweep batch size must be positive")
+        if flush_batch_size <= 0:
+            raise ValueError("Flush batch size must be positive")
+        if (max_memories is not None and max_memories <= 0) or (max_bytes is not None and max_bytes <= 0):
+            raise ValueError("Capacity limits must be positive")
+        if not 0.0 < eviction_low_water <= 1.0:
+            raise ValueError("Eviction low-water mark must be in (0, 1]")
+        if hot_memories_per_emotion is not None and hot_memories_per_emotion <= 0:
+            raise ValueError("Hot memories per emotion must be positive")
+        if warm_page_size <= 0:
+            raise ValueError("Warm-up page size must be positive")
+        if trace_batch_size <= 0 or trace_retention_minutes <= 0:
+            raise ValueError("Trace batch size and retention must be positive")
+        if consolidation_budget_ms < 0 or not 0 < consolidation_page_size <= 500:
+            raise ValueError("Consolidation budget must be non-negative and page size in [1, 500]")
+        
         self.db_path = db_path
-        self.memories: Dict[str, EmotionalMemory] = {}
+        # Metadata columns only; content and anchors stay in the database
+        self.memories = MemoryColumns()
         self.emotional_vectors: Dict[str, np.ndarray] = {}
         self.wake_state_tracers: List[Dict[str, Any]] = []
         self.is_initialized = False
+        self.fts_enabled = False
+        self.searches = 0
         self.conn: Optional[aiosqlite.Connection] = None
         
+        # Memories below this strength are hidden from reads and purged by the sweeper
+        self.decay_threshold = decay_threshold
+        self.sweep_interval_seconds = sweep_interval_seconds
+        self.sweep_batch_size = sweep_batch_size
+        self._sweep_task: Optional[asyncio.Task] = None
+        self.memories_expired = 0
+        
+        # Per-emotion heaps of (-weight, -last_accessed, memory_id), strongest
+        # and most recent on top; an access pushes a fresh entry and leaves
+        # the old one to be skipped when it surfaces
+        self._emotion_index: Dict[str, List[Tuple[float, float, str]]] = {}
+        # Live memory count and summed weight per emotion
+        self.emotion_counts: Counter = Counter()
+        self.emotion_weights: Counter = Counter()
+        # Weight and count per emotion of memories accessed within the window;
+        # an access moves a memory's contribution from its old slot to the new one
+        self._recent_activity = TimeWindow(EMOTIONAL_STATE_WINDOW_SECONDS)
+        
+        # Access stats are written back in batches: touched ids collect here
+        # until the flush timer fires or ``flush_batch_size`` is reached
+        self.flush_interval_ms = flush_interval_ms
+        self.flush_batch_size = flush_batch_size
+        self._dirty: set = set()
+        self._flush_task: Optional[asyncio.Task] = None
+        self.flush_sizes = RollingStats(maxlen=1000)
+        self.flush_latency_ms = RollingStats(maxlen=1000)
+        self.rows_flushed = 0
+        
+        # One recall embedding per memory, saved beside the database on shutdown
+        self._vector_options = {
+            "ivf_lists": recall_ivf_lists,
+            "ivf_min_vectors": recall_ivf_min_vectors,
+            "ivf_probes": recall_ivf_probes
+        }
+        self.vector_index = VectorIndex(RECALL_TEXT_DIM + 10, **self._vector_options)
+        self.vector_path = os.path.splitext(self.db_path)[0] + ".vectors.json"
+        
+        # Capacity limits act as high-water marks: crossing either evicts the
+        # lowest-scoring memories to the archive table down to the low-water
+        # fraction of both
+        self.max_memories = max_memories
+        self.max_bytes = max_bytes
+        self.eviction_low_water = eviction_low_water
+        self.memory_bytes = 0
+        self.memories_evicted = 0
+        self.bytes_evicted = 0
+        self.eviction_runs = 0
+        self.last_eviction_ms = 0.0
+        
+        # Startup loads the strongest ``hot_memories_per_emotion`` of each
+        # emotion plus everything accessed within the emotional-state window;
+        # the rest is paged in by a background warm-up, or sooner when a read
+        # reaches it. Emotions with rows still on disk map to the rank of the
+        # last row paged in: ((-weight, -last_accessed), (weight, last_accessed
+        # text, id)), or None before the first page
+        self.hot_memories_per_emotion = hot_memories_per_emotion
+        self.warm_page_size = warm_page_size
+        self.warm_pause_ms = warm_pause_ms
+        self._emotion_cursor: Dict[str, Optional[Tuple[Tuple[float, float], Tuple[float, str, str]]]] = {}
+        self._warm_task: Optional[asyncio.Task] = None
+        self.pages_loaded = 0
+        self.warm_up_seconds: Optional[float] = None
+        
+        # Wake-state traces are buffered and written in group commits of
+        # ``trace_batch_size`` or on the flush timer. Per-minute aggregates,
+        # overall (memory id "") and per memory, are persisted alongside and
+        # kept in memory for the last ``trace_retention_minutes``
+        self.trace_batch_size = trace_batch_size
+        self.trace_retention_minutes = trace_retention_minutes
+        self._trace_buffer: List[Tuple] = []
+        self._trace_deltas: Dict[Tuple[int, str], TraceBucket] = {}
+        self._trace_minutes: Dict[int, Dict[str, TraceBucket]] = {}
+        self.traces_ingested = 0
+        self.traces_written = 0
+        self.trace_commit_sizes = RollingStats(maxlen=1000)
+        self.trace_commit_latency_ms = RollingStats(maxlen=1000)
+        
+        # Consolidation walks the table in rowid order a page at a time, each
+        # cycle stopping once its time budget is spent; the position is saved
+        # with every cycle's commit so a restart resumes where it stopped
+        self.consolidation_interval_seconds = consolidation_interval_seconds
+        self.consolidation_budget_ms = consolidation_budget_ms
+        self.consolidation_page_size = consolidation_page_size
+        self._consolidation_task: Optional[asyncio.Task] = None
+        self._consolidation_rowid = 0
+        self.consolidation_cycles = 0
+        self.consolidation_passes = 0
+        self.memories_consolidated = 0
+        self.clusters_consolidated = 0
+        self.last_consolidation_ms = 0.0
+        # Measured cost of rewriting one merged memory, reserved out of each cycle's budget
+        self._merge_cost_ms = 0.0
+        
         # Ensure data directory exists
         db_dir = os.path.dirname(self.db_path)
         if db_dir:
@@ -75,15 +544,37 @@ class DreamCoreMemory:
             await self.conn.execute("PRAGMA journal_mode=WAL")
             await self.conn.execute("PRAGMA synchronous=NORMAL")
             await self.conn.execute("PRAGMA foreign_keys=ON")
+            await self._register_sql_functions()
             
             await self._create_tables()
             
-            # Load existing memories
+            # Load the hot working set; the rest warms up in the background
             await self._load_memories()
             
             # Initialize emotional vector space
             await self._initialize_emotional_vectors()
             
+            await self._load_vector_index()
+            await self._load_trace_aggregates()
+            async with self.conn.execute(
+                "SELECT value FROM dreamcore_state WHERE key = 'consolidation_rowid'"
+            ) as cursor:
+                row = await cursor.fetchone()
+            self._consolidation_rowid = int(row[0]) if row else 0
+            
+            if self.fully_loaded:
+                # Limits may have been lowered since the store was written
+                await self.enforce_capacity()
+            else:
+                self._warm_task = asyncio.create_task(self._warm_up())
+            
+            if self.sweep_interval_seconds:
+                self._sweep_task = asyncio.create_task(self._periodic_sweep())
+            if self.flush_interval_ms:
+                self._flush_task = asyncio.create_task(self._periodic_flush())
+            if self.consolidation_interval_seconds:
+                self._consolidation_task = asyncio.create_task(self._periodic_consolidation())
+            
             self.is_initialized = True
             logger.info("✅ DreamCore Memory System initialized successfully")
             
@@ -107,6 +598,31 @@ class DreamCoreMemory:
             )
         """)
         
+        await self._migrate_memory_columns()
+        
+        # Rank order within an emotion for paging, and access time for the hot set
+        await self.conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_memories_emotion_rank
+            ON memories (emotion_tag, emotional_weight, last_accessed, id)
+        """)
+        await self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_memories_last_accessed ON memories (last_accessed)"
+        )
+        # Consolidation clusters memories by content fingerprint within an emotion
+        await self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_memories_fingerprint ON memories (fingerprint, emotion_tag)"
+        )
+        
+        await self._create_search_index()
+        
+        # Small key/value store for background job positions
+        await self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS dreamcore_state (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            )
+        """)
+        
         await self.conn.execute("""
             CREATE TABLE IF NOT EXISTS wake_state_traces (
                 id TEXT PRIMARY KEY,
@@ -119,6 +635,44 @@ class DreamCoreMemory:
             )
         """)
         
+        # Evicted memories, kept cold with the score that evicted them
+        # Sweeps and evictions detach traces from deleted memories by this index
+        await self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_wake_state_traces_memory ON wake_state_traces (memory_id)"
+        )
+        
+        # Per-minute trace aggregates; memory_id "" holds the totals over all traces
+        await self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS wake_trace_minutes (
+                memory_id TEXT NOT NULL,
+                minute INTEGER NOT NULL,
+                trace_count INTEGER NOT NULL,
+                response_sum REAL NOT NULL,
+                response_min REAL NOT NULL,
+                response_max REAL NOT NULL,
+                PRIMARY KEY (memory_id, minute)
+            ) WITHOUT ROWID
+        """)
+        await self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_wake_trace_minutes_minute ON wake_trace_minutes (minute)"
+        )
+        
+        await self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS memories_archive (
+                id TEXT PRIMARY KEY,
+                emotion_tag TEXT NOT NULL,
+                content_redacted TEXT NOT NULL,
+                emotional_weight REAL NOT NULL,
+                created_at TEXT NOT NULL,
+                last_accessed TEXT NOT NULL,
+                access_count INTEGER DEFAULT 0,
+                decay_factor REAL DEFAULT 0.95,
+                anchors TEXT NOT NULL,
+                archived_at TEXT NOT NULL,
+                eviction_score REAL NOT NULL
+            )
+        """)
+        
         await self.conn.execute("""
             CREATE TABLE IF NOT EXISTS emotional_vectors (
                 emotion TEXT PRIMARY KEY,
@@ -130,27 +684,196 @@ class DreamCoreMemory:
         await self.conn.commit()
         logger.info("📊 DreamCore database tables created")
     
+    async def _register_sql_functions(self):
+        """Provide ``pow`` for search ranking where SQLite was built without math functions"""
+        try:
+            async with self.conn.execute("SELECT pow(1.0, 1.0)"):
+                pass
+        except sqlite3.OperationalError:
+            await self.conn.create_function("pow", 2, math.pow, deterministic=True)
+    
+    async def _create_search_index(self):
+        """Full-text index over memory content and emotion, kept in sync by triggers"""
+        async with self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'memories_fts'"
+        ) as cursor:
+            exists = await cursor.fetchone() is not None
+        
+        try:
+            await self.conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS memories_fts USING fts5(
+                    content_redacted, emotion_tag,
+                    content='memories', content_rowid='rowid',
+                    tokenize='porter unicode61'
+                )
+            """)
+        except sqlite3.OperationalError as e:
+            # SQLite built without FTS5: searches fall back to LIKE scans
+            logger.warning(f"⚠️ Full-text search unavailable: {e}")
+            self.fts_enabled = False
+            return
+        
+        # Emotion is indexed only for filtering; relevance comes from content alone
+        await self.conn.execute("INSERT INTO memories_fts (memories_fts, rank) VALUES ('rank', 'bm25(1.0, 0.0)')")
+        await self.conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS memories_fts_insert AFTER INSERT ON memories BEGIN
+                INSERT INTO memories_fts (rowid, content_redacted, emotion_tag)
+                VALUES (new.rowid, new.content_redacted, new.emotion_tag);
+            END
+        """)
+        await self.conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS memories_fts_delete AFTER DELETE ON memories BEGIN
+                INSERT INTO memories_fts (memories_fts, rowid, content_redacted, emotion_tag)
+                VALUES ('delete', old.rowid, old.content_redacted, old.emotion_tag);
+            END
+        """)
+        # Access-stat and merge updates leave content alone and skip the index
+        await self.conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS memories_fts_update AFTER UPDATE OF content_redacted, emotion_tag ON memories BEGIN
+                INSERT INTO memories_fts (memories_fts, rowid, content_redacted, emotion_tag)
+                VALUES ('delete', old.rowid, old.content_redacted, old.emotion_tag);
+                INSERT INTO memories_fts (rowid, content_redacted, emotion_tag)
+                VALUES (new.rowid, new.content_redacted, new.emotion_tag);
+            END
+        """)
+        
+        if not exists:
+            # Index memories stored before the search index existed
+            await self.conn.execute("INSERT INTO memories_fts (memories_fts) VALUES ('rebuild')")
+        self.fts_enabled = True
+    
+    async def _migrate_memory_columns(self):
+        """Add the content fingerprint column to older databases; consolidation backfills it"""
+        async with self.conn.execute("PRAGMA table_info(memories)") as cursor:
+            existing = {row[1] async for row in cursor}
+        if "fingerprint" not in existing:
+            await self.conn.execute("ALTER TABLE memories ADD COLUMN fingerprint INTEGER")
+    
     async def _load_memories(self):
-        """Load existing memories from database"""
-        async with self.conn.execute("SELECT * FROM memories") as cursor:
-            async for row in cursor:
-                try:
-                    memory = EmotionalMemory(
-                        id=row[0],
-                        emotion_tag=row[1],
-                        content=row[2],
-                        emotional_weight=row[3],
-                        created_at=datetime.fromisoformat(row[4]),
-                        last_accessed=datetime.fromisoformat(row[5]),
-                        access_count=row[6],
-                        decay_factor=row[7],
-                        anchors=json.loads(row[8])
-                    )
-                    self.memories[memory.id] = memory
-                except Exception as e:
-                    logger.warning(f"Failed to load memory {row[0]}: {e}")
-        
-        logger.info(f"📚 Loaded {len(self.memories)} memories from database")
+        """
+        Load the metadata of the hot working set; content stays on disk
+        
+        With ``hot_memories_per_emotion`` unset every memory is loaded.
+        Otherwise each emotion's strongest memories are paged in through the
+        rank index, along with everything accessed within the emotional-state
+        window so that ``get_emotional_state`` is complete from the start.
+        """
+        self.memories.clear()
+        self._rebuild_indexes()
+        self._emotion_cursor = {}
+        if self.hot_memories_per_emotion is None:
+            async with self.conn.execute(f"SELECT {MEMORY_METADATA_SQL} FROM memories") as cursor:
+                while True:
+                    rows = await cursor.fetchmany(self.warm_page_size)
+                    if not rows:
+                        break
+                    self._add_rows(rows)
+        else:
+            async with self.conn.execute(EMOTION_TAGS_SQL) as cursor:
+                self._emotion_cursor = {row[0]: None async for row in cursor}
+            horizon = datetime.utcnow() - timedelta(seconds=EMOTIONAL_STATE_WINDOW_SECONDS)
+            async with self.conn.execute(
+                f"SELECT {MEMORY_METADATA_SQL} FROM memories WHERE last_accessed >= ?",
+                (horizon.isoformat() + "Z",)
+            ) as cursor:
+                self._add_rows(await cursor.fetchall())
+            for tag in list(self._emotion_cursor):
+                await self._page_emotion(tag, self.hot_memories_per_emotion)
+        
+        logger.info(
+            f"📚 Loaded {len(self.memories)} memories from database "
+            f"({len(self._emotion_cursor)} emotions left to warm up)"
+        )
+    
+    def _add_rows(self, rows: List[Tuple]) -> int:
+        """Add metadata rows that are not loaded yet; returns how many were added"""
+        added = 0
+        for row in rows:
+            if row[0] in self.memories:  # Already loaded, possibly with newer access stats
+                continue
+            try:
+                memory = self.memories.add(
+                    row[0], row[1], row[2],
+                    _epoch(_parse_timestamp(row[3])),
+                    _epoch(_parse_timestamp(row[4])),
+                    row[5], row[6], row[7]
+                )
+            except Exception as e:
+                logger.warning(f"Failed to load memory {row[0]}: {e}")
+                continue
+            self._index_memory(memory)
+            added += 1
+        return added
+    
+    async def _page_emotion(self, emotion_tag: str, limit: int) -> int:
+        """
+        Load the next ``limit`` memories of an emotion in rank order
+        
+        Rows come off the rank index strongest first, after the last row
+        paged in. Loaded memories only get stronger (access refreshes them),
+        so every row still on disk ranks at or below the emotion's cursor.
+        Returns the number of memories added.
+        """
+        if emotion_tag not in self._emotion_cursor:
+            return 0
+        position = self._emotion_cursor[emotion_tag]
+        after, params = "", (emotion_tag,)
+        if position is not None:
+            after, params = "AND (emotional_weight, last_accessed, id) < (?, ?, ?)", (emotion_tag, *position[1])
+        async with self.conn.execute(f"""
+            SELECT {MEMORY_METADATA_SQL} FROM memories
+            WHERE emotion_tag = ? {after}
+            ORDER BY emotional_weight DESC, last_accessed DESC, id DESC
+            LIMIT ?
+        """, (*params, limit)) as cursor:
+            rows = await cursor.fetchall()
+        self.pages_loaded += 1
+        added = self._add_rows(rows)
+        
+        # Concurrent pages of the same emotion only ever move the cursor forward
+        if len(rows) < limit:
+            self._emotion_cursor.pop(emotion_tag, None)
+        elif emotion_tag in self._emotion_cursor:
+            last = rows[-1]
+            rank = (-last[2], -_epoch(_parse_timestamp(last[4])))
+            current = self._emotion_cursor[emotion_tag]
+            if current is None or rank > current[0]:
+                self._emotion_cursor[emotion_tag] = (rank, (last[2], last[4], last[0]))
+        return added
+    
+    async def _load_ids(self, memory_ids: List[str]) -> int:
+        """Load specific memories by primary key; returns how many were added"""
+        added = 0
+        for start in range(0, len(memory_ids), 500):
+            chunk = memory_ids[start:start + 500]
+            async with self.conn.execute(
+                f"SELECT {MEMORY_METADATA_SQL} FROM memories WHERE id IN ({', '.join('?' * len(chunk))})",
+                chunk
+            ) as cursor:
+                added += self._add_rows(await cursor.fetchall())
+        return added
+    
+    @property
+    def fully_loaded(self) -> bool:
+        """Whether every stored memory is in memory"""
+        return not self._emotion_cursor
+    
+    async def _warm_up(self):
+        """Page the remaining memories in at low priority, then reconcile recall vectors and capacity"""
+        start = time.perf_counter()
+        while self._emotion_cursor:
+            try:
+                await self._page_emotion(next(iter(self._emotion_cursor)), self.warm_page_size)
+            except Exception as e:
+                logger.error(f"❌ DreamCore warm-up page failed: {e}")
+            await asyncio.sleep(self.warm_pause_ms / 1000)
+        try:
+            await self._reconcile_vector_index()
+            await self.enforce_capacity()
+        except Exception as e:
+            logger.error(f"❌ DreamCore warm-up reconciliation failed: {e}")
+        self.warm_up_seconds = time.perf_counter() - start
+        logger.info(f"🔥 DreamCore warm-up complete: {len(self.memories)} memories in {self.warm_up_seconds:.1f}s")
     
     async def _initialize_emotional_vectors(self):
         """Initialize emotional vector space as described in research"""
@@ -217,11 +940,21 @@ class DreamCoreMemory:
             )
 
             # Store in memory and database
-            self.memories[memory_id] = memory
+            if memory_id in self.memories:
+                self._forget(memory_id)
+            row = self.memories.add(
+                memory_id, emotion_tag, emotional_weight,
+                _epoch(memory.created_at), _epoch(memory.last_accessed), 0, memory.decay_factor,
+                len(redacted_content.encode()) + len(json.dumps(anchors_data))
+            )
+            self._index_memory(row)
+            self.vector_index.add(memory_id, self._embed(emotion_tag, redacted_content))
             await self._persist_memory(memory)
 
             # Update emotional vectors
             await self._update_emotional_vectors(emotion_tag, emotional_weight)
+            
+            await self.enforce_capacity()
 
             logger.info(f"💾 Memory stored: {memory_id} ({emotion_tag})")
             return memory_id
@@ -235,39 +968,60 @@ class DreamCoreMemory:
         emotion_tag: Optional[str] = None,
         limit: int = 10
     ) -> List[Dict[str, Any]]:
-        """Retrieve memories with temporal decay consideration"""
+        """
+        Retrieve the strongest memories, optionally for one emotion
+        
+        Memories come off the per-emotion indexes strongest first (most
+        recently accessed on ties), merged across emotions when no tag is
+        given, so a call costs O(k log n) rather than a scan. Before warm-up
+        completes, an emotion whose loaded memories run out or rank below its
+        unloaded ones pages more in first. Decay is evaluated from each
+        memory's timestamps at read time and faded memories are skipped; only
+        the returned memories count as accessed.
+        """
         try:
-            # Apply temporal decay
-            await self._apply_temporal_decay()
-            
-            # Filter memories
-            filtered_memories = []
-            for memory in self.memories.values():
-                if emotion_tag is None or memory.emotion_tag == emotion_tag:
-                    # Update access count and last accessed
-                    memory.access_count += 1
-                    memory.last_accessed = datetime.utcnow()
-                    filtered_memories.append(memory)
-            
-            # Sort by emotional weight and recency
-            filtered_memories.sort(
-                key=lambda m: (m.emotional_weight, m.last_accessed.timestamp()),
-                reverse=True
-            )
+            if limit <= 0:
+                return []
+            now = datetime.utcnow()
+            now_epoch = _epoch(now)
+            if emotion_tag is None:
+                tags = list(dict.fromkeys([*self._emotion_index, *self._emotion_cursor]))
+            else:
+                tags = [emotion_tag]
             
-            # Convert to dict format
-            result = []
-            for memory in filtered_memories[:limit]:
-                result.append({
-                    "id": memory.id,
-                    "emotion_tag": memory.emotion_tag,
-                    "content": memory.content,
-                    "emotional_weight": memory.emotional_weight,
-                    "created_at": memory.created_at.isoformat(),
-                    "access_count": memory.access_count,
-                    "anchors": memory.anchors,
-                    "decay_factor": memory.decay_factor
-                })
+            # Each emotion's best live entry, merged through a heap of heads
+            heads = []
+            for tag in tags:
+                entry = await self._emotion_head(tag, now_epoch)
+                if entry is not None:
+                    heads.append((entry, tag))
+            heapq.heapify(heads)
+            
+            filtered_memories: List[MemoryRow] = []
+            selected = set()
+            while heads and len(filtered_memories) < limit:
+                entry, tag = heapq.heappop(heads)
+                # Paging while other heads were read may have moved this one
+                current = await self._emotion_head(tag, now_epoch)
+                if current != entry:
+                    if current is not None:
+                        heapq.heappush(heads, (current, tag))
+                    continue
+                heapq.heappop(self._emotion_index[tag])
+                memory_id = entry[2]
+                if memory_id not in selected:
+                    selected.add(memory_id)
+                    filtered_memories.append(self.memories[memory_id])
+                entry = await self._emotion_head(tag, now_epoch)
+                if entry is not None:
+                    heapq.heappush(heads, (entry, tag))
+            
+            for memory in filtered_memories:
+                self._touch(memory, now)
+            if len(self._dirty) >= self.flush_batch_size:
+                await self.flush_access_stats()
+            
+            result = [self._memory_dict(memory, now) for memory in await self._materialize(filtered_memories)]
             
             logger.info(f"🔍 Retrieved {len(result)} memories")
             return result
@@ -276,26 +1030,87 @@ class DreamCoreMemory:
             logger.error(f"❌ Memory retrieval failed: {e}")
             raise
     
+    async def recall_similar(
+        self,
+        text: str,
+        k: int = 10,
+        emotion_tag: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Recall the ``k`` memories most similar to a piece of text
+        
+        The text is embedded like stored memories (hashed words, plus the
+        emotion vector when ``emotion_tag`` is given) and matched by cosine
+        similarity over the vector index. Hits not loaded yet are read by
+        primary key. Faded memories are skipped; the returned ones count as
+        accessed.
+        """
+        if k <= 0:
+            raise ValueError("k must be positive")
+        try:
+            now = datetime.utcnow()
+            now_epoch = _epoch(now)
+            query = self._embed(emotion_tag, text)
+            
+            # Over-fetch until enough live memories turn up
+            fetch = k
+            while True:
+                hits = self.vector_index.search(query, fetch)
+                if not self.fully_loaded:
+                    await self._load_ids([memory_id for memory_id, _ in hits if memory_id not in self.memories])
+                recalled = [
+                    (self.memories[memory_id], similarity) for memory_id, similarity in hits
+                    if memory_id in self.memories
+                    and self.memories[memory_id].expires_at(self.decay_threshold) >= now_epoch
+                ][:k]
+                if len(recalled) == k or len(hits) < fetch:
+                    break
+                fetch *= 4
+            
+            for memory, _ in recalled:
+                self._touch(memory, now)
+            if len(self._dirty) >= self.flush_batch_size:
+                await self.flush_access_stats()
+            
+            similarities = {memory.id: similarity for memory, similarity in recalled}
+            result = []
+            for memory in await self._materialize([memory for memory, _ in recalled]):
+                entry = self._memory_dict(memory, now)
+                entry["similarity"] = similarities[memory.id]
+                result.append(entry)
+            
+            logger.info(f"🔍 Recalled {len(result)} similar memories")
+            return result
+            
+        except Exception as e:
+            logger.error(f"❌ Memory recall failed: {e}")
+            raise
+    
     async def get_emotional_state(self) -> Dict[str, float]:
-        """Get current emotional state based on recent memories"""
+        """
+        Get current emotional state based on recent memories
+        
+        Each emotion's share of the summed weight of memories accessed in the
+        last hour, read from rolling aggregates in O(#emotions).
+        """
         try:
-            recent_memories = [
-                m for m in self.memories.values()
-                if (datetime.utcnow() - m.last_accessed).total_seconds() < 3600  # Last hour
-            ]
+            totals = self._recent_activity.get_totals()
+            recent = {
+                field[len("weight:"):]: weight
+                for field, weight in totals.items()
+                if field.startswith("weight:") and totals.get("count:" + field[len("weight:"):], 0) > 0
+            }
             
-            if not recent_memories:
+            if not recent:
                 return {"neutral": 1.0}
             
             # Calculate emotional state
             emotional_state = {}
-            total_weight = sum(m.emotional_weight for m in recent_memories)
+            total_weight = sum(recent.values())
             
             if total_weight > 0:
-                for memory in recent_memories:
-                    emotion = memory.emotion_tag
-                    weight = memory.emotional_weight / total_weight
-                    emotional_state[emotion] = emotional_state.get(emotion, 0) + weight
+                for emotion, weight in recent.items():
+                    emotional_state[emotion] = weight / total_weight
             
             return emotional_state
             
@@ -303,6 +1118,325 @@ class DreamCoreMemory:
             logger.error(f"❌ Emotional state calculation failed: {e}")
             return {"error": 1.0}
     
+    async def search_memories(
+        self,
+        query: str,
+        emotion_tag: Optional[str] = None,
+        limit: int = 10,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Full-text search over memory content, best first
+        
+        Every word of ``query`` must occur (stemmed, case-insensitive). The
+        most recently stored ``SEARCH_CANDIDATES`` matches (all of them for
+        selective queries) are ranked by ``bm25 * (0.5 + 0.5 * weight) *
+        strength``, with strength decayed as in ``EmotionalMemory.strength``,
+        and faded memories are left out. Matching and ranking run inside
+        SQLite on the full-text index, so only the page reaches Python. Pass ``next_cursor`` back
+        with the same query to continue; it pins the decay clock so pages
+        rank consistently. Returned memories count as accessed.
+        """
+        if not 0 < limit <= MAX_SEARCH_LIMIT:
+            raise ValueError(f"limit must be between 1 and {MAX_SEARCH_LIMIT}")
+        words = _SEARCH_TOKEN.findall(query or "")
+        if not words:
+            raise ValueError("query must contain at least one word")
+        try:
+            position = self._decode_search_cursor(cursor) if cursor else None
+            now_epoch = position[0] if position else time.time()
+            
+            params: List[Any] = []
+            if self.fts_enabled:
+                # Quote each word so user input never parses as FTS5 query syntax
+                match = "content_redacted : (" + " ".join(f'"{word}"' for word in words) + ")"
+                if emotion_tag:
+                    match = 'emotion_tag : "' + emotion_tag.replace('"', '""') + '" AND ' + match
+                # Scoring only a window of matches keeps broad queries from computing BM25 for every row
+                candidates = "SELECT rowid, -rank AS relevance FROM memories_fts WHERE memories_fts MATCH ? ORDER BY rowid DESC LIMIT ?"
+                params.append(match)
+            else:
+                candidates = (
+                    "SELECT rowid, 1.0 AS relevance FROM memories WHERE "
+                    + " AND ".join("content_redacted LIKE ?" for _ in words) + " ORDER BY rowid DESC LIMIT ?"
+                )
+                params.extend(f"%{word}%" for word in words)
+            params.extend([SEARCH_CANDIDATES, now_epoch / SECONDS_PER_DAY + UNIX_EPOCH_JULIAN_DAY])
+            
+            conditions = ["strength >= ?"]
+            params.append(self.decay_threshold)
+            if emotion_tag:
+                conditions.append("emotion_tag = ?")
+                params.append(emotion_tag)
+            if position:
+                conditions.append("(score < ? OR (score = ? AND position < ?))")
+                params.extend([position[1], position[1], position[2]])
+            
+            # One extra row tells whether another page exists
+            async with self.conn.execute(f"""
+                WITH candidates AS ({candidates}),
+                decayed AS (
+                    SELECT m.rowid AS position, m.id, m.emotion_tag, m.content_redacted, m.emotional_weight,
+                           m.created_at, m.last_accessed, m.access_count, m.decay_factor, m.anchors, c.relevance,
+                           pow(m.decay_factor, MAX(0.0, ? - julianday(m.last_accessed)) / (MAX(m.emotional_weight, 0.0) + 0.1))
+                               AS strength
+                    FROM candidates c JOIN memories m ON m.rowid = c.rowid
+                ),
+                scored AS (
+                    SELECT *, relevance * (0.5 + 0.5 * MIN(MAX(emotional_weight, 0.0), 1.0)) * strength AS score
+                    FROM decayed
+                )
+                SELECT position, id, emotion_tag, content_redacted, emotional_weight, created_at, last_accessed,
+                       access_count, decay_factor, anchors, relevance, score
+                FROM scored
+                WHERE {' AND '.join(conditions)}
+                ORDER BY score DESC, position DESC
+                LIMIT ?
+            """, params + [limit + 1]) as db_cursor:
+                rows = await db_cursor.fetchall()
+            
+            now = datetime.utcnow()
+            memories = []
+            for row in rows[:limit]:
+                memory = EmotionalMemory(
+                    id=row[1],
+                    emotion_tag=row[2],
+                    content=row[3],
+                    anchors=json.loads(row[9]),
+                    emotional_weight=row[4],
+                    created_at=_parse_timestamp(row[5]),
+                    last_accessed=_parse_timestamp(row[6]),
+                    access_count=row[7],
+                    decay_factor=row[8]
+                )
+                entry = self._memory_dict(memory, now)
+                entry["relevance"] = row[10]
+                entry["score"] = row[11]
+                memories.append(entry)
+                loaded = self.memories.get(memory.id)
+                if loaded is not None:
+                    self._touch(loaded, now)
+            if len(self._dirty) >= self.flush_batch_size:
+                await self.flush_access_stats()
+            self.searches += 1
+            
+            next_cursor = None
+            if len(rows) > limit:
+                last = rows[limit - 1]
+                next_cursor = self._encode_search_cursor(now_epoch, last[11], last[0])
+            
+            logger.info(f"🔎 Found {len(memories)} memories for search")
+            return {"memories": memories, "next_cursor": next_cursor}
+            
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error(f"❌ Memory search failed: {e}")
+            raise
+    
+    @staticmethod
+    def _encode_search_cursor(now: float, score: float, rowid: int) -> str:
+        return base64.urlsafe_b64encode(json.dumps([now, score, rowid]).encode()).decode()
+    
+    @staticmethod
+    def _decode_search_cursor(cursor: str) -> Tuple[float, float, int]:
+        try:
+            now, score, rowid = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (ValueError, TypeError) as e:
+            raise ValueError("Invalid cursor") from e
+        if not (isinstance(now, (int, float)) and isinstance(score, (int, float)) and isinstance(rowid, int)):
+            raise ValueError("Invalid cursor")
+        return float(now), float(score), rowid
+    
+    async def _materialize(self, rows: List[MemoryRow]) -> List[EmotionalMemory]:
+        """Full memories for the given rows, reading content and anchors from the database"""
+        stored: Dict[str, Tuple[str, str]] = {}
+        ids = [row.id for row in rows]
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            async with self.conn.execute(
+                f"SELECT id, content_redacted, anchors FROM memories WHERE id IN ({', '.join('?' * len(chunk))})",
+                chunk
+            ) as cursor:
+                async for memory_id, content, anchors in cursor:
+                    stored[memory_id] = (content, anchors)
+        
+        return [
+            EmotionalMemory(
+                id=row.id,
+                emotion_tag=row.emotion_tag,
+                content=stored[row.id][0],
+                anchors=json.loads(stored[row.id][1]),
+                emotional_weight=row.emotional_weight,
+                created_at=row.created_at,
+                last_accessed=row.last_accessed,
+                access_count=row.access_count,
+                decay_factor=row.decay_factor
+            )
+            for row in rows if row.id in stored
+        ]
+    
+    def _memory_dict(self, memory: EmotionalMemory, now: datetime) -> Dict[str, Any]:
+        return {
+            "id": memory.id,
+            "emotion_tag": memory.emotion_tag,
+            "content": memory.content,
+            "emotional_weight": memory.emotional_weight,
+            "created_at": memory.created_at.isoformat(),
+            "access_count": memory.access_count,
+            "anchors": memory.anchors,
+            "decay_factor": memory.decay_factor,
+            "strength": memory.strength(now)
+        }
+    
+    def _embed(self, emotion_tag: Optional[str], content: str) -> np.ndarray:
+        """Unit-length recall vector: hashed words, then the weighted emotion vector"""
+        vector = np.zeros(RECALL_TEXT_DIM + 10, dtype=np.float32)
+        vector[:RECALL_TEXT_DIM] = hashed_embedding(content, RECALL_TEXT_DIM)
+        if emotion_tag in self.emotional_vectors:
+            vector[RECALL_TEXT_DIM:] = self.emotional_vectors[emotion_tag] * RECALL_EMOTION_WEIGHT
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+    
+    async def _load_vector_index(self):
+        """Map the saved recall vectors and reconcile them with the loaded memories"""
+        index = VectorIndex.load(self.vector_path, **self._vector_options)
+        if index is not None and index.dim == self.vector_index.dim:
+            self.vector_index = index
+        await self._reconcile_vector_index()
+    
+    async def _reconcile_vector_index(self):
+        """Embed loaded memories missing from the recall index; drop stale vectors once all are loaded"""
+        stale = []
+        if self.fully_loaded:
+            stale = [memory_id for memory_id in self.vector_index.ids if memory_id not in self.memories]
+        for memory_id in stale:
+            self.vector_index.remove(memory_id)
+        missing = [memory_id for memory_id in self.memories if memory_id not in self.vector_index]
+        for start in range(0, len(missing), 500):
+            chunk = missing[start:start + 500]
+            async with self.conn.execute(
+                f"SELECT id, emotion_tag, content_redacted FROM memories WHERE id IN ({', '.join('?' * len(chunk))})",
+                chunk
+            ) as cursor:
+                async for memory_id, emotion_tag, content in cursor:
+                    self.vector_index.add(memory_id, self._embed(emotion_tag, content))
+        
+        logger.info(
+            f"🧭 Recall index ready: {len(self.vector_index)} vectors "
+            f"({len(missing)} embedded, {len(stale)} dropped)"
+        )
+    
+    def _footprint(self, memory: MemoryRow) -> int:
+        """Approximate stored size of a memory in bytes"""
+        return memory.stored_bytes + len(memory.emotion_tag) + MEMORY_ROW_OVERHEAD_BYTES
+    
+    def _forget(self, memory_id: str) -> bool:
+        """Drop a memory from the in-memory store and every index"""
+        memory = self.memories.get(memory_id)
+        if memory is None:
+            return False
+        self._unindex_memory(memory)
+        self.vector_index.remove(memory_id)
+        self._dirty.discard(memory_id)
+        self.memories.remove(memory_id)
+        return True
+    
+    def _index_key(self, memory: MemoryRow) -> Tuple[float, float, str]:
+        return (-memory.emotional_weight, -memory.accessed_epoch, memory.id)
+    
+    def _index_top(self, emotion_tag: str, now: float) -> Optional[Tuple[float, float, str]]:
+        """Best live entry for an emotion, discarding stale and faded ones on the way"""
+        heap = self._emotion_index.get(emotion_tag)
+        while heap:
+            entry = heap[0]
+            memory = self.memories.get(entry[2])
+            if memory is not None and self._index_key(memory) == entry:
+                if memory.expires_at(self.decay_threshold) >= now:
+                    return entry
+            heapq.heappop(heap)
+        return None
+    
+    async def _emotion_head(self, emotion_tag: str, now: float) -> Optional[Tuple[float, float, str]]:
+        """
+        Best live entry for an emotion, paging memories in until it provably ranks first
+        
+        An entry is safe once it ranks strictly above the emotion's cursor,
+        since every unloaded memory ranks at or below it.
+        """
+        entry = self._index_top(emotion_tag, now)
+        while emotion_tag in self._emotion_cursor:
+            position = self._emotion_cursor[emotion_tag]
+            if entry is not None and position is not None and entry[:2] < position[0]:
+                break
+            await self._page_emotion(emotion_tag, self.warm_page_size)
+            entry = self._index_top(emotion_tag, now)
+        return entry
+    
+    def _recent_fields(self, memory: MemoryRow, sign: int) -> Dict[str, float]:
+        return {
+            "weight:" + memory.emotion_tag: sign * memory.emotional_weight,
+            "count:" + memory.emotion_tag: sign
+        }
+    
+    def _index_memory(self, memory: MemoryRow):
+        """Add a memory to its emotion index and the aggregates"""
+        heapq.heappush(self._emotion_index.setdefault(memory.emotion_tag, []), self._index_key(memory))
+        self.emotion_counts[memory.emotion_tag] += 1
+        self.emotion_weights[memory.emotion_tag] += memory.emotional_weight
+        self.memory_bytes += self._footprint(memory)
+        self._recent_activity.add(self._recent_fields(memory, 1), memory.accessed_epoch)
+    
+    def _unindex_memory(self, memory: MemoryRow):
+        """Take a removed memory out of the aggregates; its heap entries go stale"""
+        tag = memory.emotion_tag
+        self.emotion_counts[tag] -= 1
+        self.emotion_weights[tag] -= memory.emotional_weight
+        if self.emotion_counts[tag] <= 0:
+            del self.emotion_counts[tag]
+            del self.emotion_weights[tag]
+        self.memory_bytes -= self._footprint(memory)
+        self._recent_activity.add(self._recent_fields(memory, -1), memory.accessed_epoch)
+    
+    def _touch(self, memory: MemoryRow, now: datetime):
+        """Record an access and re-key the memory in every index"""
+        self._recent_activity.add(self._recent_fields(memory, -1), memory.accessed_epoch)
+        memory.access_count += 1
+        memory.last_accessed = now
+        self._dirty.add(memory.id)
+        self._recent_activity.add(self._recent_fields(memory, 1), _epoch(now))
+        
+        heap = self._emotion_index[memory.emotion_tag]
+        heapq.heappush(heap, self._index_key(memory))
+        # Rebuild an emotion's heap once superseded entries dominate it
+        if len(heap) > 2 * self.emotion_counts[memory.emotion_tag] + 64:
+            self._emotion_index[memory.emotion_tag] = heap = [
+                entry for entry in heap
+                if entry[2] in self.memories and self._index_key(self.memories[entry[2]]) == entry
+            ]
+            heapq.heapify(heap)
+    
+    def _rebuild_indexes(self):
+        """Build the emotion indexes and aggregates from loaded memories"""
+        self._emotion_index = {}
+        self.emotion_counts.clear()
+        self.emotion_weights.clear()
+        self.memory_bytes = 0
+        self._recent_activity = TimeWindow(EMOTIONAL_STATE_WINDOW_SECONDS)
+        
+        horizon = time.time() - EMOTIONAL_STATE_WINDOW_SECONDS
+        for memory in self.memories.values():
+            self._emotion_index.setdefault(memory.emotion_tag, []).append(self._index_key(memory))
+            self.emotion_counts[memory.emotion_tag] += 1
+            self.emotion_weights[memory.emotion_tag] += memory.emotional_weight
+            self.memory_bytes += self._footprint(memory)
+            accessed = memory.accessed_epoch
+            if accessed > horizon:
+                self._recent_activity.add(self._recent_fields(memory, 1), accessed)
+        
+        for heap in self._emotion_index.values():
+            heapq.heapify(heap)
+    
     def _generate_memory_id(self, content: str) -> str:
         """Generate unique memory ID"""
         hash_input = f"{content}{datetime.utcnow().isoformat()}"
@@ -349,11 +1483,17 @@ class DreamCoreMemory:
         return anchors
     
     async def _persist_memory(self, memory: EmotionalMemory):
-        """Persist memory to database"""
+        """Persist memory to database (an upsert, so the search index triggers see replacements)"""
         await self.conn.execute("""
-            INSERT OR REPLACE INTO memories 
-            (id, emotion_tag, content_redacted, emotional_weight, created_at, last_accessed, access_count, decay_factor, anchors)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            INSERT INTO memories 
+            (id, emotion_tag, content_redacted, emotional_weight, created_at, last_accessed, access_count, decay_factor, anchors,
+             fingerprint)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (id) DO UPDATE SET
+                emotion_tag = excluded.emotion_tag, content_redacted = excluded.content_redacted,
+                emotional_weight = excluded.emotional_weight, created_at = excluded.created_at,
+                last_accessed = excluded.last_accessed, access_count = excluded.access_count,
+                decay_factor = excluded.decay_factor, anchors = excluded.anchors, fingerprint = excluded.fingerprint
         """, (
             memory.id,
             memory.emotion_tag,
@@ -363,7 +1503,8 @@ class DreamCoreMemory:
             memory.last_accessed.isoformat() + "Z",
             memory.access_count,
             memory.decay_factor,
-            json.dumps(memory.anchors)
+            json.dumps(memory.anchors),
+            _fingerprint(memory.content)
         ))
         
         await self.conn.commit()
@@ -402,34 +1543,643 @@ class DreamCoreMemory:
         redacted = re.sub(r'\b[A-Za-z0-9]{32,}\b', '[TOKEN_REDACTED]', redacted)
         return redacted
     
-    async def _apply_temporal_decay(self):
-        """Apply temporal decay to memories"""
-        current_time = datetime.utcnow()
-        decayed_memories = []
+    async def flush_access_stats(self) -> int:
+        """
+        Write pending access counts and times in one ``executemany`` transaction
+        
+        Values are captured when the flush starts; memories touched while it
+        runs are written by the next one, and a failed flush keeps its ids
+        pending. Returns the number of memories written.
+        """
+        if not self._dirty or self.conn is None:
+            return 0
+        
+        dirty, self._dirty = self._dirty, set()
+        rows = [
+            (memory.access_count, memory.last_accessed.isoformat() + "Z", memory.id)
+            for memory in map(self.memories.get, dirty)
+            if memory is not None  # Swept since it was touched
+        ]
+        start = time.perf_counter()
+        try:
+            cursor = await self.conn.executemany(
+                "UPDATE memories SET access_count = ?, last_accessed = ? WHERE id = ?", rows
+            )
+            await cursor.close()
+            await self.conn.commit()
+        except Exception:
+            self._dirty |= dirty
+            raise
+        
+        self.flush_sizes.append(len(rows))
+        self.flush_latency_ms.append((time.perf_counter() - start) * 1000)
+        self.rows_flushed += len(rows)
+        return len(rows)
+    
+    async def _periodic_flush(self):
+        """Periodically write back access stats of touched memories and buffered traces"""
+        while True:
+            await asyncio.sleep(self.flush_interval_ms / 1000)
+            try:
+                await self.flush_access_stats()
+            except Exception as e:
+                logger.error(f"❌ Access stats flush failed: {e}")
+            try:
+                await self.flush_traces()
+            except Exception as e:
+                logger.error(f"❌ Trace flush failed: {e}")
+    
+    def get_memory_stats(self) -> Dict[str, Any]:
+        """Get memory counts per emotion, decay sweep, write-back, capacity, warm-up, trace, search and consolidation statistics"""
+        return {
+            "memories": len(self.memories),
+            "emotions": {
+                emotion: {"count": count, "total_weight": self.emotion_weights[emotion]}
+                for emotion, count in self.emotion_counts.items()
+            },
+            "memories_expired": self.memories_expired,
+            "write_back": {
+                "pending": len(self._dirty),
+                "flushes": self.flush_sizes.lifetime_count,
+                "rows_flushed": self.rows_flushed,
+                "flush_size": {
+                    "mean": self.flush_sizes.mean,
+                    "ewma": self.flush_sizes.ewma or 0.0
+                },
+                "flush_latency_ms": {
+                    "mean": self.flush_latency_ms.mean,
+                    "ewma": self.flush_latency_ms.ewma or 0.0
+                },
+                "flush_interval_ms": self.flush_interval_ms,
+                "flush_batch_size": self.flush_batch_size
+            },
+            "recall_index": self.vector_index.get_stats(),
+            "capacity": {
+                "max_memories": self.max_memories,
+                "max_bytes": self.max_bytes,
+                "bytes": self.memory_bytes,
+                "column_bytes": self.memories.nbytes,
+                "eviction_low_water": self.eviction_low_water,
+                "memories_evicted": self.memories_evicted,
+                "bytes_evicted": self.bytes_evicted,
+                "eviction_runs": self.eviction_runs,
+                "last_eviction_ms": self.last_eviction_ms
+            },
+            "loading": {
+                "fully_loaded": self.fully_loaded,
+                "emotions_pending": len(self._emotion_cursor),
+                "pages_loaded": self.pages_loaded,
+                "warm_up_seconds": self.warm_up_seconds,
+                "hot_memories_per_emotion": self.hot_memories_per_emotion
+            },
+            "traces": {
+                "ingested": self.traces_ingested,
+                "written": self.traces_written,
+                "pending": len(self._trace_buffer),
+                "commits": self.trace_commit_sizes.lifetime_count,
+                "commit_size": {
+                    "mean": self.trace_commit_sizes.mean,
+                    "ewma": self.trace_commit_sizes.ewma or 0.0
+                },
+                "commit_latency_ms": {
+                    "mean": self.trace_commit_latency_ms.mean,
+                    "ewma": self.trace_commit_latency_ms.ewma or 0.0
+                },
+                "minutes_cached": len(self._trace_minutes),
+                "trace_batch_size": self.trace_batch_size
+            },
+            "search": {
+                "fts_enabled": self.fts_enabled,
+                "searches": self.searches
+            },
+            "consolidation": {
+                "cycles": self.consolidation_cycles,
+                "passes": self.consolidation_passes,
+                "memories_merged": self.memories_consolidated,
+                "clusters_merged": self.clusters_consolidated,
+                "last_cycle_ms": self.last_consolidation_ms,
+                "position": self._consolidation_rowid,
+                "budget_ms": self.consolidation_budget_ms
+            }
+        }
+    
+    async def record_traces(self, traces: List[Dict[str, Any]]) -> int:
+        """
+        Ingest wake-state traces
+        
+        Each trace has a ``trigger_event``, an ``emotional_response``, an
+        optional ``cognitive_state`` (stored as JSON unless already a
+        string), ``timestamp`` (default now) and ``memory_id``. The batch is
+        validated as a whole, folded into the minute aggregates and
+        buffered; a group commit runs once ``trace_batch_size`` traces are
+        pending. A ``memory_id`` that no longer exists when the traces are
+        written is stored as NULL. Returns the number of traces accepted.
+        """
+        now = datetime.utcnow()
+        rows = []
+        minutes = []
+        for trace in traces:
+            trigger_event = trace.get("trigger_event")
+            if not isinstance(trigger_event, str) or not trigger_event:
+                raise ValueError("trigger_event must be a non-empty string")
+            try:
+                response = float(trace["emotional_response"])
+            except (KeyError, TypeError, ValueError):
+                raise ValueError("emotional_response must be a number")
+            if not math.isfinite(response):
+                raise ValueError("emotional_response must be finite")
+            state = trace.get("cognitive_state", {})
+            memory_id = trace.get("memory_id")
+            if memory_id is not None and not isinstance(memory_id, str):
+                raise ValueError("memory_id must be a string")
+            timestamp = trace.get("timestamp") or now
+            if isinstance(timestamp, str):
+                timestamp = _parse_timestamp(timestamp)
+            elif not isinstance(timestamp, datetime):
+                raise ValueError("timestamp must be an ISO string or datetime")
+            elif timestamp.tzinfo is not None:
+                timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+            minutes.append(int(_epoch(timestamp) // TRACE_BUCKET_SECONDS))
+            rows.append((
+                uuid.uuid4().hex,
+                trigger_event,
+                response,
+                state if isinstance(state, str) else json.dumps(state),
+                timestamp.isoformat() + "Z",
+                memory_id
+            ))
+        
+        horizon = int(_epoch(now) // TRACE_BUCKET_SECONDS) - self.trace_retention_minutes
+        for minute, row in zip(minutes, rows):
+            for memory_id in ("", row[5]) if row[5] else ("",):
+                self._trace_deltas.setdefault((minute, memory_id), TraceBucket()).add(row[2])
+                if minute >= horizon:
+                    self._trace_minutes.setdefault(minute, {}).setdefault(memory_id, TraceBucket()).add(row[2])
+        self._trace_buffer.extend(rows)
+        self.traces_ingested += len(rows)
+        
+        if len(self._trace_buffer) >= self.trace_batch_size:
+            await self.flush_traces()
+        return len(rows)
+    
+    async def flush_traces(self) -> int:
+        """
+        Write buffered traces and their minute aggregates in one transaction
+        
+        Traces go in with one ``executemany``; aggregate deltas are added to
+        ``wake_trace_minutes`` with an upsert. A failed commit puts both back
+        for the next flush. Returns the number of traces written.
+        """
+        if self.conn is None or not (self._trace_buffer or self._trace_deltas):
+            return 0
         
-        for memory_id, memory in list(self.memories.items()):
-            # Calculate decay based on time and emotional weight
-            time_delta = current_time - memory.last_accessed
-            days_since_access = time_delta.total_seconds() / (24 * 3600)
+        rows, self._trace_buffer = self._trace_buffer, []
+        deltas, self._trace_deltas = self._trace_deltas, {}
+        start = time.perf_counter()
+        try:
+            cursor = await self.conn.executemany("""
+                INSERT INTO wake_state_traces (id, trigger_event, emotional_response, cognitive_state, timestamp, memory_id)
+                SELECT ?, ?, ?, ?, ?, (SELECT id FROM memories WHERE id = ?)
+            """, rows)
+            await cursor.close()
+            cursor = await self.conn.executemany("""
+                INSERT INTO wake_trace_minutes (memory_id, minute, trace_count, response_sum, response_min, response_max)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (memory_id, minute) DO UPDATE SET
+                    trace_count = trace_count + excluded.trace_count,
+                    response_sum = response_sum + excluded.response_sum,
+                    response_min = MIN(response_min, excluded.response_min),
+                    response_max = MAX(response_max, excluded.response_max)
+            """, [
+                (memory_id, minute, bucket.count, bucket.response_sum, bucket.response_min, bucket.response_max)
+                for (minute, memory_id), bucket in deltas.items()
+            ])
+            await cursor.close()
+            await self.conn.commit()
+        except Exception:
+            self._trace_buffer[:0] = rows
+            for key, bucket in deltas.items():
+                self._trace_deltas.setdefault(key, TraceBucket()).merge(bucket)
+            raise
+        
+        # Minutes that aged out of retention are answered from the table
+        horizon = int(time.time() // TRACE_BUCKET_SECONDS) - self.trace_retention_minutes
+        for minute in [minute for minute in self._trace_minutes if minute < horizon]:
+            del self._trace_minutes[minute]
+        
+        if rows:
+            self.trace_commit_sizes.append(len(rows))
+            self.trace_commit_latency_ms.append((time.perf_counter() - start) * 1000)
+            self.traces_written += len(rows)
+        return len(rows)
+    
+    async def get_trace_aggregates(
+        self,
+        start: Optional[Any] = None,
+        end: Optional[Any] = None,
+        memory_id: Optional[str] = None,
+        bucket_minutes: int = 1
+    ) -> Dict[str, Any]:
+        """
+        Aggregated wake-state traces over [start, end), one entry per non-empty bucket
+        
+        ``start``/``end`` are datetimes or ISO timestamps (default: the last
+        hour), widened to whole minutes; ``memory_id`` restricts the
+        result to traces of one memory. Minutes within retention come from
+        the in-memory aggregates, older ones from ``wake_trace_minutes``, so
+        raw traces are never scanned.
+        """
+        if bucket_minutes <= 0:
+            raise ValueError("bucket_minutes must be positive")
+        end = _parse_timestamp(end) if isinstance(end, str) else (end or datetime.utcnow())
+        start = _parse_timestamp(start) if isinstance(start, str) else (start or end - timedelta(hours=1))
+        first = int(_epoch(start) // TRACE_BUCKET_SECONDS)
+        last = int(-(-_epoch(end) // TRACE_BUCKET_SECONDS))
+        if last <= first:
+            raise ValueError("end must be after start")
+        if -(-(last - first) // bucket_minutes) > MAX_TRACE_QUERY_BUCKETS:
+            raise ValueError(f"Query spans more than {MAX_TRACE_QUERY_BUCKETS} buckets")
+        
+        key = memory_id or ""
+        minutes: Dict[int, TraceBucket] = {}
+        horizon = int(time.time() // TRACE_BUCKET_SECONDS) - self.trace_retention_minutes
+        if first < horizon:
+            await self.flush_traces()
+            async with self.conn.execute("""
+                SELECT minute, trace_count, response_sum, response_min, response_max FROM wake_trace_minutes
+                WHERE memory_id = ? AND minute >= ? AND minute < ?
+            """, (key, first, min(last, horizon))) as cursor:
+                async for minute, *values in cursor:
+                    minutes[minute] = TraceBucket(*values)
+        recent = range(max(first, horizon), last)
+        if len(recent) > len(self._trace_minutes):
+            recent = [minute for minute in self._trace_minutes if minute in recent]
+        for minute in recent:
+            bucket = self._trace_minutes.get(minute, {}).get(key)
+            if bucket is not None:
+                minutes[minute] = bucket
+        
+        totals = TraceBucket()
+        buckets: Dict[int, TraceBucket] = {}
+        for minute in sorted(minutes):
+            bucket = minutes[minute]
+            totals.merge(bucket)
+            buckets.setdefault((minute - first) // bucket_minutes, TraceBucket()).merge(bucket)
+        return {
+            "start": _from_epoch(first * TRACE_BUCKET_SECONDS).isoformat() + "Z",
+            "end": _from_epoch(last * TRACE_BUCKET_SECONDS).isoformat() + "Z",
+            "memory_id": memory_id,
+            "bucket_minutes": bucket_minutes,
+            "totals": totals.to_dict(),
+            "buckets": [
+                {
+                    "start": _from_epoch((first + index * bucket_minutes) * TRACE_BUCKET_SECONDS).isoformat() + "Z",
+                    **bucket.to_dict()
+                }
+                for index, bucket in sorted(buckets.items())
+            ]
+        }
+    
+    async def _load_trace_aggregates(self):
+        """Cache the persisted minute aggregates that fall within trace retention"""
+        horizon = int(time.time() // TRACE_BUCKET_SECONDS) - self.trace_retention_minutes
+        self._trace_minutes = {}
+        async with self.conn.execute("""
+            SELECT minute, memory_id, trace_count, response_sum, response_min, response_max
+            FROM wake_trace_minutes WHERE minute >= ?
+        """, (horizon,)) as cursor:
+            async for minute, memory_id, *values in cursor:
+                self._trace_minutes.setdefault(minute, {})[memory_id] = TraceBucket(*values)
+    
+    async def _detach_traces(self, memory_ids: List[str]):
+        """Clear trace references to memories about to be deleted"""
+        cursor = await self.conn.executemany(
+            "UPDATE wake_state_traces SET memory_id = NULL WHERE memory_id = ?",
+            [(memory_id,) for memory_id in memory_ids]
+        )
+        await cursor.close()
+    
+    async def _periodic_consolidation(self):
+        """Periodically run a bounded consolidation cycle"""
+        while True:
+            await asyncio.sleep(self.consolidation_interval_seconds)
+            try:
+                await self.consolidate()
+            except Exception as e:
+                logger.error(f"❌ Memory consolidation failed: {e}")
+    
+    async def consolidate(self, budget_ms: Optional[float] = None) -> Dict[str, int]:
+        """
+        Run one consolidation ("dream") cycle, merging duplicate memories
+        
+        Memories are read in rowid order from the saved position, a page at a
+        time, while another page plus rewriting the duplicates found so far
+        is expected to fit in ``budget_ms`` (default
+        ``consolidation_budget_ms``); at least one page is read per cycle. Each page's
+        memories are clustered with every stored memory of the same emotion
+        and content fingerprint (SimHash, so case, spacing and digit runs are
+        ignored), and fingerprints missing from older rows are backfilled on
+        the way. The oldest memory of a cluster absorbs the rest; see
+        ``_merge_clusters``. After the last page the next cycle starts a new
+        pass. Runs only once every memory is loaded. Returns the number of
+        memories scanned and merged away.
+        """
+        result = {"scanned": 0, "merged": 0}
+        if self.conn is None or not self.fully_loaded:
+            return result
+        
+        start = time.perf_counter()
+        deadline = start + (self.consolidation_budget_ms if budget_ms is None else budget_ms) / 1000
+        position = self._consolidation_rowid
+        clusters: Dict[str, List[str]] = {}
+        merged_away: Set[str] = set()
+        pages = 0
+        while True:
+            page_start = time.perf_counter()
+            async with self.conn.execute("""
+                SELECT rowid, id, emotion_tag, fingerprint,
+                       CASE WHEN fingerprint IS NULL THEN content_redacted END
+                FROM memories WHERE rowid > ? ORDER BY rowid LIMIT ?
+            """, (position, self.consolidation_page_size)) as cursor:
+                rows = await cursor.fetchall()
+            if not rows:
+                position = 0
+                self.consolidation_passes += 1
+                break
             
-            # Decay formula from research: stronger emotions decay slower
-            decay_rate = memory.decay_factor ** (days_since_access / (memory.emotional_weight + 0.1))
+            keys = set()
+            backfill = []
+            for _, memory_id, emotion_tag, fingerprint, content in rows:
+                if fingerprint is None:
+                    fingerprint = _fingerprint(content)
+                    backfill.append((fingerprint, memory_id))
+                keys.add((emotion_tag, fingerprint))
+            if backfill:
+                # Visible to this connection's queries before the cycle commits
+                cursor = await self.conn.executemany("UPDATE memories SET fingerprint = ? WHERE id = ?", backfill)
+                await cursor.close()
             
-            if decay_rate < 0.1:  # Memory has decayed too much
-                decayed_memories.append(memory_id)
-            else:
-                # Update decay factor
-                memory.decay_factor = decay_rate
-        
-        # Remove decayed memories
-        for memory_id in decayed_memories:
-            del self.memories[memory_id]
-            # Remove from database
-            await self.conn.execute("DELETE FROM memories WHERE id = ?", (memory_id,))
+            fingerprints = sorted({fingerprint for _, fingerprint in keys})
+            groups: Dict[Tuple[str, int], List[str]] = {}
+            async with self.conn.execute(f"""
+                SELECT id, emotion_tag, fingerprint FROM memories
+                WHERE fingerprint IN ({', '.join('?' * len(fingerprints))}) ORDER BY rowid
+            """, fingerprints) as cursor:
+                async for memory_id, emotion_tag, fingerprint in cursor:
+                    if (emotion_tag, fingerprint) in keys and memory_id not in merged_away:
+                        groups.setdefault((emotion_tag, fingerprint), []).append(memory_id)
+            for members in groups.values():
+                if len(members) > 1:
+                    clusters.setdefault(members[0], []).extend(members[1:])
+                    merged_away.update(members[1:])
+            
+            position = rows[-1][0]
+            result["scanned"] += len(rows)
+            # Stop before another page like those so far, and the rewrites, would overrun
+            pages += 1
+            now = time.perf_counter()
+            rewrites = len(merged_away) * (pages + 1) / pages
+            if 2 * now - page_start + rewrites * self._merge_cost_ms / 1000 >= deadline:
+                break
+        
+        merge_start = time.perf_counter()
+        result["merged"] = await self._merge_clusters(clusters, position)
+        if result["merged"]:
+            self._merge_cost_ms = (time.perf_counter() - merge_start) * 1000 / result["merged"]
+        self._consolidation_rowid = position
+        self.consolidation_cycles += 1
+        self.last_consolidation_ms = (time.perf_counter() - start) * 1000
+        if result["merged"]:
+            logger.info(f"🌙 Consolidated {result['merged']} duplicate memories")
+        return result
+    
+    async def _merge_clusters(self, clusters: Dict[str, List[str]], position: int) -> int:
+        """
+        Fold each cluster into its first memory and save the consolidation position, in one transaction
+        
+        The survivor keeps its id and content. Emotional weights combine as
+        independent reinforcements, ``1 - prod(1 - weight)``; access counts
+        add up; the earliest creation, latest access and slowest decay are
+        kept; anchors are unioned by type and content, keeping the strongest.
+        Traces of merged memories move to the survivor. Members deleted
+        since the cluster was found are left out. Returns the number of
+        memories merged away.
+        """
+        ids = [memory_id for survivor, victims in clusters.items() for memory_id in (survivor, *victims)]
+        stored: Dict[str, Tuple[str, str]] = {}
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            async with self.conn.execute(
+                f"SELECT id, content_redacted, anchors FROM memories WHERE id IN ({', '.join('?' * len(chunk))})",
+                chunk
+            ) as cursor:
+                async for memory_id, content, anchors in cursor:
+                    stored[memory_id] = (content, anchors)
+        
+        # In-memory state changes first, as in sweeps, then the rows are rewritten
+        updates, moves = [], []
+        for survivor, victims in clusters.items():
+            members = [memory_id for memory_id in (survivor, *victims) if memory_id in stored and memory_id in self.memories]
+            if len(members) < 2 or members[0] != survivor:
+                continue
+            rows = [self.memories[memory_id] for memory_id in members]
+            emotion_tag = rows[0].emotion_tag
+            weight = 1.0 - math.prod(1.0 - min(max(row.emotional_weight, 0.0), 1.0) for row in rows)
+            created = min(_epoch(row.created_at) for row in rows)
+            accessed = max(row.accessed_epoch for row in rows)
+            access_count = sum(row.access_count for row in rows)
+            decay_factor = max(row.decay_factor for row in rows)
+            anchors = {}
+            for memory_id in members:
+                for anchor in json.loads(stored[memory_id][1]):
+                    key = (anchor.get("type"), anchor.get("content"))
+                    if key not in anchors or anchor.get("strength", 0.0) > anchors[key].get("strength", 0.0):
+                        anchors[key] = anchor
+            anchors_data = json.dumps(list(anchors.values()))
+            content = stored[survivor][0]
+            
+            for memory_id in members:
+                self._forget(memory_id)
+            row = self.memories.add(
+                survivor, emotion_tag, weight, created, accessed, access_count, decay_factor,
+                len(content.encode()) + len(anchors_data)
+            )
+            self._index_memory(row)
+            self.vector_index.add(survivor, self._embed(emotion_tag, content))
+            updates.append((
+                weight, _from_epoch(created).isoformat() + "Z", _from_epoch(accessed).isoformat() + "Z",
+                access_count, decay_factor, anchors_data, survivor
+            ))
+            moves.extend((survivor, memory_id) for memory_id in members[1:])
+        
+        cursor = await self.conn.executemany("""
+            UPDATE memories SET emotional_weight = ?, created_at = ?, last_accessed = ?, access_count = ?,
+                                decay_factor = ?, anchors = ?
+            WHERE id = ?
+        """, updates)
+        await cursor.close()
+        cursor = await self.conn.executemany("UPDATE wake_state_traces SET memory_id = ? WHERE memory_id = ?", moves)
+        await cursor.close()
+        cursor = await self.conn.executemany(
+            "DELETE FROM memories WHERE id = ?", [(memory_id,) for _, memory_id in moves]
+        )
+        await cursor.close()
+        await self.conn.execute(
+            "INSERT OR REPLACE INTO dreamcore_state (key, value) VALUES ('consolidation_rowid', ?)", (str(position),)
+        )
+        await self.conn.commit()
+        
+        self.memories_consolidated += len(moves)
+        self.clusters_consolidated += len(updates)
+        return len(moves)
+    
+    async def _periodic_sweep(self):
+        """Periodically purge memories that have decayed below the threshold"""
+        while True:
+            try:
+                await self.sweep_expired()
+            except Exception as e:
+                logger.error(f"❌ Decay sweep failed: {e}")
+            await asyncio.sleep(self.sweep_interval_seconds)
+    
+    async def sweep_expired(self, now: Optional[float] = None) -> int:
+        """
+        Delete memories whose strength has fallen below the decay threshold
+        
+        Expiry times are computed in one vectorized pass over the columns;
+        deletions are written ``sweep_batch_size`` at a time, one transaction
+        per batch. Memories still on disk are swept once warm-up loads them.
+        Returns the number of memories removed.
+        """
+        now = time.time() if now is None else now
+        slots = self.memories.live_slots()
+        expiry = self.memories.expires_at(slots, self.decay_threshold)
+        expired = [self.memories.id_at(slot) for slot in slots[expiry <= now]]
+        
+        for start in range(0, len(expired), self.sweep_batch_size):
+            batch = expired[start:start + self.sweep_batch_size]
+            for memory_id in batch:
+                self._forget(memory_id)
+            await self._detach_traces(batch)
+            cursor = await self.conn.executemany(
+                "DELETE FROM memories WHERE id = ?", [(memory_id,) for memory_id in batch]
+            )
+            await cursor.close()
+            await self.conn.commit()
+            await asyncio.sleep(0)  # Let requests interleave between batches
+        
+        if expired:
+            self.memories_expired += len(expired)
+            logger.info(f"🗑️ Removed {len(expired)} decayed memories")
+        return len(expired)
+    
+    def _over_capacity(self, count: int, size: int, fraction: float = 1.0) -> bool:
+        return (
+            (self.max_memories is not None and count > self.max_memories * fraction)
+            or (self.max_bytes is not None and size > self.max_bytes * fraction)
+        )
+    
+    def eviction_scores(self, now: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Slots of all memories and their retention scores; the lowest are evicted first
+        
+        Blends emotional weight, decayed strength (as ``EmotionalMemory.strength``),
+        access frequency relative to the most-accessed memory and recency of
+        last access, weighted by ``EVICTION_WEIGHTS``. Computed over the
+        columns without touching individual memories.
+        """
+        now = time.time() if now is None else now
+        columns = self.memories
+        slots = columns.live_slots()
+        weights = columns.weights[slots]
+        counts = columns.access_counts[slots].astype(float)
+        days = np.maximum(0.0, (now - columns.last_accessed[slots]) / SECONDS_PER_DAY)
+        
+        strength = columns.decay_factors[slots] ** (days / (np.maximum(weights, 0.0) + 0.1))
+        frequency = np.log1p(counts) / np.log1p(max(counts.max(initial=0.0), 1.0))
+        recency = 0.5 ** (days / EVICTION_RECENCY_HALF_LIFE_DAYS)
+        return slots, (
+            EVICTION_WEIGHTS["weight"] * np.clip(weights, 0.0, 1.0)
+            + EVICTION_WEIGHTS["strength"] * strength
+            + EVICTION_WEIGHTS["frequency"] * frequency
+            + EVICTION_WEIGHTS["recency"] * recency
+        )
+    
+    async def enforce_capacity(self) -> int:
+        """
+        Archive the lowest-scoring memories once a capacity limit is exceeded
+        
+        Nothing happens below the limits. Past either one, memories are
+        evicted in score order until both count and bytes are back under
+        ``eviction_low_water`` of their limits, so eviction runs in batches
+        rather than on every store. Each ``sweep_batch_size`` chunk is copied
+        to ``memories_archive`` (with current access stats) and deleted in
+        one transaction. Scores rank the whole store, so eviction waits
+        until warm-up has loaded every memory. Returns the number of
+        memories evicted.
+        """
+        if not self.fully_loaded or not self._over_capacity(len(self.memories), self.memory_bytes):
+            return 0
+        
+        start = time.perf_counter()
+        slots, scores = self.eviction_scores()
+        order = np.argsort(scores, kind="stable")
+        columns = self.memories
+        tag_lengths = np.array([len(tag) for tag in columns.tags], dtype=np.int64)
+        footprints = (
+            columns.stored_bytes[slots] + tag_lengths[columns.tag_codes[slots]] + MEMORY_ROW_OVERHEAD_BYTES
+        )[order]
+        # Memories and bytes left after evicting the first i + 1 in score order
+        remaining_count = len(slots) - np.arange(1, len(slots) + 1)
+        remaining_bytes = self.memory_bytes - np.cumsum(footprints)
+        within = np.ones(len(slots), dtype=bool)
+        if self.max_memories is not None:
+            within &= remaining_count <= self.max_memories * self.eviction_low_water
+        if self.max_bytes is not None:
+            within &= remaining_bytes <= self.max_bytes * self.eviction_low_water
+        evict = int(np.argmax(within)) + 1 if within.any() else len(slots)
+        victims = [
+            (columns.id_at(slot), float(score))
+            for slot, score in zip(slots[order[:evict]], scores[order[:evict]])
+        ]
+        
+        archived_at = datetime.utcnow().isoformat() + "Z"
+        evicted_bytes = 0
+        for offset in range(0, len(victims), self.sweep_batch_size):
+            batch = victims[offset:offset + self.sweep_batch_size]
+            # Access stats come from the columns, which may be ahead of the row
+            rows = []
+            for memory_id, score in batch:
+                memory = self.memories.get(memory_id)
+                if memory is None:  # Swept while an earlier batch was written
+                    continue
+                rows.append((
+                    memory.last_accessed.isoformat() + "Z", memory.access_count, archived_at, score, memory_id
+                ))
+                evicted_bytes += self._footprint(memory)
+                self._forget(memory_id)
+            cursor = await self.conn.executemany("""
+                INSERT OR REPLACE INTO memories_archive
+                (id, emotion_tag, content_redacted, emotional_weight, created_at, last_accessed,
+                 access_count, decay_factor, anchors, archived_at, eviction_score)
+                SELECT id, emotion_tag, content_redacted, emotional_weight, created_at, ?, ?, decay_factor, anchors, ?, ?
+                FROM memories WHERE id = ?
+            """, rows)
+            await cursor.close()
+            await self._detach_traces([memory_id for memory_id, _ in batch])
+            cursor = await self.conn.executemany(
+                "DELETE FROM memories WHERE id = ?", [(memory_id,) for memory_id, _ in batch]
+            )
+            await cursor.close()
             await self.conn.commit()
+            await asyncio.sleep(0)  # Let requests interleave between batches
         
-        if decayed_memories:
-            logger.info(f"🗑️ Removed {len(decayed_memories)} decayed memories")
+        self.memories_evicted += len(victims)
+        self.bytes_evicted += evicted_bytes
+        self.eviction_runs += 1
+        self.last_eviction_ms = (time.perf_counter() - start) * 1000
+        logger.info(f"📦 Archived {len(victims)} memories to stay within capacity")
+        return len(victims)
     
     def is_active(self) -> bool:
         """Check if DreamCore is active"""
@@ -438,9 +2188,23 @@ class DreamCoreMemory:
     async def shutdown(self):
         """Shutdown DreamCore system"""
         try:
+            for task in (self._sweep_task, self._flush_task, self._warm_task, self._consolidation_task):
+                if task:
+                    task.cancel()
+                    try:
+                        await task
+                    except asyncio.CancelledError:
+                        pass
+            self._sweep_task = self._flush_task = self._warm_task = self._consolidation_task = None
             if self.conn:
-                await self.conn.close()
-                self.conn = None
+                try:
+                    # Final write-back so no access history is lost
+                    await self.flush_access_stats()
+                    await self.flush_traces()
+                    self.vector_index.save(self.vector_path)
+                finally:
+                    await self.conn.close()
+                    self.conn = None
             logger.info("🔄 DreamCore Memory System shutdown complete")
         except Exception as e:
             logger.error(f"❌ DreamCore shutdown error: {e}")
\ No newline at end of file
@@ -12,9 +12,11 @@ import numpy as np
 import logging
 import aiosqlite
 import os
-import statistics
-from datetime import datetime
-from typing import Dict, Any, List, Optional
+import uuid
+from collections import Counter, OrderedDict, deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Deque, Dict, Any, List, Optional, Tuple
 try:
     from scipy.fft import fft, fftfreq
 except ImportError:
@@ -22,8 +24,173 @@ except ImportError:
     from numpy.fft import fft, fftfreq
 import re
 
+from utils.compact_cache import CompactCache
+from utils.fingerprint_index import FingerprintIndex, simhash
+from utils.rolling_stats import RollingStats
+
 logger = logging.getLogger(__name__)
 
+# Characters of context kept around chunk boundaries; longer than any term or risk match
+STREAM_CARRY = 64
+
+@dataclass
+class SignalFeatures:
+    """Lexical statistics extracted in a single pass and shared by every scorer"""
+    length: int
+    char_counts: np.ndarray  # Occurrences of each distinct character, ordered by code point
+    unique_bigrams: int
+    word_count: int
+    term_counts: Dict[str, int]
+    pattern_counts: Dict[str, int]
+    code_points: np.ndarray  # First 1024 code points for harmonic analysis
+    
+    def has_term(self, term: str) -> bool:
+        return self.term_counts.get(term, 0) > 0
+
+class SignalStream:
+    """
+    Running lexical state of a growing signal
+    
+    Only the last ``window_size`` characters are kept. Appends and evictions
+    update the counters from the affected characters plus a short carry of
+    neighbouring text, so the state always equals the statistics of the
+    current window and each update costs O(chunk) rather than O(history).
+    """
+    
+    def __init__(self, session_id: str, window_size: int, terms: List[str], patterns: Dict[str, Any]):
+        self.session_id = session_id
+        self.window_size = window_size
+        self.terms = terms
+        self.patterns = patterns
+        self.created_at = datetime.utcnow().isoformat()
+        
+        # Running hash of the whole stream, equal to hashing the concatenated signal
+        self.hasher = hashlib.sha256()
+        self.total_length = 0
+        self.appends = 0
+        
+        # Window text and its statistics
+        self.chunks: Deque[str] = deque()
+        self.length = 0
+        self.tail = ""  # Last STREAM_CARRY characters of the window
+        self.char_counts: Counter = Counter()
+        self.bigram_counts: Counter = Counter()
+        self.term_counts: Dict[str, int] = dict.fromkeys(terms, 0)
+        self.pattern_counts: Dict[str, int] = dict.fromkeys(patterns, 0)
+        self.word_count = 0
+        
+        # Sliding FFT window over the most recent code points
+        self.code_points: Deque[int] = deque(maxlen=min(1024, window_size))
+    
+    @property
+    def signal_hash(self) -> str:
+        return self.hasher.hexdigest()
+    
+    def append(self, chunk: str):
+        """Add a chunk to the window, evicting the oldest characters beyond ``window_size``"""
+        self.hasher.update(chunk.encode())
+        self.total_length += len(chunk)
+        self.appends += 1
+        
+        if len(chunk) >= self.window_size:
+            # Everything currently in the window would be evicted anyway
+            self._reset()
+            chunk = chunk[-self.window_size:]
+        
+        context = self.tail[-1:]
+        joined = context + chunk
+        self.char_counts.update(chunk)
+        self.bigram_counts.update(zip(joined, joined[1:]))
+        
+        # A word continuing from the previous chunk was already counted
+        self.word_count += len(joined.split()) - (1 if context and not context.isspace() else 0)
+        
+        # Count matches starting in the chunk; matches inside the carry were counted before
+        self._count_matches(self.tail + chunk, self.tail, 1)
+        
+        self.chunks.append(chunk)
+        self.length += len(chunk)
+        self.tail = (self.tail + chunk)[-STREAM_CARRY:]
+        self.code_points.extend(np.frombuffer(
+            chunk[-self.code_points.maxlen:].encode("utf-32-le", "surrogatepass"), dtype=np.uint32
+        ).tolist())
+        
+        if self.length > self.window_size:
+            self._evict(self.length - self.window_size)
+    
+    def features(self) -> SignalFeatures:
+        """Snapshot the window statistics in the form the scorers consume"""
+        return SignalFeatures(
+            length=self.length,
+            char_counts=np.array([count for _, count in sorted(self.char_counts.items())], dtype=np.int64),
+            unique_bigrams=len(self.bigram_counts),
+            word_count=self.word_count,
+            term_counts=dict(self.term_counts),
+            pattern_counts=dict(self.pattern_counts),
+            code_points=np.fromiter(self.code_points, dtype=np.uint32, count=len(self.code_points))
+        )
+    
+    def _evict(self, count: int):
+        """Remove the oldest ``count`` characters from the window"""
+        parts = []
+        while count > 0:
+            chunk = self.chunks.popleft()
+            if len(chunk) > count:
+                self.chunks.appendleft(chunk[count:])
+                chunk = chunk[:count]
+            parts.append(chunk)
+            count -= len(chunk)
+        evicted = "".join(parts)
+        
+        following = ""
+        for chunk in self.chunks:
+            following += chunk[:STREAM_CARRY - len(following)]
+            if len(following) >= STREAM_CARRY:
+                break
+        
+        self._decrement(self.char_counts, evicted)
+        self._decrement(self.bigram_counts, zip(evicted, evicted[1:] + following[:1]))
+        
+        # The character after the evicted text starts a word if it was mid-word
+        self.word_count -= len(evicted.split())
+        if following and not following[0].isspace() and not evicted[-1].isspace():
+            self.word_count += 1
+        
+        self._count_matches(evicted + following, following, -1)
+        
+        self.length -= len(evicted)
+        if len(self.tail) > self.length:
+            self.tail = self.tail[len(self.tail) - self.length:]
+    
+    def _count_matches(self, text: str, context: str, sign: int):
+        """Add ``sign`` times the term and pattern matches in ``text`` that do not lie within ``context``"""
+        lower, context_lower = text.lower(), context.lower()
+        for term in self.terms:
+            self.term_counts[term] += sign * (lower.count(term) - context_lower.count(term))
+        for name, (pattern, _) in self.patterns.items():
+            self.pattern_counts[name] += sign * (len(pattern.findall(text)) - len(pattern.findall(context)))
+    
+    @staticmethod
+    def _decrement(counts: Counter, items):
+        """Subtract items from a Counter, dropping keys that reach zero"""
+        for item, count in Counter(items).items():
+            remaining = counts[item] - count
+            if remaining > 0:
+                counts[item] = remaining
+            else:
+                del counts[item]
+    
+    def _reset(self):
+        self.chunks.clear()
+        self.length = 0
+        self.tail = ""
+        self.char_counts.clear()
+        self.bigram_counts.clear()
+        self.term_counts = dict.fromkeys(self.terms, 0)
+        self.pattern_counts = dict.fromkeys(self.patterns, 0)
+        self.word_count = 0
+        self.code_points.clear()
+
 class NexusSignalEngine:
     """
     Real Nexus Signal Engine implementation
@@ -32,10 +199,50 @@ class NexusSignalEngine:
     and hybrid symbolic-statistical evaluation.
     """
     
-    def __init__(self, db_path: str = "backend/data/nexus.db"):
+    ROTATION_MODES = ("structured", "dense")
+    
+    def __init__(
+        self,
+        db_path: str = "backend/data/nexus.db",
+        rotation_mode: str = "structured",
+        cache_size: int = 500,
+        cache_max_bytes: int = 16 * 1024 * 1024,
+        cache_ttl_seconds: Optional[float] = 3600.0,
+        stream_window_size: int = 4096,
+        max_stream_sessions: int = 100,
+        near_duplicate_threshold: Optional[float] = None,
+        fingerprint_index_size: int = 10000,
+        history_size: int = 1000
+    ):
+        if rotation_mode not in self.ROTATION_MODES:
+            raise ValueError(f"Unknown rotation mode: {rotation_mode}")
+        
         self.db_path = db_path
-        self.signal_cache: Dict[str, Any] = {}
-        self.processing_history: List[Dict[str, Any]] = []
+        self.rotation_mode = rotation_mode
+        # Large text fields are rebuilt from the input on a hit instead of cached
+        self.signal_cache = CompactCache(
+            max_entries=cache_size,
+            max_bytes=cache_max_bytes,
+            ttl_seconds=cache_ttl_seconds,
+            exclude_fields=("filtered_signal",)
+        )
+        # Optional SimHash index of computed analyses for near-duplicate reuse
+        self.fingerprint_index = (
+            FingerprintIndex(threshold=near_duplicate_threshold, max_entries=fingerprint_index_size)
+            if near_duplicate_threshold else None
+        )
+        # Where each lookup was answered: memory cache, signal_analysis table,
+        # near-duplicate reuse, or fresh analysis
+        self.lookup_tiers = {"memory": 0, "persistent": 0, "near_duplicate": 0, "computed": 0}
+        # Ring buffer of recent analyses with O(1) ethics/risk aggregates
+        self.processing_history = RollingStats(
+            maxlen=history_size,
+            value_of=lambda analysis: analysis.get("ethics_score", 0),
+            category_of=lambda analysis: analysis.get("risk_assessment", {}).get("risk_level")
+        )
+        self.stream_window_size = stream_window_size
+        self.max_stream_sessions = max_stream_sessions
+        self.streams: "OrderedDict[str, SignalStream]" = OrderedDict()
         self.agent_perspectives = ["Colleen", "Luke", "Kellyanne"]
         self.is_initialized = False
         self.conn: Optional[aiosqlite.Connection] = None
@@ -56,6 +263,28 @@ class NexusSignalEngine:
             "fair", "unbiased", "inclusive", "accessible", "sustainable"
         ]
         
+        self.negative_ethics_terms = ["unethical", "biased", "discriminatory", "harmful", "malicious"]
+        self.positive_context_terms = ["promote", "enhance", "improve", "support"]
+        self.concern_terms = ["bias", "discriminat", "privacy", "violat", "manipulat"]
+        self.structure_indicators = ["function", "class", "def", "interface", "type"]
+        self.risk_patterns = {
+            "script_injection": (re.compile(r'<script.*?>', re.IGNORECASE), 0.5),
+            "eval_usage": (re.compile(r'eval\s*\(', re.IGNORECASE), 0.3)
+        }
+        self.tone_terms = {
+            "positive": ["happy", "joy", "love", "success", "achieve", "wonderful", "excellent"],
+            "negative": ["sad", "angry", "hate", "fail", "error", "problem", "difficult"],
+            "neutral": ["analyze", "process", "calculate", "determine", "evaluate"]
+        }
+        
+        # Every term any scorer looks up, counted once per signal
+        self.feature_terms = sorted(set(
+            self.risk_terms + self.virtue_terms + self.ethics_terms +
+            self.negative_ethics_terms + self.positive_context_terms +
+            self.concern_terms + self.structure_indicators +
+            [term for terms in self.tone_terms.values() for term in terms]
+        ))
+        
         # Ensure data directory exists
         db_dir = os.path.dirname(self.db_path)
         if db_dir:
@@ -119,6 +348,7 @@ class NexusSignalEngine:
     
     async def _load_processing_history(self):
         """Load processing history from database"""
+        loaded = []
         async with self.conn.execute("""
             SELECT signal_hash, analysis_result, timestamp 
             FROM signal_analysis 
@@ -128,11 +358,15 @@ class NexusSignalEngine:
             async for row in cursor:
                 try:
                     analysis = json.loads(row[1])
-                    self.processing_history.append(analysis)
-                    self.signal_cache[row[0]] = analysis
+                    loaded.append((analysis, datetime.fromisoformat(row[2]).replace(tzinfo=timezone.utc).timestamp()))
                 except Exception as e:
                     logger.warning(f"Failed to load analysis {row[0]}: {e}")
         
+        # Replay oldest first so the most recent analyses end up most recently used
+        for analysis, timestamp in reversed(loaded):
+            self.processing_history.append(analysis, timestamp)
+            self.signal_cache.put(analysis["signal_hash"], analysis)
+        
         logger.info(f"📚 Loaded {len(self.processing_history)} signal analyses")
     
     async def process(self, input_signal: str) -> Dict[str, Any]:
@@ -146,38 +380,32 @@ class NexusSignalEngine:
             signal_hash = hashlib.sha256(input_signal.encode()).hexdigest()
             
             # Check cache first
-            if signal_hash in self.signal_cache:
+            cached = self.signal_cache.get(signal_hash)
+            if cached is not None:
+                self.lookup_tiers["memory"] += 1
                 logger.info(f"🔄 Returning cached analysis for signal: {signal_hash[:8]}")
-                return self.signal_cache[signal_hash]
+                cached["filtered_signal"] = self._filter_signal(input_signal)
+                return cached
             
-            # Perform multi-perspective analysis
-            analysis = {
-                "signal_hash": signal_hash,
-                "timestamp": datetime.utcnow().isoformat(),
-                "input_length": len(input_signal),
-                "perspectives": {},
-                "harmonic_analysis": self._harmonic_analysis(input_signal, signal_hash),
-                "risk_assessment": self._assess_risks(input_signal),
-                "virtue_analysis": self._analyze_virtues(input_signal),
-                "ethics_score": self._calculate_ethics_score(input_signal),
-                "filtered_signal": self._filter_signal(input_signal)
-            }
+            # Then analyses persisted by earlier runs
+            stored = (await self._load_persisted_analyses([signal_hash])).get(signal_hash)
+            if stored is not None:
+                self.lookup_tiers["persistent"] += 1
+                logger.info(f"💾 Returning stored analysis for signal: {signal_hash[:8]}")
+                self.signal_cache.put(signal_hash, stored)
+                stored["filtered_signal"] = self._filter_signal(input_signal)
+                return stored
             
-            # Run agent perspectives
-            for agent in self.agent_perspectives:
-                analysis["perspectives"][agent] = self._agent_perspective(input_signal, agent, signal_hash)
+            # Perform multi-perspective analysis
+            analysis = self._analyze_with_reuse([input_signal], [signal_hash])[0]
             
             # Cache result
-            self.signal_cache[signal_hash] = analysis
+            self.signal_cache.put(signal_hash, analysis)
             self.processing_history.append(analysis)
             
             # Persist to database
             await self._persist_analysis(input_signal, analysis)
             
-            # Limit history size
-            if len(self.processing_history) > 1000:
-                self.processing_history = self.processing_history[-500:]
-            
             logger.info(f"⚡ Signal processed: {signal_hash[:8]} - Ethics: {analysis['ethics_score']:.2f}")
             return analysis
             
@@ -185,160 +413,489 @@ class NexusSignalEngine:
             logger.error(f"❌ Signal processing failed: {e}")
             raise
     
-    def _harmonic_analysis(self, signal: str, signal_hash: str) -> Dict[str, Any]:
-        """Perform harmonic FFT analysis using deterministic seeding"""
+    async def process_batch(self, input_signals: List[str]) -> List[Dict[str, Any]]:
+        """
+        Process many signals in one call
+        
+        Signals are deduplicated by hash and served from the cache where
+        possible; the rest are analyzed together and persisted in a single
+        transaction. Each result is identical to what process() returns.
+        """
         try:
-            # Convert signal to numeric representation
-            numeric_signal = np.array([ord(c) for c in signal[:1024]])  # Limit length
+            signal_hashes = [hashlib.sha256(signal.encode()).hexdigest() for signal in input_signals]
             
-            if len(numeric_signal) < 2:
-                return {"error": "Signal too short for harmonic analysis"}
+            results: Dict[str, Dict[str, Any]] = {}
+            pending: Dict[str, str] = {}
+            for input_signal, signal_hash in zip(input_signals, signal_hashes):
+                if signal_hash in results or signal_hash in pending:
+                    continue
+                cached = self.signal_cache.get(signal_hash)
+                if cached is not None:
+                    self.lookup_tiers["memory"] += 1
+                    results[signal_hash] = cached
+                else:
+                    pending[signal_hash] = input_signal
             
-            # Seed random number generator with signal hash for determinism
-            np.random.seed(int(signal_hash[:8], 16) % (2**32))
+            stored = await self._load_persisted_analyses(list(pending))
+            for signal_hash, analysis in stored.items():
+                self.lookup_tiers["persistent"] += 1
+                self.signal_cache.put(signal_hash, analysis)
+                results[signal_hash] = analysis
+                del pending[signal_hash]
             
-            # Apply seeded vector rotation
-            rotation_matrix = self._generate_rotation_matrix(len(numeric_signal))
-            rotated_signal = np.dot(rotation_matrix[:len(numeric_signal), :len(numeric_signal)], numeric_signal)
+            if pending:
+                analyses = self._analyze_with_reuse(list(pending.values()), list(pending.keys()))
+                for analysis in analyses:
+                    self.signal_cache.put(analysis["signal_hash"], analysis)
+                    self.processing_history.append(analysis)
+                    results[analysis["signal_hash"]] = analysis
+                
+                await self._persist_analyses(list(zip(pending.values(), analyses)))
             
-            # Perform FFT analysis
-            fft_result = fft(rotated_signal)
-            frequencies = fftfreq(len(rotated_signal))
+            batch = []
+            for input_signal, signal_hash in zip(input_signals, signal_hashes):
+                analysis = dict(results[signal_hash])
+                analysis["filtered_signal"] = self._filter_signal(input_signal)
+                batch.append(analysis)
             
-            # Extract harmonic features
-            magnitude_spectrum = np.abs(fft_result)
-            phase_spectrum = np.angle(fft_result)
+            logger.info(f"⚡ Signal batch processed: {len(input_signals)} signals, {len(pending)} analyzed")
+            return batch
             
-            # Calculate harmonic metrics
-            dominant_frequency = float(frequencies[np.argmax(magnitude_spectrum)])
-            spectral_centroid = float(np.sum(frequencies * magnitude_spectrum) / np.sum(magnitude_spectrum))
-            spectral_rolloff = self._calculate_spectral_rolloff(frequencies, magnitude_spectrum)
+        except Exception as e:
+            logger.error(f"❌ Signal batch processing failed: {e}")
+            raise
+    
+    def open_stream(self, window_size: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Start an incremental analysis session
+        
+        The least recently used session is closed when ``max_stream_sessions``
+        are already open.
+        """
+        window_size = window_size or self.stream_window_size
+        if window_size <= 0:
+            raise ValueError("Stream window size must be positive")
+        
+        while len(self.streams) >= self.max_stream_sessions:
+            expired_id, _ = self.streams.popitem(last=False)
+            logger.warning(f"Closing idle signal stream {expired_id[:8]}: session limit reached")
+        
+        session_id = uuid.uuid4().hex
+        stream = SignalStream(session_id, window_size, self.feature_terms, self.risk_patterns)
+        self.streams[session_id] = stream
+        
+        logger.info(f"🌊 Signal stream opened: {session_id[:8]} (window {window_size})")
+        return {"session_id": session_id, "window_size": window_size, "created_at": stream.created_at}
+    
+    def append_stream(self, session_id: str, chunk: str) -> Dict[str, Any]:
+        """Append a chunk to a stream and return the analysis of its current window"""
+        stream = self._get_stream(session_id)
+        stream.append(chunk)
+        self.streams.move_to_end(session_id)
+        return self._analyze_stream(stream)
+    
+    def close_stream(self, session_id: str) -> Dict[str, Any]:
+        """Close a stream and return the final analysis of its window"""
+        stream = self._get_stream(session_id)
+        analysis = self._analyze_stream(stream)
+        del self.streams[session_id]
+        
+        logger.info(f"🌊 Signal stream closed: {session_id[:8]} ({stream.total_length} chars, {stream.appends} appends)")
+        return analysis
+    
+    def _get_stream(self, session_id: str) -> SignalStream:
+        stream = self.streams.get(session_id)
+        if stream is None:
+            raise KeyError(f"Unknown signal stream: {session_id}")
+        return stream
+    
+    def _analyze_stream(self, stream: SignalStream) -> Dict[str, Any]:
+        """Score the current window of a stream; the hash covers the whole stream"""
+        features = stream.features()
+        signal_hash = stream.signal_hash
+        analysis = self._score_features(
+            features,
+            signal_hash,
+            self._harmonic_analysis(features, signal_hash),
+            self._calculate_harmonic_resonance(features),
+            datetime.utcnow().isoformat(),
+            stream.total_length
+        )
+        analysis.update({
+            "session_id": stream.session_id,
+            "window_length": stream.length,
+            "window_size": stream.window_size,
+            "appends": stream.appends
+        })
+        return analysis
+    
+    def _extract_features(self, signal: str) -> SignalFeatures:
+        """Scan the signal once and collect the statistics every scorer needs"""
+        lower = signal.lower()
+        code_points, char_counts, unique_bigrams = self._character_statistics(signal)
+        return SignalFeatures(
+            length=len(signal),
+            char_counts=char_counts,
+            unique_bigrams=unique_bigrams,
+            word_count=len(signal.split()),
+            term_counts={term: lower.count(term) for term in self.feature_terms},
+            pattern_counts={name: len(pattern.findall(signal)) for name, (pattern, _) in self.risk_patterns.items()},
+            code_points=code_points[:1024]  # Limit length
+        )
+    
+    @staticmethod
+    def _character_statistics(signal: str) -> Tuple[np.ndarray, np.ndarray, int]:
+        """
+        Code points, character histogram and distinct bigram count from one buffer view
+        
+        Characters are mapped to dense symbols (ASCII bytes directly, since
+        str.isascii() is O(1); other text through a sorted alphabet lookup).
+        Each bigram becomes one integer key, counted in a dense table for
+        small alphabets or by sorting packed 64-bit keys otherwise. Distinct
+        values come from np.sort plus an adjacent comparison, which is far
+        cheaper than np.unique on arrays this size.
+        """
+        if signal.isascii():
+            code_points = np.frombuffer(signal.encode("ascii"), dtype=np.uint8)
+            symbols, alphabet_size = code_points, 128
+        else:
+            code_points = np.frombuffer(signal.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+            ordered = np.sort(code_points)
+            alphabet = ordered[np.concatenate(([True], ordered[1:] != ordered[:-1]))]
             
-            return {
-                "dominant_frequency": dominant_frequency,
-                "spectral_centroid": spectral_centroid,
-                "spectral_rolloff": spectral_rolloff,
-                "harmonic_complexity": float(np.std(magnitude_spectrum)),
-                "phase_coherence": float(np.mean(np.cos(phase_spectrum)))
-            }
+            # Only entries at present code points are written and read, so np.empty is safe
+            lookup = np.empty(int(alphabet[-1]) + 1, dtype=np.intp)
+            lookup[alphabet] = np.arange(alphabet.size)
+            symbols, alphabet_size = lookup[code_points], alphabet.size
+        
+        if alphabet_size <= 256:
+            pair_keys = symbols[:-1].astype(np.uint16) * np.uint16(alphabet_size) + symbols[1:]
+            pair_table = np.bincount(pair_keys, minlength=alphabet_size * alphabet_size)
+            unique_bigrams = int(np.count_nonzero(pair_table))
             
-        except Exception as e:
-            logger.error(f"❌ Harmonic analysis failed: {e}")
-            return {"error": str(e)}
+            # Every character starts a bigram except the last one
+            char_counts = pair_table.reshape(alphabet_size, alphabet_size).sum(axis=1)
+            if symbols.size:
+                char_counts[symbols[-1]] += 1
+        else:
+            pair_keys = symbols[:-1].astype(np.uint64) * np.uint64(alphabet_size) + symbols[1:].astype(np.uint64)
+            ordered_pairs = np.sort(pair_keys)
+            unique_bigrams = int(np.count_nonzero(ordered_pairs[1:] != ordered_pairs[:-1])) + (1 if ordered_pairs.size else 0)
+            char_counts = np.bincount(symbols, minlength=alphabet_size)
+        
+        return code_points, char_counts[char_counts > 0], unique_bigrams
     
-    def _generate_rotation_matrix(self, size: int) -> np.ndarray:
-        """Generate deterministic rotation matrix"""
-        # Create orthogonal matrix for signal rotation
-        matrix = np.random.randn(size, size)
+    def _analyze_with_reuse(self, input_signals: List[str], signal_hashes: List[str]) -> List[Dict[str, Any]]:
+        """
+        Analyze signals, borrowing spectral results from indexed near-duplicates
+        
+        Only the harmonic analysis and resonance (the FFT work) are reused;
+        lexical, risk and ethics scores are always computed for the signal
+        itself. Reused analyses report ``reused_from`` and ``similarity``.
+        """
+        if self.fingerprint_index is None:
+            self.lookup_tiers["computed"] += len(input_signals)
+            return self._analyze_signals(input_signals, signal_hashes)
+        
+        fingerprints = [simhash(signal) for signal in input_signals]
+        matches = [self.fingerprint_index.query(fingerprint) for fingerprint in fingerprints]
+        results: List[Dict[str, Any]] = [None] * len(input_signals)
+        
+        fresh = [index for index, match in enumerate(matches) if match is None]
+        computed = self._analyze_signals([input_signals[i] for i in fresh], [signal_hashes[i] for i in fresh])
+        for index, analysis in zip(fresh, computed):
+            results[index] = analysis
+            resonance = analysis["perspectives"]["Kellyanne"]["harmonic_resonance"]
+            self.fingerprint_index.add(signal_hashes[index], fingerprints[index], (analysis["harmonic_analysis"], resonance))
+        
+        timestamp = datetime.utcnow().isoformat()
+        for index, match in enumerate(matches):
+            if match is None:
+                continue
+            source_hash, similarity, (harmonic, resonance) = match
+            features = self._extract_features(input_signals[index])
+            analysis = self._score_features(
+                features, signal_hashes[index], dict(harmonic), resonance, timestamp, features.length
+            )
+            analysis["filtered_signal"] = self._filter_signal(input_signals[index])
+            analysis["reused_from"] = source_hash
+            analysis["similarity"] = similarity
+            results[index] = analysis
+        
+        self.lookup_tiers["computed"] += len(fresh)
+        self.lookup_tiers["near_duplicate"] += len(input_signals) - len(fresh)
+        return results
+    
+    def _analyze_signal(self, input_signal: str, signal_hash: str) -> Dict[str, Any]:
+        """Run the full deterministic analysis of one signal (no caching or I/O)"""
+        return self._analyze_signals([input_signal], [signal_hash])[0]
+    
+    def _analyze_signals(self, input_signals: List[str], signal_hashes: List[str]) -> List[Dict[str, Any]]:
+        """
+        Analyze many signals at once (no caching or I/O)
+        
+        The spectral work runs as row-wise NumPy calls over all signals, so a
+        batch produces exactly the same analyses as one call per signal.
+        """
+        features_list = [self._extract_features(signal) for signal in input_signals]
+        harmonics = self._harmonic_analysis_batch(features_list, signal_hashes)
+        resonances = self._harmonic_resonance_batch(features_list)
+        timestamp = datetime.utcnow().isoformat()
+        
+        analyses = []
+        for input_signal, signal_hash, features, harmonic, resonance in zip(
+            input_signals, signal_hashes, features_list, harmonics, resonances
+        ):
+            analysis = self._score_features(features, signal_hash, harmonic, resonance, timestamp, features.length)
+            analysis["filtered_signal"] = self._filter_signal(input_signal)
+            analyses.append(analysis)
+        
+        return analyses
+    
+    def _score_features(
+        self,
+        features: SignalFeatures,
+        signal_hash: str,
+        harmonic: Dict[str, Any],
+        resonance: float,
+        timestamp: str,
+        input_length: int
+    ) -> Dict[str, Any]:
+        """Assemble the analysis of one signal from its extracted features"""
+        analysis = {
+            "signal_hash": signal_hash,
+            "timestamp": timestamp,
+            "input_length": input_length,
+            "perspectives": {},
+            "harmonic_analysis": harmonic,
+            "risk_assessment": self._assess_risks(features),
+            "virtue_analysis": self._analyze_virtues(features),
+            "ethics_score": self._calculate_ethics_score(features)
+        }
+        
+        # Run agent perspectives
+        for agent in self.agent_perspectives:
+            analysis["perspectives"][agent] = self._agent_perspective(features, agent, signal_hash, resonance)
+        
+        return analysis
+    
+    @staticmethod
+    def _group_by_length(arrays: List[np.ndarray]) -> Dict[int, List[int]]:
+        """Group row indices by array length so each group stacks into a 2-D matrix"""
+        groups: Dict[int, List[int]] = {}
+        for index, array in enumerate(arrays):
+            groups.setdefault(len(array), []).append(index)
+        return groups
+    
+    def _harmonic_analysis(self, features: SignalFeatures, signal_hash: str) -> Dict[str, Any]:
+        """Perform harmonic FFT analysis using deterministic seeding"""
+        return self._harmonic_analysis_batch([features], [signal_hash])[0]
+    
+    def _harmonic_analysis_batch(self, features_list: List[SignalFeatures], signal_hashes: List[str]) -> List[Dict[str, Any]]:
+        """
+        Harmonic FFT analysis for many signals
+        
+        Signals are bucketed by prefix length and each bucket is processed as a
+        single 2-D matrix (zero padding would change the spectra).
+        """
+        results: List[Dict[str, Any]] = [None] * len(features_list)
+        groups = self._group_by_length([features.code_points for features in features_list])
+        
+        for length, indices in groups.items():
+            if length < 2:
+                for index in indices:
+                    results[index] = {"error": "Signal too short for harmonic analysis"}
+                continue
+            
+            try:
+                # Numeric representation of the signal prefixes, one row per signal
+                numeric_signals = np.stack([features_list[index].code_points for index in indices])
+                
+                # Apply seeded vector rotation (deterministic per signal hash)
+                seeds = [int(signal_hashes[index][:8], 16) % (2**32) for index in indices]
+                rotated_signals = self._rotate_signals(numeric_signals, seeds)
+                
+                # Perform FFT analysis
+                fft_result = fft(rotated_signals, axis=-1)
+                frequencies = fftfreq(length)
+                
+                # Extract harmonic features
+                magnitude_spectrum = np.abs(fft_result)
+                phase_spectrum = np.angle(fft_result)
+                
+                # Calculate harmonic metrics
+                dominant_frequency = frequencies[np.argmax(magnitude_spectrum, axis=-1)]
+                spectral_centroid = np.sum(frequencies * magnitude_spectrum, axis=-1) / np.sum(magnitude_spectrum, axis=-1)
+                spectral_rolloff = self._calculate_spectral_rolloff(frequencies, magnitude_spectrum)
+                harmonic_complexity = np.std(magnitude_spectrum, axis=-1)
+                phase_coherence = np.mean(np.cos(phase_spectrum), axis=-1)
+                
+                for row, index in enumerate(indices):
+                    results[index] = {
+                        "dominant_frequency": float(dominant_frequency[row]),
+                        "spectral_centroid": float(spectral_centroid[row]),
+                        "spectral_rolloff": float(spectral_rolloff[row]),
+                        "harmonic_complexity": float(harmonic_complexity[row]),
+                        "phase_coherence": float(phase_coherence[row])
+                    }
+                
+            except Exception as e:
+                logger.error(f"❌ Harmonic analysis failed: {e}")
+                for index in indices:
+                    results[index] = {"error": str(e)}
+        
+        return results
+    
+    def _rotate_signal(self, numeric_signal: np.ndarray, seed: int) -> np.ndarray:
+        """Apply the seeded orthogonal rotation selected by ``rotation_mode``"""
+        return self._rotate_signals(numeric_signal[np.newaxis, :], [seed])[0]
+    
+    def _rotate_signals(self, numeric_signals: np.ndarray, seeds: List[int]) -> np.ndarray:
+        """Rotate each row of a (signals x length) matrix with its own seed"""
+        if self.rotation_mode == "dense":
+            size = numeric_signals.shape[1]
+            return np.stack([
+                np.dot(self._generate_rotation_matrix(size, seed), row)
+                for row, seed in zip(numeric_signals, seeds)
+            ])
+        return self._structured_rotation_batch(numeric_signals, seeds)
+    
+    def _structured_rotation(self, numeric_signal: np.ndarray, seed: int, rounds: int = 3) -> np.ndarray:
+        """
+        Seeded structured orthogonal transform in O(n log n)
+        
+        Each round applies a random permutation, a random sign flip and an
+        orthonormal discrete Hartley transform. Every step is orthogonal for
+        any length, so the chain preserves the signal norm exactly like the
+        dense QR rotation while avoiding the O(n^3) factorisation.
+        """
+        return self._structured_rotation_batch(numeric_signal[np.newaxis, :], [seed], rounds)[0]
+    
+    def _structured_rotation_batch(self, numeric_signals: np.ndarray, seeds: List[int], rounds: int = 3) -> np.ndarray:
+        """Row-wise structured rotation; row i uses the random stream of seeds[i]"""
+        count, size = numeric_signals.shape
+        signs = np.empty((rounds, count, size), dtype=np.int64)
+        permutations = np.empty((rounds, count, size), dtype=np.int64)
+        
+        for row, seed in enumerate(seeds):
+            rng = np.random.default_rng(seed)
+            for round_index in range(rounds):
+                signs[round_index, row] = rng.integers(0, 2, size) * 2 - 1
+                permutations[round_index, row] = rng.permutation(size)
+        
+        rotated = numeric_signals.astype(np.float64)
+        for round_index in range(rounds):
+            permuted = np.take_along_axis(rotated, permutations[round_index], axis=-1)
+            rotated = self._hartley_transform(signs[round_index] * permuted)
+        
+        return rotated
+    
+    @staticmethod
+    def _hartley_transform(vectors: np.ndarray) -> np.ndarray:
+        """Orthonormal discrete Hartley transform along the last axis, computed through the FFT"""
+        spectrum = fft(vectors, axis=-1)
+        return (spectrum.real - spectrum.imag) / np.sqrt(vectors.shape[-1])
+    
+    def _generate_rotation_matrix(self, size: int, seed: int) -> np.ndarray:
+        """Generate deterministic dense rotation matrix (legacy compatibility mode)"""
+        # Create orthogonal matrix for signal rotation; a call-local legacy
+        # RandomState keeps the historical matrices without touching global state
+        matrix = np.random.RandomState(seed).randn(size, size)
         q, r = np.linalg.qr(matrix)
         return q
     
-    def _calculate_spectral_rolloff(self, frequencies: np.ndarray, magnitudes: np.ndarray, rolloff_percent: float = 0.85) -> float:
-        """Calculate spectral rolloff frequency"""
-        total_energy = np.sum(magnitudes)
-        cumulative_energy = np.cumsum(magnitudes)
-        rolloff_index = np.where(cumulative_energy >= rolloff_percent * total_energy)[0]
-        
-        if len(rolloff_index) > 0:
-            return float(frequencies[rolloff_index[0]])
-        return float(frequencies[-1])
+    def _calculate_spectral_rolloff(self, frequencies: np.ndarray, magnitudes: np.ndarray, rolloff_percent: float = 0.85) -> np.ndarray:
+        """Calculate spectral rolloff frequency for each magnitude spectrum (last axis)"""
+        total_energy = np.sum(magnitudes, axis=-1, keepdims=True)
+        cumulative_energy = np.cumsum(magnitudes, axis=-1)
+        reached = cumulative_energy >= rolloff_percent * total_energy
+        
+        # First index reaching the threshold, falling back to the last frequency
+        rolloff_index = np.where(reached.any(axis=-1), np.argmax(reached, axis=-1), len(frequencies) - 1)
+        return frequencies[rolloff_index]
     
-    def _agent_perspective(self, signal: str, agent_name: str, signal_hash: str) -> Dict[str, Any]:
+    def _agent_perspective(
+        self,
+        features: SignalFeatures,
+        agent_name: str,
+        signal_hash: str,
+        harmonic_resonance: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Generate agent-specific perspective analysis"""
-        # Seed with agent name and signal hash for deterministic results
+        # Private generator seeded with agent name and signal hash: deterministic and thread-safe
         agent_seed = int(hashlib.sha256(f"{agent_name}{signal_hash}".encode()).hexdigest()[:8], 16)
-        np.random.seed(agent_seed % (2**32))
+        rng = np.random.default_rng(agent_seed)
         
         if agent_name == "Colleen":
             # Mathematical analysis perspective
             return {
                 "analysis_type": "mathematical",
-                "entropy": float(self._calculate_entropy(signal)),
-                "complexity_score": float(len(set(signal)) / len(signal) if signal else 0),
-                "pattern_density": float(self._calculate_pattern_density(signal)),
-                "mathematical_beauty": float(np.random.beta(2, 2))  # Deterministic with seed
+                "entropy": float(self._calculate_entropy(features)),
+                "complexity_score": float(len(features.char_counts) / features.length if features.length else 0),
+                "pattern_density": float(self._calculate_pattern_density(features)),
+                "mathematical_beauty": float(rng.beta(2, 2))  # Deterministic with seed
             }
         
         elif agent_name == "Luke":
             # Ethical reasoning perspective
             return {
                 "analysis_type": "ethical",
-                "virtue_alignment": self._analyze_virtues(signal),
-                "ethical_concerns": self._identify_ethical_concerns(signal),
-                "moral_weight": float(self._calculate_moral_weight(signal)),
-                "recommendation": self._generate_ethical_recommendation(signal)
+                "virtue_alignment": self._analyze_virtues(features),
+                "ethical_concerns": self._identify_ethical_concerns(features),
+                "moral_weight": float(self._calculate_moral_weight(features)),
+                "recommendation": self._generate_ethical_recommendation(features)
             }
         
         elif agent_name == "Kellyanne":
             # Harmonic and aesthetic perspective
             return {
                 "analysis_type": "harmonic",
-                "aesthetic_score": float(self._calculate_aesthetic_score(signal)),
-                "harmonic_resonance": float(self._calculate_harmonic_resonance(signal)),
-                "emotional_tone": self._detect_emotional_tone(signal),
-                "creative_potential": float(np.random.beta(3, 2))  # Deterministic with seed
+                "aesthetic_score": float(self._calculate_aesthetic_score(features)),
+                "harmonic_resonance": float(
+                    harmonic_resonance if harmonic_resonance is not None
+                    else self._calculate_harmonic_resonance(features)
+                ),
+                "emotional_tone": self._detect_emotional_tone(features),
+                "creative_potential": float(rng.beta(3, 2))  # Deterministic with seed
             }
         
         return {"analysis_type": "unknown", "error": f"Unknown agent: {agent_name}"}
     
-    def _calculate_entropy(self, signal: str) -> float:
+    def _calculate_entropy(self, features: SignalFeatures) -> float:
         """Calculate Shannon entropy of signal"""
-        if not signal:
+        if not features.length:
             return 0.0
         
-        # Calculate character frequency
-        char_counts = {}
-        for char in signal:
-            char_counts[char] = char_counts.get(char, 0) + 1
-        
-        # Calculate entropy
-        entropy = 0.0
-        total_chars = len(signal)
-        
-        for count in char_counts.values():
-            probability = count / total_chars
-            if probability > 0:
-                entropy -= probability * np.log2(probability)
-        
-        return entropy
+        # Calculate entropy from the shared character frequencies
+        probabilities = features.char_counts / features.length
+        return float(-np.sum(probabilities * np.log2(probabilities)))
     
-    def _calculate_pattern_density(self, signal: str) -> float:
+    def _calculate_pattern_density(self, features: SignalFeatures) -> float:
         """Calculate pattern density in signal"""
-        if len(signal) < 2:
+        if features.length < 2:
             return 0.0
         
-        # Look for repeated patterns
-        patterns = {}
-        for i in range(len(signal) - 1):
-            bigram = signal[i:i+2]
-            patterns[bigram] = patterns.get(bigram, 0) + 1
-        
-        # Calculate density
-        unique_patterns = len(patterns)
-        total_possible = len(signal) - 1
+        # Density of distinct bigrams among all bigrams
+        unique_patterns = features.unique_bigrams
+        total_possible = features.length - 1
         
         return unique_patterns / total_possible if total_possible > 0 else 0.0
     
-    def _assess_risks(self, signal: str) -> Dict[str, Any]:
+    def _assess_risks(self, features: SignalFeatures) -> Dict[str, Any]:
         """Assess security and safety risks in signal"""
         risk_score = 0.0
         detected_risks = []
         
-        signal_lower = signal.lower()
-        
         for risk_term in self.risk_terms:
-            if risk_term in signal_lower:
+            if features.has_term(risk_term):
                 risk_score += 0.1
                 detected_risks.append(risk_term)
         
         # Additional risk patterns
-        if re.search(r'<script.*?>', signal, re.IGNORECASE):
-            risk_score += 0.5
-            detected_risks.append("script_injection")
-        
-        if re.search(r'eval\s*\(', signal, re.IGNORECASE):
-            risk_score += 0.3
-            detected_risks.append("eval_usage")
+        for name, (_, weight) in self.risk_patterns.items():
+            if features.pattern_counts[name]:
+                risk_score += weight
+                detected_risks.append(name)
         
         return {
             "risk_score": min(risk_score, 1.0),
@@ -346,38 +903,34 @@ class NexusSignalEngine:
             "risk_level": "high" if risk_score > 0.7 else "medium" if risk_score > 0.3 else "low"
         }
     
-    def _analyze_virtues(self, signal: str) -> Dict[str, float]:
+    def _analyze_virtues(self, features: SignalFeatures) -> Dict[str, float]:
         """Analyze virtue content in signal"""
         virtue_scores = {}
-        signal_lower = signal.lower()
+        
+        # Bonus for virtue in positive context
+        positive_context = any(features.has_term(pos) for pos in self.positive_context_terms)
         
         for virtue in self.virtue_terms:
             # Count virtue mentions and context
-            virtue_count = signal_lower.count(virtue)
-            context_bonus = 0.0
-            
-            # Bonus for virtue in positive context
-            if virtue in signal_lower and any(pos in signal_lower for pos in ["promote", "enhance", "improve", "support"]):
-                context_bonus = 0.2
+            virtue_count = features.term_counts[virtue]
+            context_bonus = 0.2 if virtue_count and positive_context else 0.0
             
             virtue_scores[virtue] = min((virtue_count * 0.1) + context_bonus, 1.0)
         
         return virtue_scores
     
-    def _calculate_ethics_score(self, signal: str) -> float:
+    def _calculate_ethics_score(self, features: SignalFeatures) -> float:
         """Calculate overall ethics score"""
         ethics_score = 0.5  # Neutral baseline
-        signal_lower = signal.lower()
         
         # Positive ethics indicators
         for ethics_term in self.ethics_terms:
-            if ethics_term in signal_lower:
+            if features.has_term(ethics_term):
                 ethics_score += 0.05
         
         # Negative ethics indicators
-        negative_terms = ["unethical", "biased", "discriminatory", "harmful", "malicious"]
-        for negative_term in negative_terms:
-            if negative_term in signal_lower:
+        for negative_term in self.negative_ethics_terms:
+            if features.has_term(negative_term):
                 ethics_score -= 0.1
         
         return max(0.0, min(1.0, ethics_score))
@@ -399,26 +952,25 @@ class NexusSignalEngine:
         
         return filtered
     
-    def _identify_ethical_concerns(self, signal: str) -> List[str]:
+    def _identify_ethical_concerns(self, features: SignalFeatures) -> List[str]:
         """Identify specific ethical concerns"""
         concerns = []
-        signal_lower = signal.lower()
         
-        if "bias" in signal_lower:
+        if features.has_term("bias"):
             concerns.append("potential_bias")
-        if "discriminat" in signal_lower:
+        if features.has_term("discriminat"):
             concerns.append("discrimination_risk")
-        if "privacy" in signal_lower and "violat" in signal_lower:
+        if features.has_term("privacy") and features.has_term("violat"):
             concerns.append("privacy_violation")
-        if "manipulat" in signal_lower:
+        if features.has_term("manipulat"):
             concerns.append("manipulation_concern")
         
         return concerns
     
-    def _calculate_moral_weight(self, signal: str) -> float:
+    def _calculate_moral_weight(self, features: SignalFeatures) -> float:
         """Calculate moral weight of signal"""
-        virtue_scores = self._analyze_virtues(signal)
-        ethics_score = self._calculate_ethics_score(signal)
+        virtue_scores = self._analyze_virtues(features)
+        ethics_score = self._calculate_ethics_score(features)
         
         # Combine virtue and ethics scores
         avg_virtue = np.mean(list(virtue_scores.values())) if virtue_scores else 0.0
@@ -426,10 +978,10 @@ class NexusSignalEngine:
         
         return moral_weight
     
-    def _generate_ethical_recommendation(self, signal: str) -> str:
+    def _generate_ethical_recommendation(self, features: SignalFeatures) -> str:
         """Generate ethical recommendation"""
-        ethics_score = self._calculate_ethics_score(signal)
-        concerns = self._identify_ethical_concerns(signal)
+        ethics_score = self._calculate_ethics_score(features)
+        concerns = self._identify_ethical_concerns(features)
         
         if ethics_score > 0.8:
             return "Signal demonstrates strong ethical alignment. Proceed with confidence."
@@ -440,108 +992,97 @@ class NexusSignalEngine:
         else:
             return "Signal requires ethical review. Consider virtue-based improvements."
     
-    def _calculate_aesthetic_score(self, signal: str) -> float:
+    def _calculate_aesthetic_score(self, features: SignalFeatures) -> float:
         """Calculate aesthetic score of signal"""
         # Aesthetic factors: balance, harmony, elegance
-        balance_score = self._calculate_balance(signal)
-        harmony_score = self._calculate_harmony(signal)
-        elegance_score = self._calculate_elegance(signal)
+        balance_score = self._calculate_balance(features)
+        harmony_score = self._calculate_harmony(features)
+        elegance_score = self._calculate_elegance(features)
         
         return (balance_score + harmony_score + elegance_score) / 3.0
     
-    def _calculate_balance(self, signal: str) -> float:
+    def _calculate_balance(self, features: SignalFeatures) -> float:
         """Calculate balance in signal structure"""
-        if not signal:
+        if not features.length:
             return 0.0
         
         # Analyze character distribution
-        char_counts = {}
-        for char in signal:
-            char_counts[char] = char_counts.get(char, 0) + 1
+        counts = features.char_counts
+        if not counts.size:
+            return 1.0
         
         # Calculate variance (lower variance = better balance)
-        counts = list(char_counts.values())
-        if not counts:
-            return 1.0
-            
         variance = np.var(counts)
-        max_possible_variance = len(signal) ** 2 / 4  # Theoretical maximum
+        max_possible_variance = features.length ** 2 / 4  # Theoretical maximum
         
         balance = 1.0 - (variance / max_possible_variance) if max_possible_variance > 0 else 1.0
         return max(0.0, min(1.0, balance))
     
-    def _calculate_harmony(self, signal: str) -> float:
+    def _calculate_harmony(self, features: SignalFeatures) -> float:
         """Calculate harmonic resonance"""
-        if len(signal) < 2:
+        if features.length < 2:
             return 0.0
         
-        # Analyze character transitions
-        transitions = {}
-        for i in range(len(signal) - 1):
-            transition = signal[i:i+2]
-            transitions[transition] = transitions.get(transition, 0) + 1
-        
-        # Calculate harmony based on smooth transitions
-        total_transitions = len(signal) - 1
-        unique_transitions = len(transitions)
+        # Calculate harmony based on smooth character transitions
+        total_transitions = features.length - 1
+        unique_transitions = features.unique_bigrams
         
         harmony = unique_transitions / total_transitions if total_transitions > 0 else 0.0
         return min(harmony, 1.0)
     
-    def _calculate_elegance(self, signal: str) -> float:
+    def _calculate_elegance(self, features: SignalFeatures) -> float:
         """Calculate elegance score"""
-        if not signal:
+        if not features.length:
             return 0.0
         
         # Elegance factors: conciseness, clarity, purposefulness
-        conciseness = 1.0 - (len(signal) / 10000)  # Shorter is more elegant
-        clarity = len(signal.split()) / len(signal) if signal else 0  # Word density
+        conciseness = 1.0 - (features.length / 10000)  # Shorter is more elegant
+        clarity = features.word_count / features.length  # Word density
         
         # Check for purposeful structure
-        structure_indicators = ["function", "class", "def", "interface", "type"]
-        purposefulness = sum(1 for indicator in structure_indicators if indicator in signal.lower()) / len(structure_indicators)
+        purposefulness = sum(1 for indicator in self.structure_indicators if features.has_term(indicator)) / len(self.structure_indicators)
         
         elegance = (max(0, conciseness) * 0.3) + (clarity * 0.4) + (purposefulness * 0.3)
         return min(elegance, 1.0)
     
-    def _calculate_harmonic_resonance(self, signal: str) -> float:
+    def _calculate_harmonic_resonance(self, features: SignalFeatures) -> float:
         """Calculate harmonic resonance using FFT"""
-        if not signal:
-            return 0.0
+        return self._harmonic_resonance_batch([features])[0]
+    
+    def _harmonic_resonance_batch(self, features_list: List[SignalFeatures]) -> List[float]:
+        """Calculate harmonic resonance for many signals, one FFT call per length bucket"""
+        resonances = [0.0] * len(features_list)
         
         # Convert to numeric and analyze harmonics
-        numeric = np.array([ord(c) % 256 for c in signal[:512]])
-        
-        if len(numeric) < 2:
-            return 0.0
-        
-        # Perform FFT
-        fft_result = np.abs(fft(numeric))
-        
-        # Calculate harmonic resonance
-        fundamental = fft_result[1] if len(fft_result) > 1 else 0
-        harmonics = fft_result[2:min(6, len(fft_result))]  # First 4 harmonics
-        
-        if fundamental > 0:
-            harmonic_ratio = np.sum(harmonics) / fundamental
-            resonance = 1.0 / (1.0 + harmonic_ratio)  # Higher harmonics reduce resonance
-        else:
-            resonance = 0.0
+        numerics = [features.code_points[:512] & 0xFF for features in features_list]
         
-        return min(resonance, 1.0)
+        for length, indices in self._group_by_length(numerics).items():
+            if length < 2:
+                continue
+            
+            # Perform FFT
+            fft_result = np.abs(fft(np.stack([numerics[index] for index in indices]), axis=-1))
+            
+            # Calculate harmonic resonance
+            fundamental = fft_result[:, 1]
+            harmonics = fft_result[:, 2:min(6, length)]  # First 4 harmonics
+            harmonic_sum = np.sum(harmonics, axis=-1)
+            
+            for row, index in enumerate(indices):
+                if fundamental[row] > 0:
+                    harmonic_ratio = harmonic_sum[row] / fundamental[row]
+                    resonance = 1.0 / (1.0 + harmonic_ratio)  # Higher harmonics reduce resonance
+                else:
+                    resonance = 0.0
+                resonances[index] = min(float(resonance), 1.0)
+        
+        return resonances
     
-    def _detect_emotional_tone(self, signal: str) -> str:
+    def _detect_emotional_tone(self, features: SignalFeatures) -> str:
         """Detect emotional tone of signal"""
-        signal_lower = signal.lower()
-        
-        # Emotional indicators
-        positive_words = ["happy", "joy", "love", "success", "achieve", "wonderful", "excellent"]
-        negative_words = ["sad", "angry", "hate", "fail", "error", "problem", "difficult"]
-        neutral_words = ["analyze", "process", "calculate", "determine", "evaluate"]
-        
-        positive_count = sum(1 for word in positive_words if word in signal_lower)
-        negative_count = sum(1 for word in negative_words if word in signal_lower)
-        neutral_count = sum(1 for word in neutral_words if word in signal_lower)
+        positive_count = sum(1 for word in self.tone_terms["positive"] if features.has_term(word))
+        negative_count = sum(1 for word in self.tone_terms["negative"] if features.has_term(word))
+        neutral_count = sum(1 for word in self.tone_terms["neutral"] if features.has_term(word))
         
         if positive_count > negative_count and positive_count > neutral_count:
             return "positive"
@@ -567,36 +1108,74 @@ class NexusSignalEngine:
         
         return redacted
     
+    async def _load_persisted_analyses(self, signal_hashes: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Look up stored analyses by signal hash (primary key)
+        
+        Failures are logged and treated as misses so the caller recomputes.
+        """
+        found: Dict[str, Dict[str, Any]] = {}
+        if self.conn is None or not signal_hashes:
+            return found
+        
+        try:
+            # Stay well below SQLite's bound-parameter limit
+            for offset in range(0, len(signal_hashes), 500):
+                chunk = signal_hashes[offset:offset + 500]
+                placeholders = ",".join("?" * len(chunk))
+                async with self.conn.execute(
+                    f"SELECT signal_hash, analysis_result FROM signal_analysis WHERE signal_hash IN ({placeholders})",
+                    chunk
+                ) as cursor:
+                    async for row in cursor:
+                        try:
+                            found[row[0]] = json.loads(row[1])
+                        except ValueError as e:
+                            logger.warning(f"Failed to load analysis {row[0]}: {e}")
+        except Exception as e:
+            logger.error(f"❌ Stored analysis lookup failed: {e}")
+        
+        return found
+    
     async def _persist_analysis(self, input_signal: str, analysis: Dict[str, Any]):
         """Persist analysis to database"""
+        await self._persist_analyses([(input_signal, analysis)])
+    
+    async def _persist_analyses(self, items: List[Tuple[str, Dict[str, Any]]]):
+        """Persist (input_signal, analysis) pairs to database in one transaction"""
         try:
-            redacted_signal = self._redact_signal(input_signal)
+            analysis_rows = []
+            perspective_rows = []
+            for input_signal, analysis in items:
+                analysis_rows.append((
+                    analysis["signal_hash"],
+                    self._redact_signal(input_signal),
+                    json.dumps(analysis),
+                    analysis["timestamp"],
+                    analysis["ethics_score"],
+                    analysis["risk_assessment"]["risk_level"]
+                ))
+                
+                # Store agent perspectives
+                for agent_name, perspective in analysis["perspectives"].items():
+                    perspective_rows.append((
+                        analysis["signal_hash"],
+                        agent_name,
+                        json.dumps(perspective),
+                        analysis["timestamp"]
+                    ))
             
-            await self.conn.execute("""
+            await self.conn.executemany("""
                 INSERT OR REPLACE INTO signal_analysis 
                 (signal_hash, input_signal_redacted, analysis_result, timestamp, ethics_score, risk_level)
                 VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                analysis["signal_hash"],
-                redacted_signal,
-                json.dumps(analysis),
-                analysis["timestamp"],
-                analysis["ethics_score"],
-                analysis["risk_assessment"]["risk_level"]
-            ))
+            """, analysis_rows)
             
-            # Store agent perspectives
-            for agent_name, perspective in analysis["perspectives"].items():
-                await self.conn.execute("""
-                    INSERT INTO agent_perspectives 
-                    (signal_hash, agent_name, perspective_data, timestamp)
-                    VALUES (?, ?, ?, ?)
-                """, (
-                    analysis["signal_hash"],
-                    agent_name,
-                    json.dumps(perspective),
-                    analysis["timestamp"]
-                ))
+            await self.conn.executemany("""
+                INSERT INTO agent_perspectives 
+                (signal_hash, agent_name, perspective_data, timestamp)
+                VALUES (?, ?, ?, ?)
+            """, perspective_rows)
             
             await self.conn.commit()
             
@@ -608,12 +1187,21 @@ class NexusSignalEngine:
         return self.is_initialized and self.conn is not None
     
     def get_processing_stats(self) -> Dict[str, Any]:
-        """Get processing statistics"""
+        """Get processing statistics (constant time, safe to poll)"""
+        history = self.processing_history
         return {
-            "total_signals_processed": len(self.processing_history),
+            "total_signals_processed": len(history),
+            "lifetime_signals_processed": history.lifetime_count,
             "cache_size": len(self.signal_cache),
-            "average_ethics_score": statistics.fmean([h.get("ethics_score", 0) for h in self.processing_history]) if self.processing_history else 0,
-            "risk_detections": sum(1 for h in self.processing_history if h.get("risk_assessment", {}).get("risk_level") == "high")
+            "cache": self.signal_cache.get_stats(),
+            "lookup_tiers": dict(self.lookup_tiers),
+            "near_duplicates": self.fingerprint_index.get_stats() if self.fingerprint_index else None,
+            "active_streams": len(self.streams),
+            "average_ethics_score": history.mean,
+            "ethics_score_ewma": history.ewma if history.ewma is not None else 0,
+            "risk_detections": history.categories.get("high", 0),
+            "risk_levels": dict(history.categories),
+            "per_minute": history.get_buckets()
         }
     
     async def shutdown(self):
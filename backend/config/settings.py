@@ -68,16 +68,48 @@ def get_ai_system_config() -> Dict[str, Any]:
         "dreamcore": {
             "db_path": "backend/data/dreamcore.db",
             "max_memories": 1000,
-            "decay_threshold": 0.1
+            "max_bytes": 64 * 1024 * 1024,
+            "eviction_low_water": 0.9,
+            "decay_threshold": 0.1,
+            "sweep_interval_seconds": 60,
+            "sweep_batch_size": 500,
+            "flush_interval_ms": 500,
+            "flush_batch_size": 256,
+            "recall_ivf_lists": 1024,
+            "recall_ivf_min_vectors": 200000,
+            "recall_ivf_probes": 16,
+            "hot_memories_per_emotion": 1000,
+            "warm_page_size": 2000,
+            "warm_pause_ms": 20,
+            "trace_batch_size": 1000,
+            "trace_retention_minutes": 1440,
+            "max_trace_batch_size": 5000,
+            "consolidation_interval_seconds": 10,
+            "consolidation_budget_ms": 100,
+            "consolidation_page_size": 500
         },
         "nexus": {
             "db_path": "backend/data/nexus.db",
             "cache_size": 500,
-            "max_signal_length": 10000
+            "cache_max_bytes": 16 * 1024 * 1024,
+            "cache_ttl_seconds": 3600,
+            "max_signal_length": 10000,
+            "max_batch_size": 1024,
+            "stream_window_size": 4096,
+            "max_stream_sessions": 100,
+            "near_duplicate_threshold": 0.95,
+            "fingerprint_index_size": 10000,
+            "history_size": 1000,
+            "rotation_mode": "structured"
         },
         "aegis": {
             "db_path": "backend/data/aegis.db",
             "max_decisions": 1000,
+            "max_batch_size": 1024,
+            "cache_size": 500,
+            "cache_max_bytes": 16 * 1024 * 1024,
+            "cache_ttl_seconds": 3600,
+            "persist_cache_hits": True,
             "consensus_threshold": 0.6
         },
         "quantum": {
@@ -8,7 +8,7 @@ import asyncio
 import logging
 import json
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, WebSocket, WebSocketDisconnect
@@ -68,13 +68,51 @@ async def lifespan(app: FastAPI):
         
         ai_config = get_ai_system_config()
         
-        ai_systems['dreamcore'] = DreamCoreMemory(ai_config['dreamcore']['db_path'])
+        ai_systems['dreamcore'] = DreamCoreMemory(
+            ai_config['dreamcore']['db_path'],
+            decay_threshold=ai_config['dreamcore']['decay_threshold'],
+            sweep_interval_seconds=ai_config['dreamcore']['sweep_interval_seconds'],
+            sweep_batch_size=ai_config['dreamcore']['sweep_batch_size'],
+            flush_interval_ms=ai_config['dreamcore']['flush_interval_ms'],
+            flush_batch_size=ai_config['dreamcore']['flush_batch_size'],
+            recall_ivf_lists=ai_config['dreamcore']['recall_ivf_lists'],
+            recall_ivf_min_vectors=ai_config['dreamcore']['recall_ivf_min_vectors'],
+            recall_ivf_probes=ai_config['dreamcore']['recall_ivf_probes'],
+            max_memories=ai_config['dreamcore']['max_memories'],
+            max_bytes=ai_config['dreamcore']['max_bytes'],
+            eviction_low_water=ai_config['dreamcore']['eviction_low_water'],
+            hot_memories_per_emotion=ai_config['dreamcore']['hot_memories_per_emotion'],
+            warm_page_size=ai_config['dreamcore']['warm_page_size'],
+            warm_pause_ms=ai_config['dreamcore']['warm_pause_ms'],
+            trace_batch_size=ai_config['dreamcore']['trace_batch_size'],
+            trace_retention_minutes=ai_config['dreamcore']['trace_retention_minutes'],
+            consolidation_interval_seconds=ai_config['dreamcore']['consolidation_interval_seconds'],
+            consolidation_budget_ms=ai_config['dreamcore']['consolidation_budget_ms'],
+            consolidation_page_size=ai_config['dreamcore']['consolidation_page_size']
+        )
         await ai_systems['dreamcore'].initialize()
         
-        ai_systems['nexus'] = NexusSignalEngine(ai_config['nexus']['db_path'])
+        ai_systems['nexus'] = NexusSignalEngine(
+            ai_config['nexus']['db_path'],
+            rotation_mode=ai_config['nexus']['rotation_mode'],
+            cache_size=ai_config['nexus']['cache_size'],
+            cache_max_bytes=ai_config['nexus']['cache_max_bytes'],
+            cache_ttl_seconds=ai_config['nexus']['cache_ttl_seconds'],
+            stream_window_size=ai_config['nexus']['stream_window_size'],
+            max_stream_sessions=ai_config['nexus']['max_stream_sessions'],
+            near_duplicate_threshold=ai_config['nexus']['near_duplicate_threshold'],
+            fingerprint_index_size=ai_config['nexus']['fingerprint_index_size'],
+            history_size=ai_config['nexus']['history_size']
+        )
         await ai_systems['nexus'].initialize()
         
-        ai_systems['aegis'] = AegisCouncil(ai_config['aegis']['db_path'])
+        ai_systems['aegis'] = AegisCouncil(
+            ai_config['aegis']['db_path'],
+            cache_size=ai_config['aegis']['cache_size'],
+            cache_max_bytes=ai_config['aegis']['cache_max_bytes'],
+            cache_ttl_seconds=ai_config['aegis']['cache_ttl_seconds'],
+            persist_cache_hits=ai_config['aegis']['persist_cache_hits']
+        )
         await ai_systems['aegis'].initialize()
         
         ai_systems['quantum'] = QuantumMultiObjectiveOptimizer(ai_config['quantum']['db_path'])
@@ -168,15 +206,43 @@ class CouncilRequest(BaseModel):
     input_text: str = Field(..., description="Text for council analysis")
     overrides: Dict[str, Any] = Field(default_factory=dict, description="Agent overrides")
 
+class CouncilBatchRequest(BaseModel):
+    input_texts: List[str] = Field(..., description="Texts for council analysis in one batch")
+    overrides: Dict[str, Any] = Field(default_factory=dict, description="Agent overrides")
+
 class MemoryRequest(BaseModel):
     emotion_tag: str = Field(..., description="Emotion tag for memory")
     content: str = Field(..., description="Memory content")
     emotional_weight: float = Field(0.5, description="Emotional weight (0-1)")
 
+class MemoryRecallRequest(BaseModel):
+    text: str = Field(..., description="Text to find related memories for")
+    k: int = Field(10, description="Number of memories to recall")
+    emotion_tag: Optional[str] = Field(None, description="Emotion to bias recall towards")
+
+class WakeTrace(BaseModel):
+    trigger_event: str = Field(..., description="Editor event that triggered the trace")
+    emotional_response: float = Field(..., description="Emotional response to the event")
+    cognitive_state: Union[str, Dict[str, Any]] = Field(default_factory=dict, description="Cognitive state at the time")
+    timestamp: Optional[str] = Field(None, description="ISO timestamp of the event (default: now)")
+    memory_id: Optional[str] = Field(None, description="Memory the event relates to")
+
+class WakeTraceBatchRequest(BaseModel):
+    traces: List[WakeTrace] = Field(..., description="Wake-state traces to ingest")
+
 class CodeAnalysisRequest(BaseModel):
     code: str = Field(..., description="Code to analyze")
     language: str = Field(..., description="Programming language")
 
+class NexusBatchRequest(BaseModel):
+    signals: List[str] = Field(..., description="Signals to process in one batch")
+
+class NexusStreamOpenRequest(BaseModel):
+    window_size: Optional[int] = Field(None, description="Characters of history kept for analysis")
+
+class NexusStreamChunkRequest(BaseModel):
+    chunk: str = Field(..., description="Text appended to the stream")
+
 class MusicGenerationRequest(BaseModel):
     genre: str = Field("ambient", description="Music genre")
     mood: str = Field("focused", description="Music mood")
@@ -264,6 +330,101 @@ async def convene_council(request: CouncilRequest):
         logger.error(f"Council convening failed: {e}")
         raise HTTPException(status_code=500, detail=f"Council convening failed: {str(e)}")
 
+@app.post("/api/council/convene/batch")
+async def convene_council_batch(request: CouncilBatchRequest):
+    """Convene the Aegis Council on a batch of inputs"""
+    max_batch_size = get_ai_system_config()['aegis']['max_batch_size']
+    if len(request.input_texts) > max_batch_size:
+        raise HTTPException(status_code=413, detail=f"Batch exceeds {max_batch_size} inputs")
+    
+    try:
+        aegis_system = ai_systems.get('aegis')
+        if not aegis_system:
+            raise HTTPException(status_code=503, detail="Aegis Council not available")
+        
+        decisions = await aegis_system.convene_batch(
+            input_texts=request.input_texts,
+            overrides=request.overrides
+        )
+        
+        return {
+            "success": True,
+            "data": decisions,
+            "timestamp": datetime.utcnow().isoformat()
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Council batch convening failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Council batch convening failed: {str(e)}")
+
+@app.get("/api/council/decisions")
+async def query_council_decisions(
+    text: Optional[str] = None,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    decision: Optional[str] = None,
+    ethical_compliance: Optional[bool] = None,
+    min_consensus: Optional[float] = None,
+    max_consensus: Optional[float] = None,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    include_details: bool = False
+):
+    """Search stored council decisions, newest first, one cursor page at a time"""
+    try:
+        aegis_system = ai_systems.get('aegis')
+        if not aegis_system:
+            raise HTTPException(status_code=503, detail="Aegis Council not available")
+        
+        page = await aegis_system.query_decisions(
+            text=text,
+            start=start,
+            end=end,
+            decision=decision,
+            ethical_compliance=ethical_compliance,
+            min_consensus=min_consensus,
+            max_consensus=max_consensus,
+            limit=limit,
+            cursor=cursor,
+            include_details=include_details
+        )
+        
+        return {
+            "success": True,
+            "data": page,
+            "timestamp": datetime.utcnow().isoformat()
+        }
+        
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Council decision query failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Council decision query failed: {str(e)}")
+
+@app.get("/api/council/stats")
+async def get_council_stats():
+    """Get rolling Aegis Council analytics and the consensus trend"""
+    try:
+        aegis_system = ai_systems.get('aegis')
+        if not aegis_system:
+            raise HTTPException(status_code=503, detail="Aegis Council not available")
+        
+        return {
+            "success": True,
+            "data": aegis_system.get_analytics(),
+            "timestamp": datetime.utcnow().isoformat()
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Council stats failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Council stats failed: {str(e)}")
+
 # DreamCore Memory API
 @app.post("/api/memory/store")
 async def store_memory(request: MemoryRequest):
@@ -315,6 +476,150 @@ async def retrieve_memories(emotion_tag: Optional[str] = None, limit: int = 10):
         logger.error(f"Memory retrieval failed: {e}")
         raise HTTPException(status_code=500, detail=f"Memory retrieval failed: {str(e)}")
 
+@app.post("/api/memory/recall")
+async def recall_memories(request: MemoryRecallRequest):
+    """Recall the memories most similar to a piece of text"""
+    try:
+        dreamcore_system = ai_systems.get('dreamcore')
+        if not dreamcore_system:
+            raise HTTPException(status_code=503, detail="DreamCore system not available")
+        
+        memories = await dreamcore_system.recall_similar(
+            request.text,
+            k=request.k,
+            emotion_tag=request.emotion_tag
+        )
+        
+        return {
+            "success": True,
+            "data": memories,
+            "timestamp": datetime.utcnow().isoformat()
+        }
+        
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Memory recall failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Memory recall failed: {str(e)}")
+
+@app.get("/api/memory/search")
+async def search_memories(
+    query: str,
+    emotion_tag: Optional[str] = None,
+    limit: int = 10,
+    cursor: Optional[str] = None
+):
+    """Full-text search over memory content, ranked by relevance, weight and decay"""
+    try:
+        dreamcore_system = ai_systems.get('dreamcore')
+        if not dreamcore_system:
+            raise HTTPException(status_code=503, detail="DreamCore system not available")
+        
+        results = await dreamcore_system.search_memories(
+            query,
+            emotion_tag=emotion_tag,
+            limit=limit,
+            cursor=cursor
+        )
+        
+        return {
+            "success": True,
+            "data": results,
+            "timestamp": datetime.utcnow().isoformat()
+        }
+        
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Memory search failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Memory search failed: {str(e)}")
+
+@app.post("/api/memory/traces")
+async def record_wake_traces(request: WakeTraceBatchRequest):
+    """Ingest a batch of wake-state traces"""
+    max_batch_size = get_ai_system_config()['dreamcore']['max_trace_batch_size']
+    if len(request.traces) > max_batch_size:
+        raise HTTPException(status_code=413, detail=f"Batch exceeds {max_batch_size} traces")
+    
+    try:
+        dreamcore_system = ai_systems.get('dreamcore')
+        if not dreamcore_system:
+            raise HTTPException(status_code=503, detail="DreamCore system not available")
+        
+        accepted = await dreamcore_system.record_traces([trace.model_dump() for trace in request.traces])
+        
+        return {
+            "success": True,
+            "data": {"accepted": accepted},
+            "timestamp": datetime.utcnow().isoformat()
+        }
+        
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Trace ingestion failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Trace ingestion failed: {str(e)}")
+
+@app.get("/api/memory/traces")
+async def get_wake_traces(
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    memory_id: Optional[str] = None,
+    bucket_minutes: int = 1
+):
+    """Aggregated wake-state traces for a time window"""
+    try:
+        dreamcore_system = ai_systems.get('dreamcore')
+        if not dreamcore_system:
+            raise HTTPException(status_code=503, detail="DreamCore system not available")
+        
+        aggregates = await dreamcore_system.get_trace_aggregates(
+            start=start,
+            end=end,
+            memory_id=memory_id,
+            bucket_minutes=bucket_minutes
+        )
+        
+        return {
+            "success": True,
+            "data": aggregates,
+            "timestamp": datetime.utcnow().isoformat()
+        }
+        
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Trace query failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Trace query failed: {str(e)}")
+
+@app.get("/api/memory/stats")
+async def get_memory_stats():
+    """Get DreamCore memory counts, decay sweep and write-back statistics"""
+    try:
+        dreamcore_system = ai_systems.get('dreamcore')
+        if not dreamcore_system:
+            raise HTTPException(status_code=503, detail="DreamCore system not available")
+        
+        return {
+            "success": True,
+            "data": dreamcore_system.get_memory_stats(),
+            "timestamp": datetime.utcnow().isoformat()
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Memory stats failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Memory stats failed: {str(e)}")
+
 # Code Analysis APIs
 @app.post("/api/analysis/ethical")
 async def analyze_code_ethics(request: CodeAnalysisRequest):
@@ -373,7 +678,7 @@ async def process_signal(request: Dict[str, str]):
             raise HTTPException(status_code=503, detail="Nexus system not available")
         
         signal = request.get('signal', '')
-        result = nexus_system.process(signal)
+        result = await nexus_system.process(signal)
         
         return {
             "success": True,
@@ -385,6 +690,128 @@ async def process_signal(request: Dict[str, str]):
         logger.error(f"Signal processing failed: {e}")
         raise HTTPException(status_code=500, detail=f"Signal processing failed: {str(e)}")
 
+@app.post("/api/nexus/process/batch")
+async def process_signal_batch(request: NexusBatchRequest):
+    """Process a batch of signals through Nexus engine"""
+    max_batch_size = get_ai_system_config()['nexus']['max_batch_size']
+    if len(request.signals) > max_batch_size:
+        raise HTTPException(status_code=413, detail=f"Batch exceeds {max_batch_size} signals")
+    
+    try:
+        nexus_system = ai_systems.get('nexus')
+        if not nexus_system:
+            raise HTTPException(status_code=503, detail="Nexus system not available")
+        
+        results = await nexus_system.process_batch(request.signals)
+        
+        return {
+            "success": True,
+            "data": results,
+            "timestamp": datetime.utcnow().isoformat()
+        }
+        
+    except Exception as e:
+        logger.error(f"Signal batch processing failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Signal batch processing failed: {str(e)}")
+
+@app.post("/api/nexus/stream")
+async def open_signal_stream(request: NexusStreamOpenRequest):
+    """Open an incremental Nexus analysis session"""
+    max_signal_length = get_ai_system_config()['nexus']['max_signal_length']
+    if request.window_size is not None and not 0 < request.window_size <= max_signal_length:
+        raise HTTPException(status_code=400, detail=f"Window size must be between 1 and {max_signal_length}")
+    
+    try:
+        nexus_system = ai_systems.get('nexus')
+        if not nexus_system:
+            raise HTTPException(status_code=503, detail="Nexus system not available")
+        
+        session = nexus_system.open_stream(request.window_size)
+        
+        return {
+            "success": True,
+            "data": session,
+            "timestamp": datetime.utcnow().isoformat()
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Signal stream open failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Signal stream open failed: {str(e)}")
+
+@app.post("/api/nexus/stream/{session_id}/append")
+async def append_signal_stream(session_id: str, request: NexusStreamChunkRequest):
+    """Append a chunk to a Nexus stream and return the updated analysis"""
+    max_signal_length = get_ai_system_config()['nexus']['max_signal_length']
+    if len(request.chunk) > max_signal_length:
+        raise HTTPException(status_code=413, detail=f"Chunk exceeds {max_signal_length} characters")
+    
+    try:
+        nexus_system = ai_systems.get('nexus')
+        if not nexus_system:
+            raise HTTPException(status_code=503, detail="Nexus system not available")
+        
+        result = nexus_system.append_stream(session_id, request.chunk)
+        
+        return {
+            "success": True,
+            "data": result,
+            "timestamp": datetime.utcnow().isoformat()
+        }
+        
+    except HTTPException:
+        raise
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Signal stream not found")
+    except Exception as e:
+        logger.error(f"Signal stream append failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Signal stream append failed: {str(e)}")
+
+@app.post("/api/nexus/stream/{session_id}/close")
+async def close_signal_stream(session_id: str):
+    """Close a Nexus stream and return its final analysis"""
+    try:
+        nexus_system = ai_systems.get('nexus')
+        if not nexus_system:
+            raise HTTPException(status_code=503, detail="Nexus system not available")
+        
+        result = nexus_system.close_stream(session_id)
+        
+        return {
+            "success": True,
+            "data": result,
+            "timestamp": datetime.utcnow().isoformat()
+        }
+        
+    except HTTPException:
+        raise
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Signal stream not found")
+    except Exception as e:
+        logger.error(f"Signal stream close failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Signal stream close failed: {str(e)}")
+
+@app.get("/api/nexus/stats")
+async def get_signal_stats():
+    """Get Nexus processing, cache and lookup-tier statistics"""
+    try:
+        nexus_system = ai_systems.get('nexus')
+        if not nexus_system:
+            raise HTTPException(status_code=503, detail="Nexus system not available")
+        
+        return {
+            "success": True,
+            "data": nexus_system.get_processing_stats(),
+            "timestamp": datetime.utcnow().isoformat()
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Signal stats failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Signal stats failed: {str(e)}")
+
 # Music Generation API
 @app.post("/api/music/generate")
 async def generate_music(request: MusicGenerationRequest):
@@ -677,10 +1104,19 @@ async def start_backend():
                 "endpoints": [
                     "/api/quantum/optimize",
                     "/api/council/convene", 
+                    "/api/council/convene/batch",
+                    "/api/council/decisions",
+                    "/api/council/stats",
                     "/api/memory/store",
+                    "/api/memory/recall",
+                    "/api/memory/search",
+                    "/api/memory/traces",
+                    "/api/memory/stats",
                     "/api/analysis/ethical",
                     "/api/analysis/neural",
-                    "/api/nexus/process"
+                    "/api/nexus/process",
+                    "/api/nexus/process/batch",
+                    "/api/nexus/stream"
                 ]
             },
             "timestamp": datetime.utcnow().isoformat()
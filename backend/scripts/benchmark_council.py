@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Aegis Council Benchmarks
+Throughput and equivalence reports for council convening
+
+Usage:
+    python scripts/benchmark_council.py batch
+    python scripts/benchmark_council.py cache
+    python scripts/benchmark_council.py query --rows 1000000
+"""
+
+import os
+import sys
+import json
+import time
+import sqlite3
+import asyncio
+import tempfile
+import argparse
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+import numpy as np
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from ai_systems.aegis_council import AegisCouncil, RECOMMENDATIONS
+
+# Setup logging
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+logging.getLogger("ai_systems").setLevel(logging.WARNING)
+logger = logging.getLogger(__name__)
+
+VOCABULARY = (
+    "help user accessible friendly care support inclusive secure honest reliable "
+    "transparent valid understand learn analyze careful consider challenge improve "
+    "innovate tackle hack exploit vulnerability attack unsafe keyboard optimize "
+    "efficient fast performance scalable security implement the code with and"
+).split()
+
+
+def make_inputs(count: int, seed: int = 0) -> List[str]:
+    """Generate deterministic council inputs of 5-30 words"""
+    rng = np.random.default_rng(seed)
+    return [
+        " ".join(rng.choice(VOCABULARY, size=int(rng.integers(5, 31))))
+        for _ in range(count)
+    ]
+
+
+def comparable(decision: Dict[str, Any]) -> Dict[str, Any]:
+    """Decision as JSON data without its per-call id and timestamp"""
+    decision = json.loads(json.dumps(decision))
+    decision.pop("decision_id", None)
+    decision.pop("timestamp", None)
+    return decision
+
+
+async def _convene_throughput(inputs: List[str], batch_size: int, **council_options):
+    """Inputs per second through a fresh council backed by a temporary database"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        council = AegisCouncil(db_path=os.path.join(tmp_dir, "aegis.db"), **council_options)
+        await council.initialize()
+        try:
+            start = time.perf_counter()
+            if batch_size == 1:
+                decisions = [await council.convene(text) for text in inputs]
+            else:
+                decisions = []
+                for offset in range(0, len(inputs), batch_size):
+                    decisions.extend(await council.convene_batch(inputs[offset:offset + batch_size]))
+            elapsed = time.perf_counter() - start
+        finally:
+            await council.shutdown()
+    return len(inputs) / elapsed, decisions
+
+
+def benchmark_batch(iterations: int) -> None:
+    """Compare per-input convene() with convene_batch() on the same inputs"""
+    logger.info(f"Throughput (inputs/s), best of {iterations} runs")
+    logger.info(f"{'inputs':>8} {'convene()':>11} {'batch':>11} {'speedup':>9} {'identical':>10}")
+
+    for count in [100, 1000]:
+        inputs = make_inputs(count)
+        sequential = batched = 0.0
+        identical = True
+        for _ in range(iterations):
+            rate, single_decisions = asyncio.run(_convene_throughput(inputs, batch_size=1))
+            sequential = max(sequential, rate)
+            rate, batch_decisions = asyncio.run(_convene_throughput(inputs, batch_size=count))
+            batched = max(batched, rate)
+            identical &= [comparable(d) for d in single_decisions] == [comparable(d) for d in batch_decisions]
+        logger.info(f"{count:>8} {sequential:>11.0f} {batched:>11.0f} {batched / sequential:>8.1f}x {str(identical):>10}")
+
+
+def benchmark_cache(iterations: int) -> None:
+    """convene() throughput when inputs are re-submitted"""
+    logger.info(f"convene() throughput (inputs/s), 1000 calls, best of {iterations} runs")
+    logger.info(f"{'unique':>8} {'no cache':>10} {'persist hits':>13} {'skip hits':>10}")
+
+    for unique in [1000, 100, 10]:
+        inputs = (make_inputs(unique) * (1000 // unique))[:1000]
+        rates = [
+            max(asyncio.run(_convene_throughput(inputs, 1, **options))[0] for _ in range(iterations))
+            for options in ({"cache_ttl_seconds": 0}, {"persist_cache_hits": True}, {"persist_cache_hits": False})
+        ]
+        logger.info(f"{unique:>8} {rates[0]:>10.0f} {rates[1]:>13.0f} {rates[2]:>10.0f}")
+
+
+def _populate_decisions(db_path: str, rows: int) -> None:
+    """Bulk-load synthetic decisions through the council schema and its triggers"""
+    rng = np.random.default_rng(0)
+    start = datetime(2025, 1, 1)
+    reasons = [
+        f"The council {verdict.replace('_', ' ')}s this action. Strongest virtue demonstrated: {virtue}."
+        for verdict in RECOMMENDATIONS for virtue in ("compassion", "integrity", "wisdom", "courage")
+    ]
+    conn = sqlite3.connect(db_path)
+    chunk = 50000
+    for offset in range(0, rows, chunk):
+        count = min(chunk, rows - offset)
+        seconds = np.sort(rng.uniform(0, 30 * 86400, count)) + offset * (30 * 86400 / chunk)
+        decisions = rng.integers(0, len(RECOMMENDATIONS), count)
+        consensus = rng.random(count)
+        texts = make_inputs(count, seed=offset)
+        conn.executemany("""
+            INSERT INTO council_decisions
+            (id, input_text_redacted, decision_data, timestamp, consensus_strength, ethical_compliance,
+             decision, reasoning, config_version)
+            VALUES (?, ?, '{}', ?, ?, ?, ?, ?, '1')
+        """, [
+            (
+                f"{offset + i:016x}",
+                texts[i],
+                (start + timedelta(seconds=float(seconds[i]))).isoformat() + "Z",
+                float(consensus[i]),
+                int(decisions[i] < 2),
+                RECOMMENDATIONS[decisions[i]],
+                reasons[decisions[i] * 4 + i % 4]
+            )
+            for i in range(count)
+        ])
+        conn.commit()
+    conn.execute("ANALYZE")
+    conn.close()
+
+
+async def _query_latency(db_path: str, iterations: int) -> List[tuple]:
+    council = AegisCouncil(db_path=db_path)
+    await council.initialize()
+    cases = [
+        ("latest page", {}),
+        ("decision filter", {"decision": "reject"}),
+        ("compliance + 1 day", {"ethical_compliance": True, "start": "2025-01-10", "end": "2025-01-11"}),
+        ("consensus band", {"min_consensus": 0.9, "max_consensus": 0.95}),
+        ("text, rare word pair", {"text": "keyboard innovate scalable"}),
+        ("text, common word", {"text": "attack"}),
+        ("text + decision", {"text": "attack", "decision": "reject"}),
+        ("text + latest day", {"text": "attack", "start": "2026-08-22"}),
+    ]
+    results = []
+    try:
+        for label, filters in cases:
+            timings = []
+            for _ in range(iterations):
+                begin = time.perf_counter()
+                page = await council.query_decisions(limit=50, **filters)
+                timings.append((time.perf_counter() - begin) * 1000)
+            # Walk ten pages deep to show the cursor keeps page cost flat
+            begin = time.perf_counter()
+            for _ in range(10):
+                if not page["next_cursor"]:
+                    break
+                page = await council.query_decisions(limit=50, cursor=page["next_cursor"], **filters)
+            deep = (time.perf_counter() - begin) * 100
+            results.append((label, float(np.median(timings)), deep))
+    finally:
+        await council.shutdown()
+    return results
+
+
+def benchmark_query(iterations: int, rows: int = 1000000) -> None:
+    """Decision history query latency over a large synthetic table"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "aegis.db")
+
+        async def create_schema():
+            council = AegisCouncil(db_path=db_path)
+            await council.initialize()
+            await council.shutdown()
+
+        asyncio.run(create_schema())
+        begin = time.perf_counter()
+        _populate_decisions(db_path, rows)
+        logger.info(f"Loaded {rows} decisions in {time.perf_counter() - begin:.1f}s")
+
+        logger.info(f"{'query (50 rows/page)':<26} {'first page ms':>14} {'next pages ms':>14}")
+        for label, first, deep in asyncio.run(_query_latency(db_path, iterations)):
+            logger.info(f"{label:<26} {first:>14.2f} {deep:>14.2f}")
+
+
+BENCHMARKS = {
+    "batch": benchmark_batch,
+    "cache": benchmark_cache,
+    "query": benchmark_query,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Aegis Council benchmarks")
+    parser.add_argument("suite", nargs="*", help=f"Benchmarks to run: {', '.join(BENCHMARKS)} (default: all)")
+    parser.add_argument("--iterations", type=int, default=3, help="Runs per input count")
+    parser.add_argument("--rows", type=int, default=1000000, help="Stored decisions for the query benchmark")
+    args = parser.parse_args()
+    unknown = sorted(set(args.suite) - set(BENCHMARKS))
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(unknown)}")
+
+    for name in args.suite or BENCHMARKS:
+        logger.info(f"\n=== {name} ===")
+        if name == "query":
+            benchmark_query(args.iterations, args.rows)
+        else:
+            BENCHMARKS[name](args.iterations)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+"""
+DreamCore Memory Benchmarks
+Latency reports for memory retrieval and maintenance
+
+Usage:
+    python scripts/benchmark_dreamcore.py retrieve
+    python scripts/benchmark_dreamcore.py sweep
+    python scripts/benchmark_dreamcore.py recall --max-vectors 1000000
+    python scripts/benchmark_dreamcore.py footprint --max-memories 1000000
+    python scripts/benchmark_dreamcore.py traces
+    python scripts/benchmark_dreamcore.py consolidate
+    python scripts/benchmark_dreamcore.py search --max-memories 1000000
+"""
+
+import os
+import gc
+import sys
+import json
+import time
+import sqlite3
+import asyncio
+import tempfile
+import argparse
+import logging
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+import numpy as np
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from ai_systems.dreamcore_memory import DreamCoreMemory, RECALL_TEXT_DIM
+from utils.vector_index import VectorIndex, hashed_embedding
+
+# Setup logging
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+logging.getLogger("ai_systems").setLevel(logging.WARNING)
+logger = logging.getLogger(__name__)
+
+EMOTIONS = ["compassion", "curiosity", "fear", "joy", "sorrow", "ethics", "quantum", "wisdom", "courage", "integrity"]
+VOCABULARY = (
+    "learned fixed bug error success discover refactor test deploy review "
+    "understand realize problem solve complete user code memory quantum the a of"
+).split()
+STORE_SIZES = [1000, 10000, 100000]
+
+
+def percentiles(samples_ms: List[float]) -> Dict[str, float]:
+    """Return p50/p99 latency in milliseconds"""
+    return {
+        "p50": float(np.percentile(samples_ms, 50)),
+        "p99": float(np.percentile(samples_ms, 99))
+    }
+
+
+def populate(db_path: str, count: int, expired_fraction: float = 0.0, seed: int = 0, duplicate_fraction: float = 0.0) -> None:
+    """
+    Bulk-load synthetic memories; ``expired_fraction`` of them were last touched a year ago
+    and ``duplicate_fraction`` repeat the content and emotion of an earlier one
+    """
+    rng = np.random.default_rng(seed)
+    now = datetime.utcnow()
+    anchors = json.dumps([{"type": "emotion", "strength": 0.6, "content": "", "temporal_signature": now.isoformat(), "decay_factor": 0.95}])
+    rows = []
+    for i in range(count):
+        expired = rng.random() < expired_fraction
+        accessed = now - timedelta(days=365 if expired else float(rng.uniform(0, 2)))
+        if rows and rng.random() < duplicate_fraction:
+            emotion_tag, content = rows[int(rng.integers(len(rows)))][1:3]
+        else:
+            emotion_tag, content = EMOTIONS[i % len(EMOTIONS)], " ".join(rng.choice(VOCABULARY, size=12))
+        rows.append((
+            f"{i:016x}",
+            emotion_tag,
+            content,
+            float(rng.uniform(0.1, 1.0)),
+            accessed.isoformat() + "Z",
+            accessed.isoformat() + "Z",
+            0,
+            0.95,
+            anchors
+        ))
+    conn = sqlite3.connect(db_path)
+    conn.executemany("""
+        INSERT INTO memories
+        (id, emotion_tag, content_redacted, emotional_weight, created_at, last_accessed, access_count, decay_factor, anchors)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, rows)
+    conn.commit()
+    conn.close()
+
+
+async def _open_store(db_path: str, count: int, expired_fraction: float = 0.0, duplicate_fraction: float = 0.0) -> DreamCoreMemory:
+    """A fully warmed DreamCore instance over ``count`` bulk-loaded memories, background jobs disabled"""
+    schema = DreamCoreMemory(db_path=db_path, sweep_interval_seconds=None, consolidation_interval_seconds=None)
+    await schema.initialize()
+    await schema.shutdown()
+    populate(db_path, count, expired_fraction, duplicate_fraction=duplicate_fraction)
+
+    dreamcore = DreamCoreMemory(
+        db_path=db_path, sweep_interval_seconds=None, consolidation_interval_seconds=None, warm_pause_ms=0
+    )
+    await dreamcore.initialize()
+    if dreamcore._warm_task:
+        await dreamcore._warm_task
+    return dreamcore
+
+
+async def _retrieve_latency(count: int, calls: int) -> Dict[str, float]:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        dreamcore = await _open_store(os.path.join(tmp_dir, "dreamcore.db"), count, expired_fraction=0.1)
+        try:
+            results = {}
+            for label, emotion_tag in (("all", None), ("one emotion", "joy")):
+                changes = dreamcore.conn.total_changes
+                timings = []
+                for _ in range(calls):
+                    start = time.perf_counter()
+                    await dreamcore.retrieve_memories(emotion_tag=emotion_tag, limit=10)
+                    timings.append((time.perf_counter() - start) * 1000)
+                results[label] = percentiles(timings)["p50"]
+                results[f"{label} writes"] = dreamcore.conn.total_changes - changes
+        finally:
+            await dreamcore.shutdown()
+    return results
+
+
+def benchmark_retrieve(iterations: int) -> None:
+    """Top-10 retrieval latency as the store grows (10% of memories decayed)"""
+    logger.info(f"{'memories':>9} {'all p50 ms':>11} {'emotion p50 ms':>15} {'db writes':>10}")
+    for count in STORE_SIZES:
+        result = asyncio.run(_retrieve_latency(count, calls=20 * iterations))
+        writes = result["all writes"] + result["one emotion writes"]
+        logger.info(f"{count:>9} {result['all']:>11.2f} {result['one emotion']:>15.2f} {writes:>10}")
+
+
+async def _sweep_latency(count: int) -> Dict[str, float]:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        dreamcore = await _open_store(os.path.join(tmp_dir, "dreamcore.db"), count, expired_fraction=0.1)
+        try:
+            start = time.perf_counter()
+            removed = await dreamcore.sweep_expired()
+            first = (time.perf_counter() - start) * 1000
+            start = time.perf_counter()
+            await dreamcore.sweep_expired()
+            idle = (time.perf_counter() - start) * 1000
+        finally:
+            await dreamcore.shutdown()
+    return {"removed": removed, "first": first, "idle": idle}
+
+
+def benchmark_sweep(iterations: int) -> None:
+    """Batched purge of decayed memories, then an idle sweep"""
+    logger.info(f"{'memories':>9} {'removed':>8} {'sweep ms':>9} {'idle sweep ms':>14}")
+    for count in STORE_SIZES:
+        result = asyncio.run(_sweep_latency(count))
+        logger.info(f"{count:>9} {result['removed']:>8} {result['first']:>9.1f} {result['idle']:>14.3f}")
+
+
+def topical_vectors(count: int, seed: int = 0) -> np.ndarray:
+    """Recall embeddings of synthetic memories drawn from 200 topics of 50 words each"""
+    rng = np.random.default_rng(seed)
+    emotions = rng.normal(size=(len(EMOTIONS), 10))
+    emotions /= np.linalg.norm(emotions, axis=1)[:, None]
+    vectors = np.zeros((count, RECALL_TEXT_DIM + 10), dtype=np.float32)
+    for i in range(count):
+        topic = int(rng.integers(200))
+        words = [f"t{topic}w{j}" for j in rng.integers(0, 50, 12)] + list(rng.choice(VOCABULARY, 3))
+        vectors[i, :RECALL_TEXT_DIM] = hashed_embedding(" ".join(words), RECALL_TEXT_DIM)
+        vectors[i, RECALL_TEXT_DIM:] = emotions[i % len(EMOTIONS)] * 0.5
+    return vectors / np.linalg.norm(vectors, axis=1)[:, None]
+
+
+def benchmark_recall(iterations: int, max_vectors: int = 1000000) -> None:
+    """Top-10 recall latency, exact versus IVF, and the IVF result overlap"""
+    logger.info(f"{'vectors':>9} {'exact p50 ms':>13} {'ivf p50 ms':>11} {'ivf recall@10':>14} {'train s':>8}")
+    queries = topical_vectors(20 * iterations, seed=1)
+    for count in [size for size in STORE_SIZES + [1000000] if size <= max_vectors]:
+        vectors = topical_vectors(count)
+        lists = max(16, int(np.sqrt(count)))
+        exact = VectorIndex(vectors.shape[1], initial_capacity=count)
+        quantized = VectorIndex(vectors.shape[1], ivf_lists=lists, ivf_min_vectors=0, ivf_probes=16, initial_capacity=count)
+        for i, vector in enumerate(vectors):
+            exact.add(str(i), vector)
+            quantized.add(str(i), vector)
+        start = time.perf_counter()
+        quantized.train_quantizer()
+        train = time.perf_counter() - start
+
+        timings = {"exact": [], "ivf": []}
+        overlap = 0
+        for query in queries:
+            results = {}
+            for label, index in (("exact", exact), ("ivf", quantized)):
+                start = time.perf_counter()
+                results[label] = {item_id for item_id, _ in index.search(query, 10)}
+                timings[label].append((time.perf_counter() - start) * 1000)
+            overlap += len(results["exact"] & results["ivf"])
+        logger.info(
+            f"{count:>9} {percentiles(timings['exact'])['p50']:>13.2f} {percentiles(timings['ivf'])['p50']:>11.2f} "
+            f"{overlap / (10 * len(queries)):>14.2f} {train:>8.1f}"
+        )
+
+
+async def _startup_footprint(count: int) -> Dict[str, float]:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "dreamcore.db")
+        # First start embeds every memory and saves the recall vectors
+        warm = await _open_store(db_path, count)
+        await warm.shutdown()
+
+        gc.collect()
+        tracemalloc.start()
+        start = time.perf_counter()
+        dreamcore = DreamCoreMemory(
+            db_path=db_path, sweep_interval_seconds=None, flush_interval_ms=None,
+            consolidation_interval_seconds=None, warm_pause_ms=0
+        )
+        await dreamcore.initialize()
+        ready = time.perf_counter() - start
+        if dreamcore._warm_task:
+            await dreamcore._warm_task
+        elapsed = time.perf_counter() - start
+        gc.collect()
+        traced = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        await dreamcore.shutdown()
+    return {"bytes": traced, "ready": ready, "seconds": elapsed}
+
+
+def benchmark_footprint(iterations: int, max_memories: int = 1000000) -> None:
+    """Time to readiness and to a fully warm store, and the Python heap it then holds (recall vectors are memory-mapped)"""
+    logger.info(f"{'memories':>9} {'heap MB':>9} {'bytes/memory':>13} {'ready s':>8} {'warm s':>7}")
+    for count in [size for size in [10000, 100000, 1000000] if size <= max_memories]:
+        result = asyncio.run(_startup_footprint(count))
+        logger.info(
+            f"{count:>9} {result['bytes'] / 2**20:>9.1f} {result['bytes'] / count:>13.0f} "
+            f"{result['ready']:>8.2f} {result['seconds']:>7.1f}"
+        )
+
+
+async def _trace_throughput(events: int, request_size: int) -> Dict[str, float]:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        dreamcore = await _open_store(os.path.join(tmp_dir, "dreamcore.db"), 1000)
+        try:
+            rng = np.random.default_rng(0)
+            memory_ids = list(dreamcore.memories)
+            now = datetime.utcnow()
+            traces = [
+                {
+                    "trigger_event": EMOTIONS[i % len(EMOTIONS)],
+                    "emotional_response": float(rng.uniform(-1, 1)),
+                    "cognitive_state": {"focus": 0.5},
+                    "timestamp": (now - timedelta(seconds=float(rng.uniform(0, 3600)))).isoformat() + "Z",
+                    "memory_id": memory_ids[i % len(memory_ids)] if i % 4 == 0 else None
+                }
+                for i in range(events)
+            ]
+            start = time.perf_counter()
+            for offset in range(0, events, request_size):
+                await dreamcore.record_traces(traces[offset:offset + request_size])
+            await dreamcore.flush_traces()
+            elapsed = time.perf_counter() - start
+
+            timings = []
+            for memory_id in [None] + memory_ids[:20]:
+                query_start = time.perf_counter()
+                await dreamcore.get_trace_aggregates(memory_id=memory_id, bucket_minutes=5)
+                timings.append((time.perf_counter() - query_start) * 1000)
+            commit_ms = dreamcore.trace_commit_latency_ms.mean
+        finally:
+            await dreamcore.shutdown()
+    return {"rate": events / elapsed, "commit_ms": commit_ms, "query_ms": percentiles(timings)["p50"]}
+
+
+def benchmark_traces(iterations: int) -> None:
+    """Wake-state trace ingestion rate with group commits, and hour-window query latency"""
+    logger.info(f"{'events':>8} {'per request':>12} {'events/s':>9} {'commit ms':>10} {'query p50 ms':>13}")
+    for request_size in (1, 100, 1000):
+        events = 20000 * iterations
+        result = asyncio.run(_trace_throughput(events, request_size))
+        logger.info(
+            f"{events:>8} {request_size:>12} {result['rate']:>9.0f} {result['commit_ms']:>10.2f} {result['query_ms']:>13.2f}"
+        )
+
+
+async def _consolidation_pass(count: int) -> Dict[str, float]:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        dreamcore = await _open_store(os.path.join(tmp_dir, "dreamcore.db"), count, duplicate_fraction=0.2)
+        try:
+            timings = []
+            merged = 0
+            while dreamcore.consolidation_passes == 0:
+                start = time.perf_counter()
+                merged += (await dreamcore.consolidate())["merged"]
+                timings.append((time.perf_counter() - start) * 1000)
+        finally:
+            await dreamcore.shutdown()
+    return {
+        "merged": merged,
+        "cycles": len(timings),
+        "p50": percentiles(timings)["p50"],
+        "max": max(timings),
+        "rate": count / (sum(timings) / 1000)
+    }
+
+
+def benchmark_consolidate(iterations: int) -> None:
+    """One full consolidation pass over a store with 20% duplicates and no stored fingerprints"""
+    logger.info(f"{'memories':>9} {'merged':>7} {'cycles':>7} {'cycle p50 ms':>13} {'cycle max ms':>13} {'rows/s':>8}")
+    for count in STORE_SIZES:
+        result = asyncio.run(_consolidation_pass(count))
+        logger.info(
+            f"{count:>9} {result['merged']:>7} {result['cycles']:>7} {result['p50']:>13.1f} "
+            f"{result['max']:>13.1f} {result['rate']:>8.0f}"
+        )
+
+
+async def _search_latency(count: int, calls: int) -> Dict[str, float]:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "dreamcore.db")
+        schema = DreamCoreMemory(db_path=db_path, sweep_interval_seconds=None, consolidation_interval_seconds=None)
+        await schema.initialize()
+        await schema.shutdown()
+        populate(db_path, count, expired_fraction=0.1)
+        conn = sqlite3.connect(db_path)
+        conn.execute("UPDATE memories SET content_redacted = content_redacted || ' segfault' WHERE rowid % 1000 = 0")
+        conn.commit()
+        conn.close()
+
+        # Search runs in SQLite, so only a small hot set is loaded and the warm-up never runs
+        dreamcore = DreamCoreMemory(
+            db_path=db_path, sweep_interval_seconds=None, flush_interval_ms=None,
+            consolidation_interval_seconds=None, hot_memories_per_emotion=10, warm_pause_ms=10 ** 9
+        )
+        await dreamcore.initialize()
+        try:
+            results = {"loaded": len(dreamcore.memories)}
+            for label, query, emotion_tag in (
+                ("rare", "segfault", None),
+                ("common", "deploy", None),
+                ("two words", "deploy review", None),
+                ("four words", "deploy review quantum memory", None),
+                ("one emotion", "deploy review", "joy"),
+            ):
+                timings = []
+                for _ in range(calls):
+                    start = time.perf_counter()
+                    await dreamcore.search_memories(query, emotion_tag=emotion_tag, limit=10)
+                    timings.append((time.perf_counter() - start) * 1000)
+                results[label] = percentiles(timings)["p50"]
+        finally:
+            await dreamcore.shutdown()
+    return results
+
+
+def benchmark_search(iterations: int, max_memories: int = 1000000) -> None:
+    """Full-text search p50 latency by query selectivity (0.1% of memories are rare matches, each vocabulary word is in ~40%)"""
+    labels = ("rare", "common", "two words", "four words", "one emotion")
+    logger.info(f"{'memories':>9} {'loaded':>7} " + " ".join(f"{label + ' ms':>14}" for label in labels))
+    for count in [size for size in [10000, 100000, 1000000] if size <= max_memories]:
+        result = asyncio.run(_search_latency(count, 10 * iterations))
+        logger.info(f"{count:>9} {result['loaded']:>7} " + " ".join(f"{result[label]:>14.2f}" for label in labels))
+
+
+BENCHMARKS = {
+    "retrieve": benchmark_retrieve,
+    "sweep": benchmark_sweep,
+    "recall": benchmark_recall,
+    "footprint": benchmark_footprint,
+    "traces": benchmark_traces,
+    "consolidate": benchmark_consolidate,
+    "search": benchmark_search,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DreamCore memory benchmarks")
+    parser.add_argument("suite", nargs="*", help=f"Benchmarks to run: {', '.join(BENCHMARKS)} (default: all)")
+    parser.add_argument("--iterations", type=int, default=3, help="Repetitions per measurement")
+    parser.add_argument("--max-vectors", type=int, default=1000000, help="Largest store for the recall benchmark")
+    parser.add_argument("--max-memories", type=int, default=1000000, help="Largest store for the footprint and search benchmarks")
+    args = parser.parse_args()
+    unknown = sorted(set(args.suite) - set(BENCHMARKS))
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(unknown)}")
+
+    for name in args.suite or BENCHMARKS:
+        logger.info(f"\n=== {name} ===")
+        if name == "recall":
+            benchmark_recall(args.iterations, args.max_vectors)
+        elif name == "footprint":
+            benchmark_footprint(args.iterations, args.max_memories)
+        elif name == "search":
+            benchmark_search(args.iterations, args.max_memories)
+        else:
+            BENCHMARKS[name](args.iterations)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,14 +7,25 @@ import pytest
 import asyncio
 import tempfile
 import os
-from datetime import datetime
+import hashlib
+import time
+import json
+import aiosqlite
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import FrozenInstanceError
+from datetime import datetime, timedelta
 
-from ai_systems.dreamcore_memory import DreamCoreMemory, MemoryAnchor
+from ai_systems.dreamcore_memory import DreamCoreMemory, MemoryAnchor, MemoryColumns
 from ai_systems.nexus_signal_engine import NexusSignalEngine
-from ai_systems.aegis_council import AegisCouncil
+from ai_systems.aegis_council import AegisCouncil, CouncilAnalytics, CouncilConfig
 from ai_systems.quantum_optimizer import QuantumMultiObjectiveOptimizer
 from ai_systems.ethical_governance import EthicalAIGovernance
 from ai_systems.neural_predictor import NeuralCodePredictor
+from utils.compact_cache import CompactCache
+from utils.fingerprint_index import FingerprintIndex, simhash
+from utils.rolling_stats import RollingStats, TimeWindow
+from utils.vector_index import VectorIndex, hashed_embedding
 
 class TestDreamCoreMemory:
     """Test DreamCore Memory System"""
@@ -59,6 +70,507 @@ class TestDreamCoreMemory:
         assert "curiosity" in emotional_state
         assert emotional_state["joy"] > emotional_state["curiosity"]  # More joy memories
 
+    @pytest.mark.asyncio
+    async def test_lazy_decay_and_sweep(self, temp_db):
+        """Test decay is computed on read and expired memories are swept in batches"""
+        dreamcore = DreamCoreMemory(
+            db_path=temp_db, sweep_interval_seconds=None, sweep_batch_size=2, flush_interval_ms=None
+        )
+        await dreamcore.initialize()
+
+        fresh = await dreamcore.store_memory("joy", "Fresh success", 0.9)
+        faded = [await dreamcore.store_memory("joy", f"Old note {i}", 0.1) for i in range(3)]
+        for memory_id in faded:
+            memory = dreamcore.memories[memory_id]
+            memory.last_accessed -= timedelta(days=30)
+        dreamcore._rebuild_indexes()
+
+        # Reads skip faded memories and leave writes to the write-back
+        changes = dreamcore.conn.total_changes
+        for _ in range(3):
+            memories = await dreamcore.retrieve_memories(emotion_tag="joy")
+        assert [m["id"] for m in memories] == [fresh]
+        assert memories[0]["decay_factor"] == 0.95
+        assert memories[0]["strength"] == pytest.approx(1.0)
+        assert dreamcore.conn.total_changes == changes
+
+        assert await dreamcore.sweep_expired() == 3
+        assert set(dreamcore.memories) == {fresh}
+        async with dreamcore.conn.execute("SELECT id FROM memories") as cursor:
+            assert [row[0] async for row in cursor] == [fresh]
+
+        # Access restarts the decay clock
+        memory = dreamcore.memories[fresh]
+        memory.last_accessed -= timedelta(days=10)
+        old_expiry = memory.expires_at(dreamcore.decay_threshold)
+        dreamcore._rebuild_indexes()
+        await dreamcore.retrieve_memories()
+        assert await dreamcore.sweep_expired(now=old_expiry + 1) == 0
+        assert fresh in dreamcore.memories
+        await dreamcore.shutdown()
+
+        # Stored "Z" timestamps reload as naive UTC
+        reloaded = DreamCoreMemory(db_path=temp_db, sweep_interval_seconds=None)
+        await reloaded.initialize()
+        assert reloaded.memories[fresh].created_at.tzinfo is None
+        assert len(await reloaded.retrieve_memories(emotion_tag="joy")) == 1
+        await reloaded.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_emotion_indexes(self, temp_db):
+        """Test top-k retrieval and emotional state come from the per-emotion indexes"""
+        dreamcore = DreamCoreMemory(db_path=temp_db, sweep_interval_seconds=None)
+        await dreamcore.initialize()
+
+        emotions = ["joy", "fear", "curiosity"]
+        for i in range(30):
+            await dreamcore.store_memory(emotions[i % 3], f"Memory number {i}", round(0.1 + (i * 7 % 30) / 33, 3))
+        faded = await dreamcore.store_memory("joy", "Strong but long forgotten", 1.0)
+        dreamcore.memories[faded].last_accessed -= timedelta(days=400)
+        dreamcore._rebuild_indexes()
+
+        def expected(tag, k):
+            live = [
+                m for m in dreamcore.memories.values()
+                if m.id != faded and (tag is None or m.emotion_tag == tag)
+            ]
+            live.sort(key=lambda m: (m.emotional_weight, m.last_accessed), reverse=True)
+            return [m.id for m in live[:k]]
+
+        for tag in [None, "joy", "fear", "missing"]:
+            want = expected(tag, 4)
+            counts = {memory_id: m.access_count for memory_id, m in dreamcore.memories.items()}
+            got = await dreamcore.retrieve_memories(emotion_tag=tag, limit=4)
+            assert [m["id"] for m in got] == want
+            # Only the returned memories are touched
+            for memory_id, m in dreamcore.memories.items():
+                assert m.access_count == counts[memory_id] + (memory_id in want)
+
+        # Repeated reads keep each index bounded
+        for _ in range(200):
+            await dreamcore.retrieve_memories(emotion_tag="joy", limit=3)
+        assert len(dreamcore._emotion_index["joy"]) <= 2 * dreamcore.emotion_counts["joy"] + 64
+
+        # Emotional state matches a scan of memories accessed in the last hour
+        state = await dreamcore.get_emotional_state()
+        recent = [m for m in dreamcore.memories.values() if m.id != faded]
+        total = sum(m.emotional_weight for m in recent)
+        for emotion in emotions:
+            share = sum(m.emotional_weight for m in recent if m.emotion_tag == emotion) / total
+            assert state[emotion] == pytest.approx(share)
+
+        assert await dreamcore.sweep_expired() == 1
+        assert dreamcore.emotion_counts == {"joy": 10, "fear": 10, "curiosity": 10}
+        assert dreamcore.emotion_weights["joy"] == pytest.approx(
+            sum(m.emotional_weight for m in recent if m.emotion_tag == "joy")
+        )
+        await dreamcore.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_access_stats_write_back(self, temp_db):
+        """Test access stats are flushed in batches, on a timer and at shutdown"""
+        dreamcore = DreamCoreMemory(
+            db_path=temp_db, sweep_interval_seconds=None, flush_interval_ms=None, flush_batch_size=3
+        )
+        await dreamcore.initialize()
+        ids = [await dreamcore.store_memory("joy", f"Memory {i}", 0.5 + i / 10) for i in range(4)]
+
+        async def stored_counts():
+            async with dreamcore.conn.execute("SELECT id, access_count FROM memories") as cursor:
+                return {row[0]: row[1] async for row in cursor}
+
+        # Below the batch size nothing is written
+        await dreamcore.retrieve_memories(limit=2)
+        assert set((await stored_counts()).values()) == {0}
+        assert dreamcore.get_memory_stats()["write_back"]["pending"] == 2
+
+        # Reaching it flushes every pending memory in one go
+        await dreamcore.retrieve_memories(limit=4)
+        assert await stored_counts() == {ids[0]: 1, ids[1]: 1, ids[2]: 2, ids[3]: 2}
+        stats = dreamcore.get_memory_stats()
+        assert stats["write_back"]["pending"] == 0
+        assert stats["write_back"]["flushes"] == 1
+        assert stats["write_back"]["rows_flushed"] == 4
+        assert stats["emotions"]["joy"]["count"] == 4
+
+        # Shutdown writes whatever is still pending
+        await dreamcore.retrieve_memories(limit=1)
+        await dreamcore.shutdown()
+
+        reloaded = DreamCoreMemory(db_path=temp_db, sweep_interval_seconds=None, flush_interval_ms=10)
+        await reloaded.initialize()
+        assert reloaded.memories[ids[3]].access_count == 3
+        assert reloaded.memories[ids[0]].access_count == 1
+
+        # The timer flushes without any further reads
+        await reloaded.retrieve_memories(limit=1)
+        await asyncio.sleep(0.1)
+        assert reloaded.get_memory_stats()["write_back"]["pending"] == 0
+        assert reloaded.rows_flushed == 1
+        await reloaded.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_capacity_eviction(self, temp_db):
+        """Test weighted batch eviction to the archive table past the high-water mark"""
+        dreamcore = DreamCoreMemory(
+            db_path=temp_db, sweep_interval_seconds=None, flush_interval_ms=None,
+            max_memories=10, eviction_low_water=0.8
+        )
+        await dreamcore.initialize()
+
+        ids = [await dreamcore.store_memory("joy", f"Memory {i}", 0.5) for i in range(10)]
+        # Recalled memories outrank otherwise equal ones
+        for _ in range(3):
+            await dreamcore.retrieve_memories(emotion_tag="joy", limit=8)
+        assert await dreamcore.enforce_capacity() == 0
+
+        # Crossing the limit evicts down to the low-water mark in one batch
+        weak = [await dreamcore.store_memory("fear", "Faint memory 0", 0.05)]
+        assert dreamcore.eviction_runs == 1 and len(dreamcore.memories) == 8
+        assert set(dreamcore.memories) == set(ids[2:])
+
+        weak.append(await dreamcore.store_memory("fear", "Faint memory 1", 0.05))
+        await dreamcore.store_memory("joy", "Memory 10", 0.5)
+        assert dreamcore.eviction_runs == 1 and len(dreamcore.memories) == 10
+        await dreamcore.store_memory("joy", "Memory 11", 0.5)
+        assert dreamcore.eviction_runs == 2 and len(dreamcore.memories) == 8
+        assert set(dreamcore.memories) == set(ids[2:])
+
+        async with dreamcore.conn.execute("SELECT COUNT(*) FROM memories") as cursor:
+            assert (await cursor.fetchone())[0] == 8
+        async with dreamcore.conn.execute(
+            "SELECT id, content_redacted, eviction_score FROM memories_archive"
+        ) as cursor:
+            archived = {row[0]: row async for row in cursor}
+        assert len(archived) == 6 and set(weak) | set(ids[:2]) <= set(archived)
+        assert archived[weak[0]][1] == "Faint memory 0"
+        assert all(memory_id not in dreamcore.vector_index for memory_id in archived)
+
+        stats = dreamcore.get_memory_stats()["capacity"]
+        assert stats["memories_evicted"] == 6 and stats["eviction_runs"] == 2
+        assert stats["bytes"] == sum(dreamcore._footprint(m) for m in dreamcore.memories.values())
+        await dreamcore.shutdown()
+
+        # A byte budget evicts on reload once it is lowered
+        budget = 4 * dreamcore._footprint(next(iter(dreamcore.memories.values())))
+        reloaded = DreamCoreMemory(db_path=temp_db, sweep_interval_seconds=None, max_bytes=budget)
+        await reloaded.initialize()
+        assert reloaded.memory_bytes <= 0.9 * budget and len(reloaded.memories) == 3
+        await reloaded.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_columnar_store(self, temp_db):
+        """Test memories are held as columns and materialized only when returned"""
+        columns = MemoryColumns(capacity=2)
+        for i in range(5):
+            columns.add(f"m{i}", ["joy", "fear"][i % 2], i / 10, 1000.0 + i, 2000.0 + i, i, 0.95, 10 * i)
+        assert len(columns) == 5 and columns.tags == ["joy", "fear"]
+        row = columns["m3"]
+        assert (row.emotion_tag, row.emotional_weight, row.access_count, row.stored_bytes) == ("fear", 0.3, 3, 30)
+        row.access_count += 1
+        row.last_accessed += timedelta(seconds=5)
+        assert columns.access_counts[columns._slots["m3"]] == 4 and row.accessed_epoch == 2008.0
+        assert row.expires_at(0.1) == pytest.approx(columns.expires_at(np.array([columns._slots["m3"]]), 0.1)[0])
+
+        # Freed slots are reused rather than growing the columns
+        slot = columns._slots["m1"]
+        assert columns.remove("m1") and not columns.remove("m1")
+        columns.add("m5", "curiosity", 0.5, 0.0, 0.0, 0, 0.95, 0)
+        assert columns._slots["m5"] == slot and len(columns.weights) == 8
+        assert sorted(columns) == ["m0", "m2", "m3", "m4", "m5"]
+        assert sorted(columns.id_at(slot) for slot in columns.live_slots()) == sorted(columns)
+
+        dreamcore = DreamCoreMemory(db_path=temp_db, sweep_interval_seconds=None, flush_interval_ms=None)
+        await dreamcore.initialize()
+        memory_id = await dreamcore.store_memory("joy", "Solved the flaky test", 0.7)
+        stored = dreamcore.memories[memory_id]
+        assert not hasattr(stored, "content") and not hasattr(stored, "anchors")
+        memories = await dreamcore.retrieve_memories()
+        assert memories[0]["content"] == "Solved the flaky test"
+        assert {anchor["type"] for anchor in memories[0]["anchors"]} >= {"resilience", "emotion"}
+        assert memories[0]["created_at"] == stored.created_at.isoformat()
+        await dreamcore.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_lazy_startup(self, temp_db):
+        """Test startup loads a hot set per emotion and pages the rest in on demand"""
+        dreamcore = DreamCoreMemory(db_path=temp_db, sweep_interval_seconds=None)
+        await dreamcore.initialize()
+        for i in range(30):
+            for emotion in ("joy", "fear"):
+                await dreamcore.store_memory(emotion, f"{emotion} memory {i}", emotional_weight=0.2 + i / 50)
+        await dreamcore.shutdown()
+        async with aiosqlite.connect(temp_db) as conn:
+            await conn.execute("UPDATE memories SET last_accessed = ?", ((datetime.utcnow() - timedelta(days=1)).isoformat() + "Z",))
+            await conn.commit()
+
+        def lazy():
+            return DreamCoreMemory(
+                db_path=temp_db, sweep_interval_seconds=None, flush_interval_ms=None,
+                hot_memories_per_emotion=5, warm_page_size=4, warm_pause_ms=60000
+            )
+
+        reloaded = lazy()
+        await reloaded.initialize()
+        assert len(reloaded.memories) <= 14 and not reloaded.fully_loaded
+        joy = await reloaded.retrieve_memories(emotion_tag="joy", limit=12)
+        assert [m["content"] for m in joy] == [f"joy memory {i}" for i in range(29, 17, -1)]
+        everything = await reloaded.retrieve_memories(limit=60)
+        assert [m["emotional_weight"] for m in everything] == sorted((m["emotional_weight"] for m in everything), reverse=True)
+        assert len(everything) == 60 and reloaded.fully_loaded
+        assert reloaded.get_memory_stats()["loading"]["emotions_pending"] == 0
+        await reloaded.shutdown()
+
+        # Recall reads unloaded hits by id; the warm-up loads everything else
+        reloaded = lazy()
+        reloaded.warm_pause_ms = 0
+        await reloaded.initialize()
+        assert "fear memory 0" not in {m["content"] for m in await reloaded.retrieve_memories(limit=20)}
+        recalled = await reloaded.recall_similar("fear memory 0", k=1, emotion_tag="fear")
+        assert recalled[0]["content"] == "fear memory 0"
+        await reloaded._warm_task
+        assert reloaded.fully_loaded and len(reloaded.memories) == 60
+        assert reloaded.get_memory_stats()["loading"]["warm_up_seconds"] is not None
+        await reloaded.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_wake_traces(self, temp_db):
+        """Test traces are group-committed and queried from minute aggregates"""
+        dreamcore = DreamCoreMemory(
+            db_path=temp_db, sweep_interval_seconds=None, flush_interval_ms=None,
+            trace_batch_size=3, trace_retention_minutes=60
+        )
+        await dreamcore.initialize()
+        memory_id = await dreamcore.store_memory("curiosity", "Stepped through the debugger", 0.5)
+        old = (datetime.utcnow() - timedelta(days=2)).isoformat() + "Z"
+
+        with pytest.raises(ValueError):
+            await dreamcore.record_traces([{"trigger_event": "save", "emotional_response": 0.1}, {"trigger_event": ""}])
+        assert dreamcore.traces_ingested == 0
+
+        await dreamcore.record_traces([
+            {"trigger_event": "breakpoint", "emotional_response": 0.8, "memory_id": memory_id},
+            {"trigger_event": "save", "emotional_response": 0.2, "timestamp": old}
+        ])
+        assert dreamcore.traces_written == 0
+        recent = await dreamcore.get_trace_aggregates()
+        assert recent["totals"]["count"] == 1 and recent["totals"]["max_response"] == 0.8
+
+        await dreamcore.record_traces([
+            {"trigger_event": "test_failed", "emotional_response": -0.4, "memory_id": memory_id,
+             "cognitive_state": {"focus": 0.9}},
+        ])
+        assert dreamcore.traces_written == 3 and not dreamcore._trace_buffer
+        recent = await dreamcore.get_trace_aggregates(memory_id=memory_id, bucket_minutes=60)
+        assert recent["totals"]["count"] == 2 and recent["totals"]["mean_response"] == pytest.approx(0.2)
+        assert len(recent["buckets"]) == 1 and recent["buckets"][0]["min_response"] == -0.4
+
+        # Minutes past retention come from the persisted aggregates
+        past = await dreamcore.get_trace_aggregates(start=datetime.utcnow() - timedelta(days=3), end=datetime.utcnow(), bucket_minutes=60)
+        assert past["totals"]["count"] == 3 and past["buckets"][0]["count"] == 1
+        with pytest.raises(ValueError):
+            await dreamcore.get_trace_aggregates(start=datetime.utcnow() - timedelta(days=3))
+
+        # Deleting a memory detaches its traces instead of tripping the foreign key
+        assert await dreamcore.sweep_expired(now=time.time() + 10 ** 9) == 1
+        async with dreamcore.conn.execute("SELECT COUNT(*), COUNT(memory_id) FROM wake_state_traces") as cursor:
+            assert await cursor.fetchone() == (3, 0)
+        await dreamcore.record_traces([{"trigger_event": "save", "emotional_response": 0.5}])
+        await dreamcore.shutdown()
+
+        reloaded = DreamCoreMemory(db_path=temp_db, sweep_interval_seconds=None, trace_retention_minutes=60)
+        await reloaded.initialize()
+        assert (await reloaded.get_trace_aggregates())["totals"]["count"] == 3
+        assert (await reloaded.get_trace_aggregates(memory_id=memory_id))["totals"]["count"] == 2
+        await reloaded.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_consolidation(self, temp_db):
+        """Test consolidation cycles merge duplicates incrementally and resume after a restart"""
+        dreamcore = DreamCoreMemory(
+            db_path=temp_db, sweep_interval_seconds=None, flush_interval_ms=None,
+            consolidation_interval_seconds=None, consolidation_page_size=2
+        )
+        await dreamcore.initialize()
+        first = await dreamcore.store_memory("joy", "Fixed the login bug on 2024-01-01", 0.5)
+        await dreamcore.store_memory("fear", "Fixed the login bug on 2024-01-01", 0.5)
+        await dreamcore.store_memory("joy", "Shipped the release", 0.6)
+        second = await dreamcore.store_memory("joy", "fixed the  LOGIN bug on 2025-02-03", 0.4)
+        await dreamcore.store_memory("joy", "Fixed the login bug on 2024-01-01", 0.3)
+        await dreamcore.record_traces([{"trigger_event": "commit", "emotional_response": 0.7, "memory_id": second}])
+        await dreamcore.flush_traces()
+        # Older databases have no fingerprints; consolidation backfills them
+        await dreamcore.conn.execute("UPDATE memories SET fingerprint = NULL")
+        await dreamcore.conn.execute("UPDATE memories SET access_count = 4 WHERE id = ?", (second,))
+        await dreamcore.conn.commit()
+
+        assert await dreamcore.consolidate(budget_ms=0) == {"scanned": 2, "merged": 0}
+        await dreamcore.shutdown()
+
+        reloaded = DreamCoreMemory(
+            db_path=temp_db, sweep_interval_seconds=None, flush_interval_ms=None,
+            consolidation_interval_seconds=None, consolidation_page_size=2
+        )
+        await reloaded.initialize()
+        assert reloaded._consolidation_rowid == 2
+        assert await reloaded.consolidate(budget_ms=0) == {"scanned": 2, "merged": 1}
+        # The last duplicate's fingerprint is backfilled when its page is read
+        assert await reloaded.consolidate() == {"scanned": 1, "merged": 1}
+        assert reloaded.consolidation_passes == 1 and reloaded._consolidation_rowid == 0
+
+        assert len(reloaded.memories) == 3 and second not in reloaded.memories
+        merged = reloaded.memories[first]
+        assert merged.emotional_weight == pytest.approx(1 - 0.5 * 0.6 * 0.7)
+        assert merged.access_count == 4
+        assert reloaded.emotion_counts["joy"] == 2 and second not in reloaded.vector_index
+        async with reloaded.conn.execute("SELECT memory_id FROM wake_state_traces") as cursor:
+            assert await cursor.fetchall() == [(first,)]
+        memories = await reloaded.retrieve_memories(emotion_tag="joy")
+        assert memories[0]["id"] == first
+        assert len({(a["type"], a["content"]) for a in memories[0]["anchors"]}) == len(memories[0]["anchors"])
+        await reloaded.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_search_memories(self, temp_db):
+        """Test full-text search ranks by relevance, weight and decay and pages with a cursor"""
+        dreamcore = DreamCoreMemory(db_path=temp_db, sweep_interval_seconds=None, flush_interval_ms=None)
+        await dreamcore.initialize()
+        assert dreamcore.fts_enabled
+        strong = await dreamcore.store_memory("joy", "Deployed the payment service after fixing deployments", 0.9)
+        weak = await dreamcore.store_memory("joy", "Deployed the docs", 0.2)
+        faded = await dreamcore.store_memory("fear", "Deploying on Friday broke the payment service", 0.9)
+        await dreamcore.store_memory("fear", "Reviewed the design", 0.5)
+        # Memories stored before the index existed are picked up by the rebuild
+        await dreamcore.conn.execute("DELETE FROM memories_fts")
+        await dreamcore.conn.execute("DROP TABLE memories_fts")
+        await dreamcore.conn.execute(
+            "UPDATE memories SET last_accessed = ? WHERE id = ?",
+            ((datetime.utcnow() - timedelta(days=30)).isoformat() + "Z", faded)
+        )
+        await dreamcore.conn.commit()
+        await dreamcore.shutdown()
+
+        reloaded = DreamCoreMemory(db_path=temp_db, sweep_interval_seconds=None, flush_interval_ms=None)
+        await reloaded.initialize()
+        found = await reloaded.search_memories("DEPLOY")
+        assert [m["id"] for m in found["memories"]] == [strong, weak, faded]
+        assert found["next_cursor"] is None and found["memories"][0]["score"] > found["memories"][1]["score"]
+        assert found["memories"][0]["access_count"] == 0 and reloaded.memories[strong].access_count == 1
+
+        assert [m["id"] for m in (await reloaded.search_memories("payment deploy"))["memories"]] == [strong, faded]
+        assert [m["id"] for m in (await reloaded.search_memories("deploy", emotion_tag="fear"))["memories"]] == [faded]
+        assert (await reloaded.search_memories("deploy", emotion_tag='fe"ar'))["memories"] == []
+        assert (await reloaded.search_memories("payment OR NOT*"))["memories"] == []
+
+        first_page = await reloaded.search_memories("deploy", limit=2)
+        assert [m["id"] for m in first_page["memories"]] == [strong, weak]
+        second_page = await reloaded.search_memories("deploy", limit=2, cursor=first_page["next_cursor"])
+        assert [m["id"] for m in second_page["memories"]] == [faded] and second_page["next_cursor"] is None
+
+        # Triggers keep the index in step with deletes and replacements
+        await reloaded.conn.execute("DELETE FROM memories WHERE id = ?", (weak,))
+        memory = (await reloaded._materialize([reloaded.memories[strong]]))[0]
+        memory.content = "Rolled back the release"
+        await reloaded._persist_memory(memory)
+        assert [m["id"] for m in (await reloaded.search_memories("deploy"))["memories"]] == [faded]
+        assert [m["id"] for m in (await reloaded.search_memories("rolled"))["memories"]] == [strong]
+
+        for query, kwargs in (("", {}), ("?!", {}), ("deploy", {"limit": 0}), ("deploy", {"cursor": "bad"})):
+            with pytest.raises(ValueError):
+                await reloaded.search_memories(query, **kwargs)
+        assert reloaded.get_memory_stats()["search"]["searches"] == 9
+        await reloaded.shutdown()
+
+    def test_vector_index_search_and_persistence(self, tmp_path):
+        """Test exact and quantized top-k search, packed removal and memory-mapped reload"""
+        rng = np.random.default_rng(0)
+        centers = rng.normal(size=(20, 16))
+        vectors = centers[rng.integers(0, 20, 2000)] + rng.normal(scale=0.1, size=(2000, 16))
+        vectors = (vectors / np.linalg.norm(vectors, axis=1)[:, None]).astype(np.float32)
+
+        index = VectorIndex(16, initial_capacity=8)
+        for i, vector in enumerate(vectors):
+            index.add(f"v{i}", vector)
+        queries = vectors[:5] + np.float32(0.01)
+        brute = np.argsort(-(queries @ vectors.T), axis=1, kind="stable")[:, :10]
+        for hits, expected in zip(index.search_batch(queries, 10), brute):
+            assert [item_id for item_id, _ in hits] == [f"v{i}" for i in expected]
+
+        # Removal keeps rows packed and the id map consistent
+        assert index.remove("v0") and not index.remove("v0")
+        assert len(index) == 1999 and "v0" not in index
+        assert all(index.ids[index.positions[item_id]] == item_id for item_id in ("v1", "v1999"))
+        assert np.array_equal(index.vectors[index.positions["v1999"]], vectors[1999])
+        assert index.search(vectors[0], 1)[0][0] != "v0"
+
+        # The coarse quantizer finds nearly the same neighbours
+        quantized = VectorIndex(16, ivf_lists=20, ivf_min_vectors=1000, ivf_probes=4)
+        for i, vector in enumerate(vectors):
+            quantized.add(f"v{i}", vector)
+        overlap = [
+            len({item_id for item_id, _ in hits} & {item_id for item_id, _ in index.search(query, 10)})
+            for query, hits in zip(queries, quantized.search_batch(queries, 10))
+        ]
+        assert quantized.centroids is not None
+        assert sum(overlap) >= 45
+        for i in range(0, 2000, 7):
+            quantized.remove(f"v{i}")
+        quantized.add("v1", vectors[0])
+        listed = np.concatenate([np.array(members) for members in quantized._lists])
+        assert sorted(listed) == list(range(len(quantized)))
+        assert quantized.search(vectors[0], 1)[0][0] == "v1"
+
+        # Reload maps the saved matrix read-only until the first write
+        path = str(tmp_path / "vectors.json")
+        index.save(path)
+        index.save(path)
+        assert len(list(tmp_path.glob("*.npy"))) == 1
+        loaded = VectorIndex.load(path)
+        assert loaded.get_stats()["memory_mapped"]
+        assert loaded.search(queries[1], 10) == index.search(queries[1], 10)
+        loaded.add("extra", vectors[0])
+        assert not loaded.get_stats()["memory_mapped"] and len(loaded) == 2000
+        assert VectorIndex.load(str(tmp_path / "missing.json")) is None
+
+        assert np.linalg.norm(hashed_embedding("Fixed the parser bug", 32)) == pytest.approx(1.0)
+        assert not hashed_embedding("", 32).any()
+
+    @pytest.mark.asyncio
+    async def test_recall_similar(self, tmp_path):
+        """Test related-memory recall by text similarity"""
+        db_path = str(tmp_path / "dreamcore.db")
+        dreamcore = DreamCoreMemory(db_path=db_path, sweep_interval_seconds=None, flush_interval_ms=None)
+        await dreamcore.initialize()
+
+        parser = await dreamcore.store_memory("curiosity", "The parser crashed on nested brackets", 0.4)
+        deploy = await dreamcore.store_memory("joy", "Deployment pipeline finished green", 0.9)
+        await dreamcore.store_memory("fear", "Database migration lost an index", 0.6)
+
+        recalled = await dreamcore.recall_similar("nested brackets break the parser", k=2)
+        assert recalled[0]["id"] == parser
+        assert recalled[0]["similarity"] > recalled[1]["similarity"]
+        assert dreamcore.memories[parser].access_count == 1
+        with pytest.raises(ValueError):
+            await dreamcore.recall_similar("parser", k=0)
+
+        # Faded memories are skipped and swept ones leave the index
+        dreamcore.memories[parser].last_accessed -= timedelta(days=400)
+        dreamcore._rebuild_indexes()
+        assert parser not in [m["id"] for m in await dreamcore.recall_similar("parser brackets", k=3)]
+        assert await dreamcore.sweep_expired() == 1
+        assert parser not in dreamcore.vector_index
+        await dreamcore.shutdown()
+
+        # Vectors reload from the mapped file and are reconciled with the database
+        async with aiosqlite.connect(db_path) as conn:
+            await conn.execute("DELETE FROM memories WHERE id = ?", (deploy,))
+            await conn.commit()
+        reloaded = DreamCoreMemory(db_path=db_path, sweep_interval_seconds=None)
+        await reloaded.initialize()
+        assert set(reloaded.vector_index.ids) == set(reloaded.memories) and len(reloaded.memories) == 1
+        assert (await reloaded.recall_similar("migration index", k=1))[0]["emotion_tag"] == "fear"
+        await reloaded.shutdown()
+
 class TestNexusSignalEngine:
     """Test Nexus Signal Engine"""
     
@@ -96,9 +608,296 @@ class TestNexusSignalEngine:
         assert risk_assessment["risk_level"] == "high"
         assert len(risk_assessment["detected_risks"]) > 0
 
+    def test_structured_rotation_is_orthogonal_and_deterministic(self):
+        """Test structured rotation preserves norm and is seeded per signal"""
+        nexus = NexusSignalEngine(db_path="")
+        signal = np.arange(1, 301, dtype=np.float64)
+
+        rotated = nexus._structured_rotation(signal, seed=1234)
+
+        assert np.isclose(np.linalg.norm(rotated), np.linalg.norm(signal))
+        assert np.array_equal(rotated, nexus._structured_rotation(signal, seed=1234))
+        assert not np.allclose(rotated, nexus._structured_rotation(signal, seed=4321))
+
+    def test_rotation_modes_statistically_equivalent(self):
+        """Test harmonic metrics match the dense QR compatibility mode"""
+        dense = NexusSignalEngine(db_path="", rotation_mode="dense")
+        structured = NexusSignalEngine(db_path="", rotation_mode="structured")
+        words = ["function", "secure", "ethical", "data", "return", "user", "exploit", "the"]
+
+        metrics = {"dense": [], "structured": []}
+        for i in range(150):
+            signal = " ".join(words[(i * j) % len(words)] for j in range(2 + i % 40)) + f" #{i}"
+            signal_hash = hashlib.sha256(signal.encode()).hexdigest()
+            for mode, engine in (("dense", dense), ("structured", structured)):
+                analysis = engine._harmonic_analysis(engine._extract_features(signal), signal_hash)
+                metrics[mode].append([analysis[name] for name in (
+                    "dominant_frequency", "spectral_rolloff", "harmonic_complexity", "phase_coherence"
+                )])
+
+        dense_metrics = np.array(metrics["dense"])
+        structured_metrics = np.array(metrics["structured"])
+        spread = np.maximum(dense_metrics.std(axis=0), structured_metrics.std(axis=0))
+        mean_gap = np.abs(dense_metrics.mean(axis=0) - structured_metrics.mean(axis=0))
+
+        assert np.all(mean_gap < 0.35 * spread)
+
+    def test_unknown_rotation_mode_rejected(self):
+        """Test invalid rotation mode raises"""
+        with pytest.raises(ValueError):
+            NexusSignalEngine(db_path="", rotation_mode="qr")
+
+    @pytest.mark.asyncio
+    async def test_signal_scanned_once(self, temp_db, monkeypatch):
+        """Test every scorer reads from a single feature extraction pass"""
+        nexus = NexusSignalEngine(db_path=temp_db)
+        await nexus.initialize()
+
+        calls = []
+        extract = nexus._extract_features
+        monkeypatch.setattr(nexus, "_extract_features", lambda signal: calls.append(signal) or extract(signal))
+
+        signal = "Promote transparency and integrity; avoid biased, unethical privacy violations. eval(x)"
+        result = await nexus.process(signal)
+
+        assert len(calls) == 1
+        assert result["virtue_analysis"]["transparency"] == pytest.approx(0.3)
+        assert result["virtue_analysis"]["integrity"] == pytest.approx(0.3)
+        assert result["ethics_score"] == pytest.approx(0.35)  # "unethical" also contains "ethical"
+        assert "eval_usage" in result["risk_assessment"]["detected_risks"]
+        assert result["perspectives"]["Luke"]["virtue_alignment"] == result["virtue_analysis"]
+        assert "privacy_violation" in result["perspectives"]["Luke"]["ethical_concerns"]
+        await nexus.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_signal_cache_bounded_lru(self, temp_db):
+        """Test signal cache enforces its entry limit and reports counters"""
+        nexus = NexusSignalEngine(db_path=temp_db, cache_size=2)
+        await nexus.initialize()
+
+        first = await nexus.process("first signal <script>x</script>")
+        await nexus.process("second signal")
+        cached = await nexus.process("first signal <script>x</script>")
+        await nexus.process("third signal")  # evicts "second signal"
+
+        assert cached["signal_hash"] == first["signal_hash"]
+        assert cached["filtered_signal"] == first["filtered_signal"]
+        assert cached["perspectives"] == first["perspectives"]
+
+        stats = nexus.get_processing_stats()["cache"]
+        assert stats["entries"] == 2
+        assert stats["hits"] == 1
+        assert stats["evictions"] == 1
+        assert hashlib.sha256(b"second signal").hexdigest() not in nexus.signal_cache
+        await nexus.shutdown()
+
+    def test_signal_cache_ttl_and_byte_budget(self):
+        """Test cache expiry and byte-bounded eviction"""
+        cache = CompactCache(max_entries=10, max_bytes=200, ttl_seconds=0)
+        cache.put("a", {"value": 1})
+        assert cache.get("a") is None
+        assert cache.get_stats()["expirations"] == 1
+
+        cache = CompactCache(max_entries=10, max_bytes=200, ttl_seconds=60, exclude_fields=("blob",))
+        cache.put("a", {"value": "x" * 80, "blob": "y" * 10000})
+        cache.put("b", {"value": "x" * 80})
+        cache.put("c", {"value": "x" * 80})
+        assert cache.get("a") is None
+        assert cache.get("c") == {"value": "x" * 80}
+        assert cache.current_bytes <= 200
+        assert cache.get_stats()["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_process_batch_matches_process(self, temp_db):
+        """Test batched results equal per-signal results, with dedup and cache hits"""
+        signals = ["short", "a batch signal with eval(x)", "x" * 300, "short", "y" * 300]
+
+        single = NexusSignalEngine(db_path=":memory:")
+        await single.initialize()
+        expected = [await single.process(signal) for signal in signals]
+        await single.shutdown()
+
+        nexus = NexusSignalEngine(db_path=temp_db)
+        await nexus.initialize()
+        await nexus.process("short")
+        results = await nexus.process_batch(signals)
+
+        strip = lambda result: {k: v for k, v in result.items() if k != "timestamp"}
+        assert [strip(r) for r in results] == [strip(r) for r in expected]
+        assert nexus.signal_cache.get_stats()["hits"] == 1
+        assert len(nexus.processing_history) == 4
+
+        async with nexus.conn.execute("SELECT COUNT(*) FROM signal_analysis") as cursor:
+            assert (await cursor.fetchone())[0] == 4
+        await nexus.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_read_through_persistent_tier(self, temp_db):
+        """Test analyses stored by an earlier run are reused instead of recomputed"""
+        nexus = NexusSignalEngine(db_path=temp_db)
+        await nexus.initialize()
+        first = await nexus.process("stored signal")
+        await nexus.process_batch(["stored two", "stored three"])
+        await nexus.shutdown()
+
+        nexus = NexusSignalEngine(db_path=temp_db)
+        await nexus.initialize()
+        nexus.signal_cache.clear()  # as if evicted or beyond the warm-up window
+
+        assert await nexus.process("stored signal") == first
+        await nexus.process("stored signal")
+        await nexus.process_batch(["stored two", "stored three", "brand new"])
+
+        assert nexus.get_processing_stats()["lookup_tiers"] == {"memory": 1, "persistent": 3, "near_duplicate": 0, "computed": 1}
+        await nexus.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_near_duplicate_reuse(self, temp_db):
+        """Test near-duplicates borrow spectral results but keep their own risk scores"""
+        nexus = NexusSignalEngine(db_path=temp_db, near_duplicate_threshold=0.95)
+        await nexus.initialize()
+
+        original = await nexus.process("2026-10-16T12:00:01Z ERROR auth: user 42 failed login from 10.0.0.1")
+        variant_signal = "2026-10-17T08:30:59Z ERROR  auth: user 97 failed login from 10.0.3.7 "
+        variant = await nexus.process(variant_signal)
+        unrelated = await nexus.process("INFO request served in 12ms path=/api/health")
+
+        assert variant["reused_from"] == original["signal_hash"]
+        assert variant["similarity"] >= 0.95
+        assert variant["harmonic_analysis"] == original["harmonic_analysis"]
+        fresh = nexus._analyze_signal(variant_signal, variant["signal_hash"])
+        for key in ("risk_assessment", "virtue_analysis", "ethics_score", "input_length"):
+            assert variant[key] == fresh[key]
+        assert "reused_from" not in unrelated
+
+        tiers = nexus.get_processing_stats()["lookup_tiers"]
+        assert (tiers["near_duplicate"], tiers["computed"]) == (1, 2)
+        await nexus.shutdown()
+
+    def test_fingerprint_index_bounded(self):
+        """Test the SimHash index finds close fingerprints and evicts oldest entries"""
+        index = FingerprintIndex(threshold=0.95, max_entries=2)
+        fingerprint = simhash("user 42 failed login from 10.0.0.1")
+
+        index.add("a", fingerprint, "payload-a")
+        index.add("b", fingerprint ^ 0b111, "payload-b")  # 3 bits away
+        assert index.query(fingerprint ^ 0b1) == ("a", 1 - 1 / 64, "payload-a")
+        assert index.query(fingerprint ^ (0b1111 << 60)) is None  # 4 bits away
+
+        index.add("c", ~fingerprint & (2**64 - 1))
+        assert "a" not in index and len(index) == 2
+        assert index.query(fingerprint)[0] == "b"
+        assert index.get_stats()["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_processing_stats_ring_buffer(self, temp_db):
+        """Test history is a fixed-size ring with aggregates matching a full recount"""
+        nexus = NexusSignalEngine(db_path=temp_db, history_size=5)
+        await nexus.initialize()
+
+        signals = [f"signal {i} " + ("eval(x) <script>" if i % 3 == 0 else "ethical support") for i in range(12)]
+        for signal in signals:
+            await nexus.process(signal)
+
+        window = list(nexus.processing_history)
+        stats = nexus.get_processing_stats()
+        assert len(window) == 5
+        assert stats["lifetime_signals_processed"] == 12
+        assert stats["average_ethics_score"] == pytest.approx(np.mean([a["ethics_score"] for a in window]))
+        assert stats["risk_detections"] == sum(a["risk_assessment"]["risk_level"] == "high" for a in window)
+        assert sum(bucket["count"] for bucket in stats["per_minute"]) == 12
+        await nexus.shutdown()
+
+    def test_rolling_stats_buckets_and_ewma(self):
+        """Test rolling aggregates, EWMA and per-interval buckets"""
+        stats = RollingStats(maxlen=3, ewma_alpha=0.5, bucket_seconds=60, max_buckets=2)
+        for timestamp, value in [(0, 1.0), (30, 3.0), (70, 5.0), (130, 7.0)]:
+            stats.append(value, timestamp=timestamp)
+
+        assert list(stats) == [3.0, 5.0, 7.0]
+        assert stats.mean == pytest.approx(5.0)
+        assert stats.ewma == pytest.approx(5.25)
+        assert [(b["count"], b["mean"]) for b in stats.get_buckets(now=130)] == [(1, 5.0), (1, 7.0)]
+
+    @pytest.mark.asyncio
+    async def test_stream_matches_process_within_window(self, temp_db):
+        """Test streamed chunks score like the whole signal while it fits the window"""
+        nexus = NexusSignalEngine(db_path=temp_db)
+        await nexus.initialize()
+
+        chunks = ["Promote trans", "parency; ev", "al (x) and <scr", "ipt> privacy vio", "lations"]
+        session_id = nexus.open_stream(window_size=256)["session_id"]
+        for chunk in chunks:
+            streamed = nexus.append_stream(session_id, chunk)
+
+        expected = await nexus.process("".join(chunks))
+        for key in ("signal_hash", "input_length", "perspectives", "harmonic_analysis",
+                    "risk_assessment", "virtue_analysis", "ethics_score"):
+            assert streamed[key] == expected[key]
+
+        assert nexus.close_stream(session_id)["appends"] == len(chunks)
+        with pytest.raises(KeyError):
+            nexus.append_stream(session_id, "more")
+        await nexus.shutdown()
+
+    def test_stream_window_bounded(self):
+        """Test stream state tracks only the last window_size characters"""
+        nexus = NexusSignalEngine(db_path="")
+        session_id = nexus.open_stream(window_size=40)["session_id"]
+
+        history = ""
+        for i in range(50):
+            chunk = f"eval( chunk {i} ethical-unethical " * (i % 3)
+            history += chunk
+            result = nexus.append_stream(session_id, chunk)
+
+            stream = nexus.streams[session_id]
+            window = nexus._extract_features(history[-40:])
+            assert stream.length == len(history[-40:])
+            assert sum(len(chunk) for chunk in stream.chunks) == stream.length
+            assert np.array_equal(stream.features().char_counts, window.char_counts)
+            assert len(stream.bigram_counts) == window.unique_bigrams
+            assert stream.word_count == window.word_count
+            assert stream.term_counts == window.term_counts
+            assert stream.pattern_counts == window.pattern_counts
+
+        assert result["input_length"] == len(history)
+        assert result["signal_hash"] == hashlib.sha256(history.encode()).hexdigest()
+
+    @pytest.mark.parametrize("rotation_mode", ["structured", "dense"])
+    def test_parallel_analysis_matches_serial(self, rotation_mode):
+        """Test analyses on a thread pool are byte-identical to serial runs"""
+        nexus = NexusSignalEngine(db_path="", rotation_mode=rotation_mode)
+        count = 1000 if rotation_mode == "structured" else 100  # dense QR is slow
+        signals = [f"signal {i}: {'ethical ' * (i % 5)}eval(x) {i * 7919}" for i in range(count)]
+        hashes = [hashlib.sha256(signal.encode()).hexdigest() for signal in signals]
+
+        def analyze(item):
+            analysis = nexus._analyze_signal(*item)
+            analysis.pop("timestamp")
+            return json.dumps(analysis, sort_keys=True)
+
+        np.random.seed(0)
+        serial = [analyze(item) for item in zip(signals, hashes)]
+        assert np.random.random() == np.random.RandomState(0).random_sample()  # global RNG untouched
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            parallel = list(pool.map(analyze, zip(signals, hashes)))
+
+        assert parallel == serial
+
 class TestAegisCouncil:
     """Test Aegis Council"""
     
+    @staticmethod
+    def comparable(decision):
+        """Decision as JSON data without its per-call id, timestamp and trend forecast"""
+        decision = json.loads(json.dumps(decision))
+        decision.pop("decision_id", None)
+        decision.pop("timestamp", None)
+        decision.pop("temporal_forecast", None)
+        return decision
+    
     @pytest.mark.asyncio
     async def test_council_decision(self, temp_db):
         """Test council decision making"""
@@ -128,6 +927,265 @@ class TestAegisCouncil:
         virtue_profile = decision["virtue_profile"]
         assert virtue_profile["compassion"] > 0.5  # Should detect compassion
         assert virtue_profile["wisdom"] > 0.5      # Should detect wisdom
+    
+    @pytest.mark.asyncio
+    async def test_convene_batch_matches_convene(self, temp_db):
+        """Test batch convening returns the same decisions as sequential convening"""
+        council = AegisCouncil(db_path=temp_db)
+        await council.initialize()
+        
+        inputs = [
+            "Implement accessible user interface with proper ARIA labels",
+            "Optimize the fast path for scalable performance",
+            "Exploit this vulnerability with a malicious attack",
+            "Create compassionate error handling with helpful user guidance",
+            "",
+            "Zero\u200b\u200b\u200b\u200b\u200bwidth payload"
+        ]
+        overrides = {"SecurityAgent": {"reliability": 0.5}}
+        
+        batch = await council.convene_batch(inputs, overrides)
+        sequential = [await council.convene(text, overrides) for text in inputs]
+        
+        assert [self.comparable(d) for d in batch] == [self.comparable(d) for d in sequential]
+        assert batch[-1]["override_decision"] == "blocked"
+        assert len({d["decision_id"] for d in batch[:-1]}) == len(inputs) - 1
+        
+        async with council.conn.execute("SELECT COUNT(*) FROM council_decisions") as cursor:
+            assert (await cursor.fetchone())[0] == 2 * (len(inputs) - 1)
+        
+        # Stored records serialize votes once but match a plain dump
+        async with council.conn.execute(
+            "SELECT decision_data FROM council_decisions WHERE id = ?", (batch[0]["decision_id"],)
+        ) as cursor:
+            assert (await cursor.fetchone())[0] == json.dumps(batch[0])
+        
+        await council.shutdown()
+    
+    @pytest.mark.asyncio
+    async def test_overrides_isolated_per_request(self, temp_db):
+        """Test overrides apply to one request only, even when convenes overlap"""
+        council = AegisCouncil(db_path=temp_db)
+        await council.initialize()
+        base = council.config
+        inputs = ["Implement accessible user interface", "Optimize secure performance", "Exploit the attack"]
+        override_sets = [
+            {"VirtueAgent": {"influence": 0.1}, "SecurityAgent": {"reliability": 0.2}},
+            {"AccessibilityAgent": {"reliability": 0.0}},
+            None
+        ]
+        
+        expected = [
+            [self.comparable(d) for d in await council.convene_batch(inputs, overrides)]
+            for overrides in override_sets
+        ]
+        council.decision_cache.clear()
+        concurrent = await asyncio.gather(*(
+            council.convene_batch(inputs, overrides) for overrides in override_sets * 3
+        ))
+        
+        assert [[self.comparable(d) for d in batch] for batch in concurrent] == expected * 3
+        assert council.config is base
+        assert council.agents["VirtueAgent"].influence == 0.9
+        assert concurrent[0][0]["config_version"].startswith(f"{base.version}+")
+        assert concurrent[0][0]["config_version"] != concurrent[1][0]["config_version"]
+        assert concurrent[2][0]["config_version"] == base.version
+        
+        await council.shutdown()
+    
+    @pytest.mark.asyncio
+    async def test_config_snapshots_copy_on_write(self, temp_db):
+        """Test derived snapshots share unchanged state and cannot be mutated"""
+        council = AegisCouncil(db_path=temp_db)
+        await council.initialize()
+        base = council.config
+        
+        derived = base.with_overrides({"SecurityAgent": {"reliability": 1.7}, "UnknownAgent": {"influence": 0.1}})
+        assert derived.agents["SecurityAgent"].reliability == 1.0
+        assert derived.agents["VirtueAgent"] is base.agents["VirtueAgent"]
+        assert derived.virtue_weight_matrix is base.virtue_weight_matrix
+        assert base.agents["SecurityAgent"].reliability == 0.9
+        assert base.with_overrides({"SecurityAgent": {"reliability": 0.9}}) is base
+        assert derived.with_overrides({}) is derived
+        
+        with pytest.raises(FrozenInstanceError):
+            base.agents["VirtueAgent"].influence = 0.1
+        with pytest.raises(TypeError):
+            base.agents["VirtueAgent"].virtue_weights["wisdom"] = 1.0
+        with pytest.raises(ValueError):
+            base.reliability_vector[0] = 0.0
+        
+        # Published updates bump the version; earlier snapshots are untouched
+        assert council.update_agents({"PerformanceAgent": {"influence": 0.5}}) == "2"
+        assert council.agents["PerformanceAgent"].influence == 0.5
+        assert base.agents["PerformanceAgent"].influence == 0.75
+        assert (await council.convene("Optimize the code"))["config_version"] == "2"
+        assert isinstance(council.config, CouncilConfig)
+        
+        await council.shutdown()
+    
+    @pytest.mark.asyncio
+    async def test_decision_cache(self, temp_db):
+        """Test repeated inputs are answered from the decision cache"""
+        council = AegisCouncil(db_path=temp_db, persist_cache_hits=False)
+        await council.initialize()
+        text = "Fix typo in accessible user onboarding docs"
+        
+        first = await council.convene(text)
+        repeat = await council.convene(text)
+        assert self.comparable(repeat) == self.comparable(first)
+        assert repeat["decision_id"] == first["decision_id"]
+        assert council.decision_lookups == {"cached": 1, "computed": 1}
+        
+        # Overrides and configuration updates change the key
+        overridden = await council.convene(text, {"VirtueAgent": {"influence": 0.2}})
+        assert overridden["config_version"] != first["config_version"]
+        assert council.decision_lookups == {"cached": 1, "computed": 2}
+        
+        # Repeats within a batch are decided once
+        batch = await council.convene_batch([text, "Add unit tests", "Add unit tests"])
+        assert self.comparable(batch[0]) == self.comparable(first)
+        assert self.comparable(batch[2]) == self.comparable(batch[1])
+        assert batch[2] is not batch[1]
+        assert council.decision_lookups == {"cached": 3, "computed": 3}
+        
+        async with council.conn.execute("SELECT COUNT(*) FROM council_decisions") as cursor:
+            assert (await cursor.fetchone())[0] == 3
+        
+        status = await council.get_status()
+        assert status["cache_hit_ratio"] == 0.5
+        assert status["decision_cache"]["hits"] == 2
+        
+        council.update_agents({"SecurityAgent": {"severity": 0.5}})
+        assert len(council.decision_cache) == 0
+        await council.convene(text)
+        assert council.decision_lookups["computed"] == 4
+        
+        # Hits are stored as new records when persistence is enabled
+        council.persist_cache_hits = True
+        again = await council.convene(text)
+        assert again["decision_id"] != first["decision_id"]
+        async with council.conn.execute("SELECT COUNT(*) FROM council_decisions") as cursor:
+            assert (await cursor.fetchone())[0] == 5
+        
+        await council.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_query_decisions(self, temp_db):
+        """Test filtered, cursor-paginated decision history queries"""
+        council = AegisCouncil(db_path=temp_db, persist_cache_hits=True)
+        await council.initialize()
+        steps = ["alpha", "bravo", "charlie", "delta", "echo"]
+        texts = [f"Add accessible onboarding step {step}" for step in steps] + ["Exploit the login vulnerability"]
+        decisions = await council.convene_batch(texts)
+        # A re-stored decision updates its row and search entry in place
+        await council._store_decisions([("Rewritten input", decisions[0], json.dumps(decisions[0]), [])])
+
+        pages, cursor = [], None
+        while True:
+            page = await council.query_decisions(limit=4, cursor=cursor)
+            pages.append(page["decisions"])
+            cursor = page["next_cursor"]
+            if not cursor:
+                break
+        ids = [d["decision_id"] for page in pages for d in page]
+        assert [len(page) for page in pages] == [4, 2]
+        assert sorted(ids) == sorted(d["decision_id"] for d in decisions)
+
+        matches = await council.query_decisions(text="vulnerability")
+        assert [d["decision_id"] for d in matches["decisions"]] == [decisions[5]["decision_id"]]
+        assert (await council.query_decisions(text="onboarding", limit=2))["next_cursor"]
+        assert len((await council.query_decisions(text="rewritten"))["decisions"]) == 1
+        assert len((await council.query_decisions(text="onboarding step alpha"))["decisions"]) == 0
+
+        verdict = decisions[5]["override_decision"]
+        filtered = await council.query_decisions(
+            decision=verdict,
+            ethical_compliance=decisions[5]["ethical_compliance"],
+            min_consensus=decisions[5]["consensus_strength"],
+            start=decisions[5]["timestamp"],
+            include_details=True
+        )
+        assert decisions[5]["decision_id"] in [d["decision_id"] for d in filtered["decisions"]]
+        assert all(d["details"]["override_decision"] == verdict for d in filtered["decisions"])
+        assert (await council.query_decisions(end=decisions[0]["timestamp"]))["decisions"] == []
+
+        for bad in ({"limit": 0}, {"cursor": "not-a-cursor"}, {"text": "***"}):
+            with pytest.raises(ValueError):
+                await council.query_decisions(**bad)
+
+        await council.shutdown()
+
+    def test_time_window_slides(self):
+        """Test windowed sums follow the clock and reset when empty"""
+        window = TimeWindow(window_seconds=60, slots=6)
+        for timestamp in (0, 15, 55):
+            window.add({"count": 1, "value": 0.5}, timestamp=timestamp)
+        window.add({"count": 1}, timestamp=5)  # late, still inside the window
+
+        assert window.get_totals(now=59) == {"count": 4, "value": 1.5}
+        assert window.get_totals(now=65) == {"count": 2, "value": 1.0}
+        assert window.get_totals(now=500) == {}
+
+    def test_analytics_trend_forecast(self):
+        """Test the trend forecast tracks consensus volatility and decline"""
+        def decision(consensus):
+            return {
+                "override_decision": "approve",
+                "consensus_strength": consensus,
+                "ethical_compliance": consensus > 0.6,
+                "agent_votes": {"VirtueAgent": {"recommendation": "approve"}}
+            }
+
+        analytics = CouncilAnalytics(min_samples=5)
+        assert [analytics.record(decision(0.9)) for _ in range(5)][-2:] == [None, "stable"]
+        assert analytics.record(decision(0.5)) == "neutral"
+        for consensus in [0.2, 1.0] * 5:
+            forecast = analytics.record(decision(consensus))
+        assert forecast == "volatile"
+
+        analytics.record({"override_decision": "blocked", "consensus_strength": 0.0})
+        stats = analytics.get_stats()
+        assert stats["windows"]["1m"]["decisions"] == 17
+        assert stats["windows"]["1m"]["decision_mix"] == {"approve": 16, "blocked": 1}
+        assert stats["windows"]["1m"]["agent_mix"] == {"VirtueAgent": {"approve": 16}}
+        assert stats["windows"]["1m"]["compliance_rate"] == pytest.approx(10 / 16)
+        assert stats["recent_decisions"] == 16
+
+    @pytest.mark.asyncio
+    async def test_council_analytics(self, temp_db, tmp_path):
+        """Test trend forecasts match between batch and sequential convening"""
+        inputs = [f"Review change {i}: {word}" for i, word in enumerate(
+            ["help users", "exploit attack", "accessible care", "optimize fast", "secure honest"] * 6
+        )]
+        batched = AegisCouncil(db_path=temp_db)
+        sequential = AegisCouncil(db_path=str(tmp_path / "sequential.db"))
+        await batched.initialize()
+        await sequential.initialize()
+
+        batch = await batched.convene_batch(inputs)
+        one_by_one = [await sequential.convene(text) for text in inputs]
+        assert [self.comparable(d) for d in batch] == [self.comparable(d) for d in one_by_one]
+        assert [d["temporal_forecast"] for d in batch] == [d["temporal_forecast"] for d in one_by_one]
+
+        stats = batched.get_analytics()
+        assert stats["trend_forecast"] == batch[-1]["temporal_forecast"]
+        for window in ("1m", "1h", "24h"):
+            assert stats["windows"][window]["decisions"] == len(inputs)
+        mix = stats["windows"]["1h"]["agent_mix"]
+        assert set(mix) == set(batched.agents)
+        assert all(sum(counts.values()) == len(inputs) for counts in mix.values())
+        assert (await batched.get_status())["decisions_made"] == len(inputs)
+
+        # A restarted council replays stored history into its windows and trend
+        await batched.shutdown()
+        restarted = AegisCouncil(db_path=temp_db)
+        await restarted.initialize()
+        assert restarted.get_analytics()["windows"]["24h"]["decisions"] == len(inputs)
+        assert restarted.analytics.forecast() == stats["trend_forecast"]
+
+        await restarted.shutdown()
+        await sequential.shutdown()
 
 class TestQuantumOptimizer:
     """Test Quantum Multi-Objective Optimizer"""
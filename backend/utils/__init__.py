@@ -6,5 +6,9 @@ Common utilities and helper functions
 from .logger import setup_logger
 from .security import SecurityManager
 from .rate_limiter import RateLimiter
+from .compact_cache import CompactCache
+from .fingerprint_index import FingerprintIndex, simhash
+from .rolling_stats import RollingStats, TimeWindow
+from .vector_index import VectorIndex, hashed_embedding
 
-__all__ = ['setup_logger', 'SecurityManager', 'RateLimiter']
\ No newline at end of file
+__all__ = ['setup_logger', 'SecurityManager', 'RateLimiter', 'CompactCache', 'FingerprintIndex', 'simhash', 'RollingStats', 'TimeWindow', 'VectorIndex', 'hashed_embedding']
\ No newline at end of file
@@ -0,0 +1,121 @@
+"""
+Compact Cache for Codette Backend
+Bounded LRU cache with TTL that keeps values as serialized JSON bytes
+"""
+
+import json
+import time
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+class CompactCache:
+    """
+    LRU + TTL cache bounded by entry count and total payload bytes
+
+    Values are JSON-serializable dicts stored as compact bytes so a cached
+    analysis costs one bytes object instead of a tree of Python objects.
+    Top-level fields listed in ``exclude_fields`` are dropped before
+    serialization; callers rebuild them on a hit.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 500,
+        max_bytes: int = 16 * 1024 * 1024,
+        ttl_seconds: Optional[float] = 3600.0,
+        exclude_fields: Iterable[str] = ()
+    ):
+        if max_entries <= 0 or max_bytes <= 0:
+            raise ValueError("Cache limits must be positive")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.exclude_fields = frozenset(exclude_fields)
+
+        # key -> (payload, expires_at); ordered from least to most recently used
+        self._entries: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self.current_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a fresh copy of the cached value, or None on miss/expiry"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        payload, expires_at = entry
+        if time.monotonic() >= expires_at:
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return json.loads(payload)
+
+    def put(self, key: str, value: Dict[str, Any]) -> bool:
+        """Store a value; returns False if it cannot fit in the byte budget"""
+        compact = {k: v for k, v in value.items() if k not in self.exclude_fields}
+        return self.put_serialized(key, json.dumps(compact, separators=(",", ":")).encode())
+
+    def put_serialized(self, key: str, payload: bytes) -> bool:
+        """Store a value the caller already encoded as a JSON object (``exclude_fields`` is not applied)"""
+        if len(payload) > self.max_bytes:
+            logger.debug(f"Skipping cache entry {key[:8]}: {len(payload)} bytes exceeds budget")
+            return False
+
+        if key in self._entries:
+            self._remove(key)
+
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds is not None else float("inf")
+        self._entries[key] = (payload, expires_at)
+        self.current_bytes += len(payload)
+
+        while len(self._entries) > self.max_entries or self.current_bytes > self.max_bytes:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+
+        return True
+
+    def __contains__(self, key: str) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and time.monotonic() < entry[1]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        """Drop all entries (counters are kept)"""
+        self._entries.clear()
+        self.current_bytes = 0
+
+    def _remove(self, key: str):
+        payload, _ = self._entries.pop(key)
+        self.current_bytes -= len(payload)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache occupancy and hit/miss/eviction counters"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations
+        }
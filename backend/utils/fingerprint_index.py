@@ -0,0 +1,150 @@
+"""
+Fingerprint Index for Codette Backend
+Bounded SimHash index with LSH banding for near-duplicate text lookup
+"""
+
+import re
+import hashlib
+import logging
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+FINGERPRINT_BITS = 64
+
+_DIGITS = re.compile(r"\d+")
+
+# Odd 64-bit constant used to mix adjacent token hashes into bigram features
+_BIGRAM_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+@lru_cache(maxsize=65536)
+def _token_hash(token: str) -> int:
+    """Stable 64-bit hash of a token"""
+    return int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), "little")
+
+def simhash(text: str) -> int:
+    """
+    64-bit SimHash of a text
+
+    Case, whitespace and digit runs are normalized away, so inputs that
+    differ only in spacing, timestamps or counters share a fingerprint.
+    Whitespace-delimited token unigrams and bigrams are the features,
+    weighted by occurrence.
+    """
+    tokens = _DIGITS.sub("0", text.lower()).split()
+    if not tokens:
+        return 0
+
+    unigrams = np.fromiter(map(_token_hash, tokens), dtype=np.uint64, count=len(tokens))
+    # Order-sensitive mix of neighbouring hashes (uint64 arithmetic wraps)
+    bigrams = unigrams[:-1] * _BIGRAM_MULTIPLIER ^ ((unigrams[1:] << np.uint64(17)) | (unigrams[1:] >> np.uint64(47)))
+    hashes = np.concatenate([unigrams, bigrams])
+
+    bits = np.unpackbits(hashes.view(np.uint8), bitorder="little").reshape(-1, FINGERPRINT_BITS)
+    votes = 2 * bits.sum(axis=0, dtype=np.int64) - len(hashes)
+    return int(np.packbits(votes > 0, bitorder="little").view(np.uint64)[0])
+
+class FingerprintIndex:
+    """
+    LRU-bounded near-duplicate index over SimHash fingerprints
+
+    Fingerprints are split into bands; two fingerprints become candidates
+    when any band matches exactly. With ``bands = max_distance + 1`` every
+    pair within ``max_distance`` differing bits is guaranteed to share a band
+    (pigeonhole), so lookups are exact for the configured threshold while
+    touching only a handful of buckets. Each entry carries a small payload
+    the caller wants back on a match.
+    """
+
+    def __init__(self, threshold: float = 0.95, max_entries: int = 10000, max_bands: int = 16):
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError("Similarity threshold must be in (0, 1]")
+        if max_entries <= 0:
+            raise ValueError("Index size must be positive")
+
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.max_distance = int((1.0 - threshold) * FINGERPRINT_BITS + 1e-9)
+        # Beyond max_bands the guarantee degrades to a best-effort LSH lookup
+        self.bands = min(self.max_distance + 1, max_bands)
+        self._band_edges = np.linspace(0, FINGERPRINT_BITS, self.bands + 1).astype(int).tolist()
+
+        # key -> (fingerprint, payload); ordered from least to most recently added
+        self._entries: "OrderedDict[str, Tuple[int, Any]]" = OrderedDict()
+        self._buckets: List[Dict[int, Set[str]]] = [{} for _ in range(self.bands)]
+
+        self.lookups = 0
+        self.matches = 0
+        self.candidates_checked = 0
+        self.evictions = 0
+
+    def _band_keys(self, fingerprint: int) -> List[int]:
+        return [
+            (fingerprint >> start) & ((1 << (end - start)) - 1)
+            for start, end in zip(self._band_edges, self._band_edges[1:])
+        ]
+
+    def query(self, fingerprint: int) -> Optional[Tuple[str, float, Any]]:
+        """Return (key, similarity, payload) of the closest entry within the threshold"""
+        self.lookups += 1
+        candidates: Set[str] = set()
+        for band, band_key in enumerate(self._band_keys(fingerprint)):
+            candidates.update(self._buckets[band].get(band_key, ()))
+        self.candidates_checked += len(candidates)
+
+        best_key, best_distance = None, self.max_distance + 1
+        for key in candidates:
+            distance = (self._entries[key][0] ^ fingerprint).bit_count()
+            if distance < best_distance:
+                best_key, best_distance = key, distance
+
+        if best_key is None:
+            return None
+
+        self.matches += 1
+        return best_key, 1.0 - best_distance / FINGERPRINT_BITS, self._entries[best_key][1]
+
+    def add(self, key: str, fingerprint: int, payload: Any = None):
+        """Index a fingerprint, evicting the oldest entries beyond ``max_entries``"""
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = (fingerprint, payload)
+        for band, band_key in enumerate(self._band_keys(fingerprint)):
+            self._buckets[band].setdefault(band_key, set()).add(key)
+
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _remove(self, key: str):
+        fingerprint, _ = self._entries.pop(key)
+        for band, band_key in enumerate(self._band_keys(fingerprint)):
+            bucket = self._buckets[band][band_key]
+            bucket.discard(key)
+            if not bucket:
+                del self._buckets[band][band_key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index occupancy and match counters"""
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "threshold": self.threshold,
+            "bands": self.bands,
+            "lookups": self.lookups,
+            "matches": self.matches,
+            "match_ratio": self.matches / self.lookups if self.lookups else 0.0,
+            "avg_candidates": self.candidates_checked / self.lookups if self.lookups else 0.0,
+            "evictions": self.evictions
+        }
@@ -0,0 +1,204 @@
+"""
+Rolling Statistics for Codette Backend
+Fixed-size ring buffer with running aggregates for O(1) stats endpoints
+"""
+
+import math
+import time
+import logging
+from collections import Counter, deque
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+class RollingStats:
+    """
+    Ring buffer of records with aggregates maintained on insert
+
+    The windowed count, sum and per-category counters are adjusted as
+    records enter and leave the buffer; an EWMA and fixed-width time
+    buckets (per minute by default) track recent trends. Reading the
+    statistics never walks the buffer. The running sum is re-synchronised
+    once per buffer turnover to cancel floating-point drift.
+    """
+
+    def __init__(
+        self,
+        maxlen: int = 1000,
+        value_of: Callable[[Any], float] = float,
+        category_of: Optional[Callable[[Any], Optional[str]]] = None,
+        ewma_alpha: float = 0.1,
+        bucket_seconds: int = 60,
+        max_buckets: int = 60
+    ):
+        if maxlen <= 0 or bucket_seconds <= 0 or max_buckets <= 0:
+            raise ValueError("Rolling window sizes must be positive")
+        if not 0.0 < ewma_alpha <= 1.0:
+            raise ValueError("EWMA alpha must be in (0, 1]")
+
+        self.maxlen = maxlen
+        self.value_of = value_of
+        self.category_of = category_of
+        self.ewma_alpha = ewma_alpha
+        self.bucket_seconds = bucket_seconds
+        self.max_buckets = max_buckets
+
+        self.items: Deque[Any] = deque(maxlen=maxlen)
+        # (value, category) captured at insert so evictions never re-read records
+        self._entries: Deque[Tuple[float, Optional[str]]] = deque(maxlen=maxlen)
+
+        self.total = 0.0
+        self.categories: Counter = Counter()
+        self.ewma: Optional[float] = None
+        self.lifetime_count = 0
+        self._evictions_since_resync = 0
+
+        # [bucket_start, count, total, categories], oldest first
+        self.buckets: Deque[List[Any]] = deque(maxlen=max_buckets)
+
+    def append(self, item: Any, timestamp: Optional[float] = None):
+        """Add a record; ``timestamp`` is epoch seconds and defaults to now"""
+        value = float(self.value_of(item))
+        category = self.category_of(item) if self.category_of else None
+
+        if len(self._entries) == self.maxlen:
+            old_value, old_category = self._entries[0]
+            self.total -= old_value
+            if old_category is not None:
+                self.categories[old_category] -= 1
+                if not self.categories[old_category]:
+                    del self.categories[old_category]
+            self._evictions_since_resync += 1
+
+        self.items.append(item)
+        self._entries.append((value, category))
+        self.total += value
+        if category is not None:
+            self.categories[category] += 1
+
+        self.ewma = value if self.ewma is None else self.ewma + self.ewma_alpha * (value - self.ewma)
+        self.lifetime_count += 1
+        self._add_to_bucket(value, category, time.time() if timestamp is None else timestamp)
+
+        if self._evictions_since_resync >= self.maxlen:
+            self.total = math.fsum(value for value, _ in self._entries)
+            self._evictions_since_resync = 0
+
+    def _add_to_bucket(self, value: float, category: Optional[str], timestamp: float):
+        start = int(timestamp // self.bucket_seconds) * self.bucket_seconds
+        if self.buckets and self.buckets[-1][0] == start:
+            bucket = self.buckets[-1]
+        elif self.buckets and start < self.buckets[-1][0]:
+            # Late record: fold into its bucket if still retained
+            bucket = next((b for b in self.buckets if b[0] == start), None)
+            if bucket is None:
+                return
+        else:
+            bucket = [start, 0, 0.0, Counter()]
+            self.buckets.append(bucket)
+
+        bucket[1] += 1
+        bucket[2] += value
+        if category is not None:
+            bucket[3][category] += 1
+
+    @property
+    def mean(self) -> float:
+        return self.total / len(self._entries) if self._entries else 0.0
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.items)
+
+    def __getitem__(self, index: int) -> Any:
+        return self.items[index]
+
+    def get_buckets(self, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Per-interval aggregates within the retention horizon, oldest first"""
+        now = time.time() if now is None else now
+        horizon = now - self.bucket_seconds * self.max_buckets
+        return [
+            {
+                "start": datetime.fromtimestamp(start, tz=timezone.utc).isoformat(),
+                "count": count,
+                "mean": total / count if count else 0.0,
+                "categories": dict(categories)
+            }
+            for start, count, total, categories in self.buckets
+            if start + self.bucket_seconds > horizon
+        ]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get windowed and lifetime aggregates"""
+        return {
+            "count": len(self._entries),
+            "lifetime_count": self.lifetime_count,
+            "mean": self.mean,
+            "ewma": self.ewma if self.ewma is not None else 0.0,
+            "categories": dict(self.categories),
+            "buckets": self.get_buckets()
+        }
+
+class TimeWindow:
+    """
+    Sliding time window of summed fields with O(1) reads
+
+    Records land in one of ``slots`` fixed-width time slots. Window totals
+    are adjusted as records arrive and as whole slots age out, so a read
+    never walks the records and the window edge is accurate to one slot
+    width. Totals reset exactly whenever the window empties, bounding
+    floating-point drift.
+    """
+
+    def __init__(self, window_seconds: float, slots: int = 60):
+        if window_seconds <= 0 or slots <= 0:
+            raise ValueError("Window length and slot count must be positive")
+
+        self.window_seconds = window_seconds
+        self.slots = slots
+        self.slot_seconds = window_seconds / slots
+
+        # (slot number, field sums), oldest first
+        self._slots: Deque[Tuple[int, Counter]] = deque()
+        self.totals: Counter = Counter()
+
+    def add(self, fields: Dict[str, float], timestamp: Optional[float] = None):
+        """Add a record's fields; ``timestamp`` is epoch seconds and defaults to now"""
+        slot = int((time.time() if timestamp is None else timestamp) // self.slot_seconds)
+        self._expire(slot)
+
+        if self._slots and self._slots[-1][0] == slot:
+            sums = self._slots[-1][1]
+        elif self._slots and slot < self._slots[-1][0]:
+            # Late record: fold into its slot if still inside the window
+            if slot <= self._slots[-1][0] - self.slots:
+                return
+            position = len(self._slots)
+            while position and self._slots[position - 1][0] > slot:
+                position -= 1
+            if position and self._slots[position - 1][0] == slot:
+                sums = self._slots[position - 1][1]
+            else:
+                sums = Counter()
+                self._slots.insert(position, (slot, sums))
+        else:
+            sums = Counter()
+            self._slots.append((slot, sums))
+
+        sums.update(fields)
+        self.totals.update(fields)
+
+    def _expire(self, current_slot: int):
+        oldest = current_slot - self.slots + 1
+        while self._slots and self._slots[0][0] < oldest:
+            self.totals.subtract(self._slots.popleft()[1])
+        if not self._slots:
+            self.totals.clear()
+
+    def get_totals(self, now: Optional[float] = None) -> Dict[str, float]:
+        """Field sums over the window ending at ``now``"""
+        self._expire(int((time.time() if now is None else now) // self.slot_seconds))
+        return {field: total for field, total in self.totals.items() if total}
@@ -0,0 +1,331 @@
+"""
+Vector Index for Codette Backend
+Contiguous float32 vector store with top-k cosine search, an optional
+IVF coarse quantizer and memory-mappable persistence
+"""
+
+import os
+import re
+import json
+import uuid
+import hashlib
+import logging
+from array import array
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_TOKENS = re.compile(r"\w+")
+
+# Rows scored per matmul, bounding the temporary score matrix on large stores
+SEARCH_CHUNK_ROWS = 65536
+
+@lru_cache(maxsize=65536)
+def _hashed_feature(token: str, dim: int) -> Tuple[int, float]:
+    """Bucket and sign of a token under feature hashing"""
+    value = int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), "little")
+    return value % dim, 1.0 if value >> 63 else -1.0
+
+def hashed_embedding(text: str, dim: int) -> np.ndarray:
+    """
+    Unit-length signed bag-of-words projection of a text
+
+    Lower-cased word tokens are hashed into ``dim`` buckets with a hashed
+    sign, so texts sharing words point the same way without any fitted
+    vocabulary. Texts without words map to the zero vector.
+    """
+    vector = np.zeros(dim, dtype=np.float32)
+    tokens = _TOKENS.findall(text.lower())
+    if tokens:
+        buckets, signs = zip(*(_hashed_feature(token, dim) for token in tokens))
+        np.add.at(vector, list(buckets), signs)
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+    return vector
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Column indices of the ``k`` highest scores per row, best first"""
+    if scores.shape[1] > k:
+        part = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    else:
+        part = np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+    order = np.argsort(-np.take_along_axis(scores, part, axis=1), axis=1, kind="stable")
+    return np.take_along_axis(part, order, axis=1)
+
+class VectorIndex:
+    """
+    Dense vectors in one contiguous float32 matrix with an id map
+
+    Rows are kept packed: removal moves the last row into the hole. Search
+    scores rows by dot product (cosine for unit vectors) in chunked batched
+    matmuls. With ``ivf_lists`` set, a spherical k-means coarse quantizer is
+    trained once the index holds ``ivf_min_vectors`` rows; each list keeps the
+    positions of its rows (updated in O(1) as rows move) and searches score
+    only the lists of the ``ivf_probes`` nearest centroids.
+
+    ``save`` writes the matrix as a ``.npy`` file next to a JSON manifest
+    holding the id map; ``load`` memory-maps it read-only, so searches can
+    start without reading the file in, and the first write copies it into
+    a growable buffer.
+    """
+
+    def __init__(
+        self,
+        dim: int,
+        ivf_lists: int = 0,
+        ivf_min_vectors: int = 100000,
+        ivf_probes: int = 8,
+        initial_capacity: int = 1024
+    ):
+        if dim <= 0 or initial_capacity <= 0:
+            raise ValueError("Vector dimension and capacity must be positive")
+        if ivf_lists < 0 or ivf_probes <= 0:
+            raise ValueError("IVF list and probe counts must be non-negative and positive")
+
+        self.dim = dim
+        self.ivf_lists = ivf_lists
+        self.ivf_min_vectors = max(ivf_min_vectors, ivf_lists)
+        self.ivf_probes = ivf_probes
+        self.initial_capacity = initial_capacity
+
+        self._matrix = np.zeros((initial_capacity, dim), dtype=np.float32)
+        self.ids: List[str] = []
+        self.positions: Dict[str, int] = {}
+        self.centroids: Optional[np.ndarray] = None
+        # Inverted lists of row positions, plus each row's list and slot in it
+        self._lists: List[array] = []
+        self._list_of = array("i")
+        self._slot_of = array("i")
+        # Rows are a read-only memory map until the first write
+        self._mapped = False
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self.positions
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """View of the stored rows in id-map order"""
+        return self._matrix[:len(self.ids)]
+
+    def add(self, item_id: str, vector: np.ndarray):
+        """Insert or replace the vector stored under ``item_id``"""
+        vector = np.asarray(vector, dtype=np.float32)
+        if vector.shape != (self.dim,):
+            raise ValueError(f"Expected a vector of shape ({self.dim},), got {vector.shape}")
+
+        position = self.positions.get(item_id)
+        self._ensure_writable(len(self.ids) + (position is None))
+        if position is None:
+            position = len(self.ids)
+            self.ids.append(item_id)
+            self.positions[item_id] = position
+            if self.centroids is not None:
+                self._list_of.append(0)
+                self._slot_of.append(0)
+        elif self.centroids is not None:
+            self._unlist(position)
+        self._matrix[position] = vector
+        if self.centroids is not None:
+            self._enlist(position, int(np.argmax(self.centroids @ vector)))
+
+    def remove(self, item_id: str) -> bool:
+        """Drop ``item_id``; returns False if it was not indexed"""
+        position = self.positions.pop(item_id, None)
+        if position is None:
+            return False
+        self._ensure_writable(len(self.ids))
+
+        last = len(self.ids) - 1
+        if self.centroids is not None:
+            self._unlist(position)
+        if position != last:
+            moved = self.ids[last]
+            self._matrix[position] = self._matrix[last]
+            self.ids[position] = moved
+            self.positions[moved] = position
+            if self.centroids is not None:
+                # The moved row keeps its list slot under its new position
+                list_id, slot = self._list_of[last], self._slot_of[last]
+                self._lists[list_id][slot] = position
+                self._list_of[position], self._slot_of[position] = list_id, slot
+        self.ids.pop()
+        if self.centroids is not None:
+            self._list_of.pop()
+            self._slot_of.pop()
+        return True
+
+    def _enlist(self, position: int, list_id: int):
+        members = self._lists[list_id]
+        self._list_of[position] = list_id
+        self._slot_of[position] = len(members)
+        members.append(position)
+
+    def _unlist(self, position: int):
+        members = self._lists[self._list_of[position]]
+        slot = self._slot_of[position]
+        tail = members.pop()
+        if slot < len(members):
+            members[slot] = tail
+            self._slot_of[tail] = slot
+
+    def _ensure_writable(self, size: int):
+        if not self._mapped and size <= len(self._matrix):
+            return
+        count = len(self.ids)
+        capacity = max(self.initial_capacity, size, 2 * len(self._matrix) if size > len(self._matrix) else 0)
+        matrix = np.zeros((capacity, self.dim), dtype=np.float32)
+        matrix[:count] = self._matrix[:count]
+        self._matrix = matrix
+        self._mapped = False
+
+    def search(self, query: np.ndarray, k: int) -> List[Tuple[str, float]]:
+        """Top-``k`` (id, score) pairs for one query vector, best first"""
+        return self.search_batch(np.asarray(query, dtype=np.float32)[None, :], k)[0]
+
+    def search_batch(self, queries: np.ndarray, k: int) -> List[List[Tuple[str, float]]]:
+        """Top-``k`` (id, score) pairs for each row of ``queries``"""
+        queries = np.asarray(queries, dtype=np.float32).reshape(-1, self.dim)
+        count = len(self.ids)
+        if count == 0 or k <= 0:
+            return [[] for _ in range(len(queries))]
+
+        if self.ivf_lists and self.centroids is None and count >= self.ivf_min_vectors:
+            self.train_quantizer()
+        if self.centroids is not None:
+            return [self._search_lists(query, k) for query in queries]
+
+        # Exact search: running top-k merged across row chunks
+        best_rows = np.empty((len(queries), 0), dtype=np.int64)
+        best_scores = np.empty((len(queries), 0), dtype=np.float32)
+        for start in range(0, count, SEARCH_CHUNK_ROWS):
+            scores = queries @ self._matrix[start:min(start + SEARCH_CHUNK_ROWS, count)].T
+            top = _top_k(scores, k)
+            best_rows = np.concatenate([best_rows, top + start], axis=1)
+            best_scores = np.concatenate([best_scores, np.take_along_axis(scores, top, axis=1)], axis=1)
+            keep = _top_k(best_scores, k)
+            best_rows = np.take_along_axis(best_rows, keep, axis=1)
+            best_scores = np.take_along_axis(best_scores, keep, axis=1)
+
+        return [
+            [(self.ids[row], float(score)) for row, score in zip(rows, scores)]
+            for rows, scores in zip(best_rows, best_scores)
+        ]
+
+    def _search_lists(self, query: np.ndarray, k: int) -> List[Tuple[str, float]]:
+        probes = _top_k((self.centroids @ query)[None, :], self.ivf_probes)[0]
+        rows = np.concatenate([np.array(self._lists[list_id], dtype=np.int64) for list_id in probes])
+        if not len(rows):
+            return []
+        scores = self._matrix[rows] @ query
+        top = _top_k(scores[None, :], k)[0]
+        return [(self.ids[rows[i]], float(scores[i])) for i in top]
+
+    def train_quantizer(self, iterations: int = 10, seed: int = 0):
+        """Fit ``ivf_lists`` centroids on a sample and assign every row to one"""
+        count = len(self.ids)
+        if not self.ivf_lists or count < self.ivf_lists:
+            return
+        rng = np.random.default_rng(seed)
+        sample = self._matrix[rng.choice(count, min(count, self.ivf_lists * 64), replace=False)]
+
+        centroids = sample[rng.choice(len(sample), self.ivf_lists, replace=False)].copy()
+        for _ in range(iterations):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            norms = np.linalg.norm(sums, axis=1)
+            empty = norms == 0
+            # Reseed empty lists from random sample rows
+            sums[empty] = sample[rng.choice(len(sample), int(empty.sum()))]
+            norms[empty] = np.linalg.norm(sums[empty], axis=1)
+            centroids = sums / np.maximum(norms, 1e-12)[:, None]
+
+        self.centroids = centroids.astype(np.float32)
+        labels = np.concatenate([
+            np.argmax(self._matrix[start:min(start + SEARCH_CHUNK_ROWS, count)] @ self.centroids.T, axis=1)
+            for start in range(0, count, SEARCH_CHUNK_ROWS)
+        ]).astype(np.int32)
+        order = np.argsort(labels, kind="stable").astype(np.int32)
+        bounds = np.searchsorted(labels[order], np.arange(self.ivf_lists + 1))
+        slots = np.empty(count, dtype=np.int32)
+        self._lists = []
+        for list_id in range(self.ivf_lists):
+            members = order[bounds[list_id]:bounds[list_id + 1]]
+            slots[members] = np.arange(len(members), dtype=np.int32)
+            self._lists.append(array("i", members.tobytes()))
+        self._list_of = array("i", labels.tobytes())
+        self._slot_of = array("i", slots.tobytes())
+        logger.info(f"🧭 Trained {self.ivf_lists}-list vector quantizer over {count} vectors")
+
+    def save(self, manifest_path: str):
+        """
+        Write the rows to a fresh ``.npy`` file, then atomically replace the
+        manifest that names it; the file it superseded is removed afterwards.
+        """
+        directory = os.path.dirname(manifest_path) or "."
+        base = os.path.splitext(os.path.basename(manifest_path))[0]
+        matrix_name = f"{base}.{uuid.uuid4().hex[:12]}.npy"
+
+        previous = None
+        if os.path.exists(manifest_path):
+            try:
+                with open(manifest_path) as handle:
+                    previous = json.load(handle).get("matrix")
+            except (OSError, ValueError):
+                pass
+
+        with open(os.path.join(directory, matrix_name), "wb") as handle:
+            np.save(handle, np.ascontiguousarray(self.vectors))
+        temp_path = f"{manifest_path}.tmp"
+        with open(temp_path, "w") as handle:
+            json.dump({"dim": self.dim, "matrix": matrix_name, "ids": self.ids}, handle)
+        os.replace(temp_path, manifest_path)
+
+        if previous and previous != matrix_name:
+            try:
+                os.remove(os.path.join(directory, previous))
+            except OSError:
+                pass
+
+    @classmethod
+    def load(cls, manifest_path: str, **options) -> Optional["VectorIndex"]:
+        """Memory-map an index written by ``save``; None if missing or unreadable"""
+        if not os.path.exists(manifest_path):
+            return None
+        try:
+            with open(manifest_path) as handle:
+                manifest = json.load(handle)
+            matrix = np.load(
+                os.path.join(os.path.dirname(manifest_path) or ".", manifest["matrix"]), mmap_mode="r"
+            )
+            ids = manifest["ids"]
+            if matrix.dtype != np.float32 or matrix.shape != (len(ids), manifest["dim"]):
+                raise ValueError(f"matrix shape {matrix.shape} does not match {len(ids)} ids")
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring vector index {manifest_path}: {e}")
+            return None
+
+        index = cls(manifest["dim"], **options)
+        index._matrix = matrix
+        index.ids = list(ids)
+        index.positions = {item_id: position for position, item_id in enumerate(index.ids)}
+        index._mapped = True
+        return index
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get size and quantizer statistics"""
+        return {
+            "vectors": len(self.ids),
+            "dim": self.dim,
+            "bytes": len(self.ids) * self.dim * 4,
+            "memory_mapped": self._mapped,
+            "ivf_lists": len(self.centroids) if self.centroids is not None else 0,
+            "ivf_probes": self.ivf_probes
+        }